@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Benchmark: file size and logging throughput of the binary format, compared to the text and JSON-lines formats.
+Half of the messages repeat a few templates, the other half are unique.
+
+usage: python benchmarks/binary_bench.py [nb_messages]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gamuLogger import Levels, Logger, Target  # pylint: disable=wrong-import-position
+from gamuLogger.module import Module  # pylint: disable=wrong-import-position
+
+CALLER_INFO = (os.path.abspath(__file__), "<module>") # skip the stack inspection
+TEMPLATES = ["cache miss", "request served", "connection reused", "retrying the operation"]
+
+
+def bench(path : str, output_format : str, nb_messages : int) -> float:
+    """
+    Return the time per log, in microseconds.
+    """
+    Logger.reset()
+    Logger.remove_target("stdout")
+    target = Target.from_binary_file(path) if output_format == "binary" else Target.from_file(path)
+    Logger.add_target(target, Levels.INFO, format=None if output_format == "binary" else output_format)
+    start = time.perf_counter()
+    for i in range(nb_messages):
+        Logger.info(TEMPLATES[i % 4] if i % 2 else f"order {i} placed for customer {i * 7 % 1000}", CALLER_INFO)
+    if hasattr(target.target, "close"):
+        target.target.close()
+    return (time.perf_counter() - start) / nb_messages * 1e6
+
+
+def main():
+    nb_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    Module.new("shop.orders", *CALLER_INFO)
+
+    with tempfile.TemporaryDirectory() as folder:
+        text_size = 0
+        for output_format in ("text", "jsonl", "binary"):
+            path = os.path.join(folder, f"logs.{output_format}")
+            duration = bench(path, output_format, nb_messages)
+            size = os.path.getsize(path)
+            text_size = text_size or size
+            print(f"{output_format:<7}: {duration:6.2f} us/log, {size / nb_messages:6.1f} bytes/log ({size / text_size:4.0%} of text)")
+
+
+if __name__ == "__main__":
+    main()
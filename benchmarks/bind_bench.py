@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Benchmark: cost of creating a bound logger or a log context per request, and of logging with it,
+compared to pasting the context in each message or passing it as fields.
+
+usage: python benchmarks/bind_bench.py [nb_requests]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gamuLogger import Levels, Logger, log_context  # pylint: disable=wrong-import-position
+
+CALLER_INFO = (os.path.abspath(__file__), "<module>") # skip the stack inspection
+LOGS_PER_REQUEST = 5
+
+
+def per_log(function, nb_requests : int) -> float:
+    """
+    Return the time per request, in microseconds.
+    """
+    start = time.perf_counter()
+    for i in range(nb_requests):
+        function(i)
+    return (time.perf_counter() - start) / nb_requests * 1e6
+
+
+def pasted(i : int):
+    for _ in range(LOGS_PER_REQUEST):
+        Logger.info(f"request_id={i} tenant=acme handled", CALLER_INFO)
+
+
+def as_fields(i : int):
+    for _ in range(LOGS_PER_REQUEST):
+        Logger.info("handled", CALLER_INFO, request_id=i, tenant="acme")
+
+
+def bound(i : int):
+    log = Logger.bind(request_id=i, tenant="acme")
+    for _ in range(LOGS_PER_REQUEST):
+        log.info("handled", CALLER_INFO)
+
+
+def in_context(i : int):
+    with log_context(request_id=i, tenant="acme"):
+        for _ in range(LOGS_PER_REQUEST):
+            Logger.info("handled", CALLER_INFO)
+
+
+def main():
+    nb_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    Logger.reset()
+    Logger.remove_target("stdout")
+    for output_format in ("text", "jsonl"):
+        Logger.add_target(lambda string: None, Levels.INFO, format=output_format) # pylint: disable=unnecessary-lambda
+        for name, function in (("pasted", pasted), ("fields", as_fields), ("bound", bound), ("context", in_context)):
+            print(f"{output_format:<5} {name:<7}: {per_log(function, nb_requests):6.2f} us/request ({LOGS_PER_REQUEST} logs)")
+        Logger.reset()
+        Logger.remove_target("stdout")
+
+    start = time.perf_counter()
+    for i in range(nb_requests):
+        Logger.bind(request_id=i, tenant="acme")
+    print(f"bind alone    : {(time.perf_counter() - start) / nb_requests * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Benchmark: logging the same failure repeatedly, with `Logger.exception` (deduplicated tracebacks)
+compared to `Logger.error(traceback.format_exc())`.
+
+usage: python benchmarks/exception_bench.py [nb_failures]
+"""
+
+import os
+import sys
+import time
+import traceback
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gamuLogger import Levels, Logger  # pylint: disable=wrong-import-position
+
+CALLER_INFO = (os.path.abspath(__file__), "<module>") # skip the stack inspection
+
+
+def parse(value : str) -> int:
+    return int(value)
+
+
+def handle(value : str) -> int:
+    return parse(value) * 2
+
+
+def bench(use_exception : bool, nb_failures : int) -> tuple[float, int]:
+    """
+    Return the time per failure in microseconds, and the number of bytes written.
+    """
+    written = 0
+
+    def count(string : str):
+        nonlocal written
+        written += len(string)
+
+    Logger.reset()
+    Logger.remove_target("stdout")
+    Logger.add_target(count, Levels.INFO)
+    start = time.perf_counter()
+    for i in range(nb_failures):
+        try:
+            handle(f"x{i}")
+        except ValueError:
+            if use_exception:
+                Logger.exception("parsing failed", CALLER_INFO)
+            else:
+                Logger.error(f"parsing failed\n{traceback.format_exc()}", CALLER_INFO)
+    return (time.perf_counter() - start) / nb_failures * 1e6, written
+
+
+def main():
+    nb_failures = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    for name, use_exception in (("format_exc", False), ("exception", True)):
+        duration, written = bench(use_exception, nb_failures)
+        print(f"{name:<10}: {duration:6.2f} us/failure, {written / nb_failures:7.1f} bytes/failure")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Benchmark: cost of logging at TRACE in a flight recorder, compared to a plain file target.
+
+usage: python benchmarks/flight_recorder_bench.py [nb_messages]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gamuLogger import Levels, Logger, Target  # pylint: disable=wrong-import-position
+
+CALLER_INFO = (os.path.abspath(__file__), "<module>") # skip the stack inspection, it would dominate both cases
+
+
+def bench(nb_messages : int) -> float:
+    """
+    Return the time per Logger.trace call, in microseconds.
+    """
+    start = time.perf_counter()
+    for i in range(nb_messages):
+        Logger.trace(f"message {i}", CALLER_INFO)
+    return (time.perf_counter() - start) / nb_messages * 1e6
+
+
+def main():
+    nb_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as folder:
+        Logger.reset()
+        Logger.remove_target("stdout")
+        Logger.add_target(os.path.join(folder, "trace.log"), Levels.TRACE)
+        file_time = bench(nb_messages)
+
+        Logger.reset()
+        Logger.remove_target("stdout")
+        recorder = Target.from_flight_recorder(Target.from_file(os.path.join(folder, "crash.log")), size=10_000, trigger=Levels.FATAL)
+        Logger.add_target(recorder, Levels.TRACE)
+        recorder_time = bench(nb_messages)
+
+    print(f"file target at TRACE      : {file_time:8.2f} us/message")
+    print(f"flight recorder at TRACE  : {recorder_time:8.2f} us/message")
+    print(f"ratio                     : {file_time / recorder_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Benchmark: cost of a log call on a hot path, written, or suppressed by a callsite, module or target limiter.
+The caller info is resolved from the stack, as in normal use.
+
+usage: python benchmarks/limits_bench.py [nb_messages]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gamuLogger import Levels, Logger, Sampler  # pylint: disable=wrong-import-position
+from gamuLogger.module import Module  # pylint: disable=wrong-import-position
+
+
+def bench(nb_messages : int) -> float:
+    """
+    Return the time per log, in microseconds.
+    """
+    start = time.perf_counter()
+    for i in range(nb_messages):
+        Logger.error(f"connection {i} refused")
+    return (time.perf_counter() - start) / nb_messages * 1e6
+
+
+def setup():
+    Logger.reset()
+    Logger.remove_target("stdout")
+    Logger.add_target(lambda string: None, Levels.INFO) # pylint: disable=unnecessary-lambda
+
+
+def main():
+    nb_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    setup()
+    print(f"written              : {bench(nb_messages):6.2f} us/log")
+
+    setup()
+    Logger.set_callsite_limiter(Sampler(0))
+    print(f"callsite (suppressed): {bench(nb_messages):6.2f} us/log")
+
+    setup()
+    Module.new("bench", os.path.abspath(__file__), "bench")
+    Logger.set_module_limiter("bench", Sampler(0))
+    print(f"module (suppressed)  : {bench(nb_messages):6.2f} us/log")
+    Logger.set_module_limiter("bench", None)
+    Module.clear()
+
+    setup()
+    Logger.set_limiter("<lambda>", Sampler(0))
+    print(f"target (suppressed)  : {bench(nb_messages):6.2f} us/log")
+
+
+if __name__ == "__main__":
+    main()
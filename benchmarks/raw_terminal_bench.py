@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Benchmark: cost of writing a log to stdout through sys.stdout, compared to the raw file descriptor target,
+with stdout redirected to /dev/null and to a slow reader (a pipe drained in small chunks).
+
+usage: python benchmarks/raw_terminal_bench.py [nb_messages]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gamuLogger import FlushPolicy, Target, TerminalTarget  # pylint: disable=wrong-import-position
+
+LINE = "[2025-01-01 12:00:00] [  INFO   ] a log line of a typical length, with a few words of context éà\n"
+
+def line_buffered_stdout() -> Target:
+    sys.stdout.reconfigure(line_buffering=True) # type: ignore[attr-defined] # as when stdout is a terminal
+    return Target(TerminalTarget.STDOUT)
+
+
+MODES = {
+    "sys.stdout": lambda: Target(TerminalTarget.STDOUT),
+    "sys.stdout, tty-like": line_buffered_stdout,
+    "raw, line policy": lambda: Target.from_raw_terminal(TerminalTarget.STDOUT, FlushPolicy.LINE),
+    "raw, size policy": lambda: Target.from_raw_terminal(TerminalTarget.STDOUT, FlushPolicy.SIZE),
+}
+
+
+def child(mode : str, nb_messages : int):
+    """
+    Write the logs to stdout, and report the time per log (in microseconds) on stderr.
+    """
+    target = MODES[mode]()
+    start = time.perf_counter()
+    for _ in range(nb_messages):
+        target(LINE)
+    target.target.flush() if hasattr(target.target, "flush") else sys.stdout.flush() # pylint: disable=expression-not-assigned
+    sys.stdout.flush()
+    print(f"{(time.perf_counter() - start) / nb_messages * 1e6:.3f}", file=sys.stderr)
+
+
+def run(mode : str, nb_messages : int, slow_reader : bool) -> float:
+    command = [sys.executable, os.path.abspath(__file__), "--child", mode, str(nb_messages)]
+    if not slow_reader:
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True, text=True)
+        return float(result.stderr)
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=False) as process:
+        assert process.stdout is not None and process.stderr is not None
+        while process.stdout.read1(4096): # type: ignore[attr-defined]
+            time.sleep(0.00005)
+        return float(process.stderr.read())
+
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], int(sys.argv[3]))
+        return
+
+    nb_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for slow_reader in (False, True):
+        print("slow reader" if slow_reader else "/dev/null")
+        for mode in MODES:
+            print(f"    {mode:<22}: {run(mode, nb_messages, slow_reader):8.3f} us/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Benchmark: time and memory allocated per log call, written to a text target, dropped by its filter chain,
+or below the level of every target (no record must be built for it).
+The memory is measured with `tracemalloc`: the peak of the memory allocated during a call, above the memory
+allocated before it (the per-call churn), and the memory still allocated after the calls (the retained memory).
+The caller info is given, so the stack inspection is not measured.
+
+usage: python benchmarks/record_bench.py [nb_messages]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gamuLogger import Levels, Logger  # pylint: disable=wrong-import-position
+from gamuLogger.module import Module  # pylint: disable=wrong-import-position
+
+CALLER_INFO = (os.path.abspath(__file__), "bench")
+
+
+def bench_time(nb_messages : int) -> float:
+    """
+    Return the time per log, in microseconds.
+    """
+    start = time.perf_counter()
+    for i in range(nb_messages):
+        Logger.info("order placed", CALLER_INFO, order_id=i)
+    return (time.perf_counter() - start) / nb_messages * 1e6
+
+
+def bench_memory(nb_messages : int) -> tuple[float, float]:
+    """
+    Return the mean peak of the memory allocated during a log, and the memory retained per log, in bytes.
+    """
+    tracemalloc.start()
+    peaks = 0
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(nb_messages):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        Logger.info("order placed", CALLER_INFO, order_id=i)
+        peaks += tracemalloc.get_traced_memory()[1] - current
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peaks / nb_messages, (after - before) / nb_messages
+
+
+def setup(case : str):
+    Logger.reset()
+    Module.set_default_level(Levels.TRACE)
+    Logger.remove_target("stdout")
+    Logger.add_target(lambda string: None, Levels.WARNING if case == "no target" else Levels.INFO) # pylint: disable=unnecessary-lambda
+    if case == "filtered":
+        Logger.add_filter("<lambda>", Levels.NONE, message="^order")
+
+
+def main():
+    nb_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    for name in ("written", "filtered", "no target"):
+        setup(name)
+        bench_time(1000) # warm up the caches
+        duration = bench_time(nb_messages)
+        peak, retained = bench_memory(nb_messages // 10)
+        print(f"{name:9}: {duration:6.2f} us/log, {peak:7.1f} B allocated/log (peak), {retained:5.1f} B retained/log")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Benchmark: cost of a log call with 12 targets, 2 of them at DEBUG and 10 at WARNING, for each level.
+The caller info is given, so only the dispatch to the targets is measured.
+
+usage: python benchmarks/routing_bench.py [nb_messages]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gamuLogger import Levels, Logger  # pylint: disable=wrong-import-position
+from gamuLogger.module import Module  # pylint: disable=wrong-import-position
+
+CALLER_INFO = (os.path.abspath(__file__), "bench")
+
+
+def bench(method, nb_messages : int) -> float:
+    """
+    Return the time per log, in microseconds.
+    """
+    start = time.perf_counter()
+    for i in range(nb_messages):
+        method(f"connection {i} refused", CALLER_INFO)
+    return (time.perf_counter() - start) / nb_messages * 1e6
+
+
+def setup():
+    Logger.reset()
+    Module.set_default_level(Levels.TRACE)
+    Logger.remove_target("stdout")
+    for i in range(12):
+        def target(string : str): # pylint: disable=unused-argument
+            pass
+        target.__name__ = f"target_{i}"
+        Logger.add_target(target, Levels.DEBUG if i < 2 else Levels.WARNING)
+
+
+def main():
+    nb_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    setup()
+    print(f"trace (no target)   : {bench(Logger.trace, nb_messages):6.2f} us/log")
+    print(f"debug (2 targets)   : {bench(Logger.debug, nb_messages):6.2f} us/log")
+    print(f"warning (12 targets): {bench(Logger.warning, nb_messages):6.2f} us/log")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Benchmark: sustained insert rate of the SQLite target, through the logger and directly, for a few batch sizes.
+
+usage: python benchmarks/sqlite_bench.py [nb_messages]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gamuLogger import Levels, Logger, Target  # pylint: disable=wrong-import-position
+from gamuLogger.database import SqliteWriter  # pylint: disable=wrong-import-position
+
+CALLER_INFO = (os.path.abspath(__file__), "<module>") # skip the stack inspection
+
+
+def bench_logger(path : str, nb_messages : int, batch_size : int) -> float:
+    """
+    Return the number of records logged per second, the last batch included.
+    """
+    Logger.reset()
+    Logger.remove_target("stdout")
+    target = Target.from_sqlite(path, batch_size=batch_size)
+    Logger.add_target(target, Levels.INFO)
+    start = time.perf_counter()
+    for i in range(nb_messages):
+        Logger.info(f"message {i}", CALLER_INFO)
+    target.target.flush()
+    elapsed = time.perf_counter() - start
+    target.target.close()
+    return nb_messages / elapsed
+
+
+def bench_writer(path : str, nb_messages : int, batch_size : int) -> float:
+    """
+    Return the number of rows inserted per second by the writer alone.
+    """
+    writer = SqliteWriter(path, batch_size=batch_size)
+    pid = os.getpid()
+    start = time.perf_counter()
+    for i in range(nb_messages):
+        writer((time.time(), Levels.INFO, "bench", pid, "MainProcess", "MainThread", f"message {i}", {}))
+    writer.flush()
+    elapsed = time.perf_counter() - start
+    writer.close()
+    return nb_messages / elapsed
+
+
+def main():
+    nb_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as folder:
+        for batch_size in (1, 50, 500, 5000):
+            messages = min(nb_messages, 20_000) if batch_size == 1 else nb_messages # one transaction per row is slow
+            writer_rate = bench_writer(os.path.join(folder, f"writer-{batch_size}.db"), messages, batch_size)
+            logger_rate = bench_logger(os.path.join(folder, f"logger-{batch_size}.db"), messages, batch_size)
+            print(f"batch of {batch_size:>5} rows : writer {writer_rate:>10,.0f} rows/s, logger {logger_rate:>10,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
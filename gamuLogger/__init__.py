@@ -15,10 +15,15 @@ GamuLogger - A simple and powerful logging library for Python
 Antoine Buirey 2025
 """
 
-from .gamu_logger import Logger
+from .gamu_logger import Logger, BoundLogger
 from .custom_types import COLORS, Levels
 from .targets import Target, TerminalTarget
 from .argparse_config import config_argparse, config_logger
+from .ring_file import read_ring_file
+from .raw_terminal import FlushPolicy
+from .context import log_context
+from .limits import RateLimiter, Sampler
+from . import query
 from .function import (
     trace,
     debug,
@@ -26,6 +31,7 @@ from .function import (
     warning,
     error,
     fatal,
+    exception,
     message,
     debug_func,
     trace_func,
@@ -0,0 +1,240 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+
+Compact binary log format.
+
+A file starts with the 8 bytes magic `GAMUBIN1`, followed by length-prefixed entries:
+a varint length, then the payload, whose first byte is the kind of the entry:
+- STRING (0): a dictionary entry; the rest of the payload is an UTF-8 string, whose id is the number of strings defined before it
+- RECORD (1): a log record:
+    - the difference with the timestamp of the previous record, in microseconds (zigzag varint)
+    - the level (byte)
+    - flags (byte): bit 0 is set if the message is JSON, bit 1 if the record has structured fields
+    - the pid (varint)
+    - the module, process name, thread name and message, as string references
+    - if the record has fields: their number (varint), then for each field its name and its JSON value, as string references
+
+A string reference is a varint `n`: if `n` is even, it is the id `n >> 1` of a dictionary string;
+if `n` is odd, it is followed by `n >> 1` bytes of an inline UTF-8 string.
+The module, process, thread and field names are always in the dictionary; the messages and field values
+are added to it while it has less than `MAX_STRINGS` strings, then written inline. The dictionary entries always
+precede the first record using them, so a file can be decoded as a stream.
+"""
+
+import atexit
+import os
+from json import dumps, loads
+from typing import BinaryIO, Iterator
+
+from .custom_types import Fields, Levels, LogRow, Message
+from .utils import CustomEncoder
+
+MAGIC = b"GAMUBIN1"
+STRING = 0
+RECORD = 1
+FLAG_JSON = 1
+FLAG_FIELDS = 2
+MAX_STRINGS = 1 << 16
+MAX_INTERNED_LENGTH = 256 # longer messages are unlikely to repeat
+
+
+def encode_varint(value : int, buffer : bytearray):
+    """
+    Append an unsigned integer to a buffer, 7 bits per byte, least significant first.
+    """
+    while value > 0x7f:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def decode_varint(data : bytes | bytearray, offset : int) -> tuple[int, int]:
+    """
+    Read an unsigned integer from `data` at `offset`; return it and the offset after it.
+    Raise IndexError if the data ends before the integer.
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class BinaryEncoder:
+    """
+    Encode log rows in the binary format, keeping the dictionary of the strings already defined.
+    An encoder must be used for a single file, from its beginning.
+    """
+    def __init__(self):
+        self.__strings : dict[str, int] = {}
+        self.__previous_timestamp = 0
+
+    def __reference(self, string : str, buffer : bytearray, definitions : bytearray, intern : bool):
+        """
+        Append a reference to a string to the record buffer, defining the string in the dictionary if needed.
+        """
+        string_id = self.__strings.get(string)
+        if string_id is None and intern:
+            string_id = self.__strings[string] = len(self.__strings)
+            data = string.encode("utf-8")
+            encode_varint(len(data) + 1, definitions)
+            definitions.append(STRING)
+            definitions += data
+        if string_id is not None:
+            encode_varint(string_id << 1, buffer)
+            return
+        data = string.encode("utf-8")
+        encode_varint(len(data) << 1 | 1, buffer)
+        buffer += data
+
+    def __internable(self, string : str) -> bool:
+        return len(self.__strings) < MAX_STRINGS and len(string) <= MAX_INTERNED_LENGTH
+
+    def encode(self, row : LogRow) -> bytes:
+        """
+        Encode a row, preceded by the dictionary entries of its new strings.
+        """
+        timestamp, level, module, pid, process_name, thread_name, msg, fields = row
+        flags = 0
+        if not isinstance(msg, str):
+            msg = dumps(msg, cls=CustomEncoder, ensure_ascii=False)
+            flags |= FLAG_JSON
+        if fields:
+            flags |= FLAG_FIELDS
+        microseconds = round(timestamp * 1_000_000)
+        delta = microseconds - self.__previous_timestamp
+        self.__previous_timestamp = microseconds
+
+        definitions = bytearray()
+        record = bytearray((RECORD,))
+        encode_varint(delta << 1 if delta >= 0 else (-delta << 1) - 1, record) # zigzag
+        record.append(level)
+        record.append(flags)
+        encode_varint(pid, record)
+        self.__reference(module, record, definitions, True)
+        self.__reference(process_name, record, definitions, True)
+        self.__reference(thread_name, record, definitions, True)
+        self.__reference(msg, record, definitions, self.__internable(msg))
+        if fields:
+            encode_varint(len(fields), record)
+            for key, value in fields.items():
+                self.__reference(key, record, definitions, True)
+                value = dumps(value, cls=CustomEncoder, ensure_ascii=False)
+                self.__reference(value, record, definitions, self.__internable(value))
+
+        encode_varint(len(record), definitions)
+        definitions += record
+        return bytes(definitions)
+
+
+class BinaryWriter:
+    """
+    Write the log rows to a file in the binary format.
+    The file is truncated when the writer is created, and kept open; each write is flushed to the file at once.
+    """
+    def __init__(self, path : str):
+        self.path = path
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self.__encoder = BinaryEncoder()
+        self.__file : BinaryIO | None = open(path, "wb") # pylint: disable=consider-using-with
+        self.__file.write(MAGIC)
+        self.__file.flush()
+        atexit.register(self.close)
+
+    def __call__(self, row : LogRow):
+        self.write_many([row])
+
+    def write_many(self, rows : list[LogRow]):
+        """
+        Encode several rows, and write them at once.
+        """
+        if self.__file is None:
+            return
+        self.__file.write(b"".join(self.__encoder.encode(row) for row in rows))
+        self.__file.flush()
+
+    def close(self):
+        """
+        Close the file; the rows written after are ignored.
+        """
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        atexit.unregister(self.close)
+
+    def __str__(self) -> str:
+        return self.path
+
+
+def iter_records(stream : BinaryIO, chunk_size : int = 65536) -> Iterator[LogRow]:
+    """
+    Decode the rows of a binary log stream, reading it by chunks.
+    JSON messages are decoded to Python objects. A truncated last entry (e.g. a file being written) is ignored.
+    """
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a gamuLogger binary log")
+    strings : list[str] = []
+    timestamp = 0
+    data = bytearray()
+    offset = 0
+    while chunk := stream.read(chunk_size):
+        data = data[offset:] + chunk
+        offset = 0
+        while True:
+            try:
+                length, start = decode_varint(data, offset)
+            except IndexError:
+                break
+            end = start + length
+            if end > len(data):
+                break
+            offset = end
+            if data[start] == STRING:
+                strings.append(data[start + 1:end].decode("utf-8"))
+                continue
+            # RECORD
+            delta, position = decode_varint(data, start + 1)
+            timestamp += delta >> 1 if not delta & 1 else -((delta + 1) >> 1)
+            level = Levels(data[position])
+            flags = data[position + 1]
+            pid, position = decode_varint(data, position + 2)
+            values : list[str] = []
+            count = 4
+            while len(values) < count:
+                reference, position = decode_varint(data, position)
+                if reference & 1:
+                    values.append(data[position:position + (reference >> 1)].decode("utf-8"))
+                    position += reference >> 1
+                else:
+                    values.append(strings[reference >> 1])
+                if len(values) == 4 and flags & FLAG_FIELDS:
+                    fields_count, position = decode_varint(data, position)
+                    count += 2 * fields_count
+            module, process_name, thread_name, msg = values[:4]
+            message : Message = loads(msg) if flags & FLAG_JSON else msg
+            fields : Fields = {values[i]: loads(values[i + 1]) for i in range(4, count, 2)}
+            yield (timestamp / 1_000_000, level, module, pid, process_name, thread_name, message, fields)
+
+
+def read_binary_file(path : str) -> list[LogRow]:
+    """
+    Read the rows of a binary log file.
+    """
+    with open(path, "rb") as f:
+        return list(iter_records(f))
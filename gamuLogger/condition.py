@@ -16,7 +16,8 @@ from abc import ABC, abstractmethod
 import re
 from typing import Any, Callable
 
-from .regex import RE_AGE_CONDITION, RE_NB_FILES_CONDITION, RE_SIZE_CONDITION
+from .regex import (RE_AGE_CONDITION, RE_NB_FILES_CONDITION,
+                    RE_SIZE_CONDITION, RE_TOTAL_SIZE_CONDITION)
 from .utils import string2seconds, string2bytes
 
 
@@ -215,6 +216,76 @@ class SizeCondition(Condition):
         """
         return f"{self.__class__.__name__}(operator='{self.__operator}', value='{self.__size_in_bytes}', unit='bytes')"
 
+class TotalSizeCondition(Condition):
+    """
+    A condition that checks if the total size of the log files is greater than a specified value.
+    """
+
+    def __init__(self, operator : str, value : int, unit : str):
+        """
+        Initialize the TotalSizeCondition with an operator, value, and unit.
+
+        Operators allowed : `>`, `>=`, `==`, `!=`
+        Units allowed : `KB`, `MB`, `GB`, `TB`
+        Support plural form of the unit
+        (`KBs`, `MBs`, `GBs`, `TBs`)
+        """
+
+        if operator not in (">", ">=", "==", "!="):
+            raise ValueError(f"Invalid operator: {operator}")
+
+        self.__size_in_bytes = string2bytes(f"{value} {unit}")
+        self.__operator = operator
+
+    @classmethod
+    def from_string(cls, string : str) -> 'TotalSizeCondition':
+        """
+        Create a TotalSizeCondition from a string.
+
+        :param string: The string to parse.
+        :return: An instance of TotalSizeCondition.
+        """
+        match = re.match(RE_TOTAL_SIZE_CONDITION, string)
+        if not match:
+            raise ValueError(f"Invalid total size condition: {string}")
+
+        return cls.from_match(match)
+
+    @classmethod
+    def from_match(cls, match : re.Match[str]) -> 'TotalSizeCondition':
+        """
+        Create a TotalSizeCondition from a regex match object.
+
+        :param match: The regex match object.
+        :return: An instance of TotalSizeCondition.
+        """
+        operator = match.group('operator')
+        value = int(match.group('value'))
+        unit = match.group('unit')
+
+        return cls(operator, value, unit)
+
+    def __call__(self, total_size : int) -> bool:
+        """
+        Evaluate the condition against a given total size.
+
+        :param total_size: The total size to evaluate, in bytes.
+        :return: True if the condition is met, False otherwise.
+        """
+        return self.operators[self.__operator](total_size, self.__size_in_bytes)
+
+    def __str__(self) -> str:
+        """
+        String representation of the condition.
+        """
+        return f"{self.__operator} {self.__size_in_bytes} bytes in total"
+
+    def __repr__(self) -> str:
+        """
+        String representation of the condition.
+        """
+        return f"{self.__class__.__name__}(operator='{self.__operator}', value='{self.__size_in_bytes}', unit='bytes')"
+
 class NbFilesCondition(Condition):
     """
     A condition that checks if the number of files is greater than a specified value.
@@ -291,6 +362,8 @@ def condition_factory(string : str) -> Condition:
     """
     if match := re.match(RE_AGE_CONDITION, string):
         return AgeCondition.from_match(match)
+    if match := re.match(RE_TOTAL_SIZE_CONDITION, string):
+        return TotalSizeCondition.from_match(match)
     if match := re.match(RE_SIZE_CONDITION, string):
         return SizeCondition.from_match(match)
     if match := re.match(RE_NB_FILES_CONDITION, string):
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+
+Diagnostic context: fields (e.g. a request id) added to every record logged within a `log_context` block.
+The context is stored in a `contextvars.ContextVar`, so each asyncio task has its own, inherited from the
+task that created it; use `propagate` to run a function in another thread (e.g. a thread pool) with the current context.
+"""
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, TypeVar
+
+from .custom_types import Fields
+from .jsonl import format_fields as format_json_fields
+from .utils import format_fields
+
+T = TypeVar('T')
+
+
+class RenderedContext:
+    """
+    Context fields (e.g. a request id) attached to several records, rendered once for all of them:
+    - `text`: a prefix for the messages of the text targets, `request_id=abc tenant=acme ` ("" if there are no fields)
+    - `json`: the members of the `context` object of the JSON lines targets, `"request_id":"abc","tenant":"acme"`
+
+    A context is immutable: `merge` and `under` return a new one.
+    """
+    __slots__ = ("fields", "text", "json", "__combined")
+
+    def __init__(self, fields : Fields):
+        self.fields : Fields = dict(fields)
+        self.text = format_fields(self.fields)[1:] + " " if self.fields else ""
+        self.json = format_json_fields(self.fields)[1:-1]
+        self.__combined : tuple[RenderedContext, RenderedContext] | None = None
+
+    def merge(self, fields : Fields) -> 'RenderedContext':
+        """
+        Return a context with the fields of this one and the given ones, which replace the fields of the same name.
+        """
+        return RenderedContext({**self.fields, **fields})
+
+    def under(self, outer : 'RenderedContext') -> 'RenderedContext':
+        """
+        Return the fields of `outer` followed by the fields of this context, which replace the fields of the same name.
+        The result is kept for the last `outer` context, so a bound logger used within the same `log_context` block
+        renders their combination once.
+        """
+        combined = self.__combined
+        if combined is not None and combined[0] is outer:
+            return combined[1]
+        result = outer.merge(self.fields)
+        self.__combined = (outer, result)
+        return result
+
+    def __repr__(self) -> str:
+        return f"RenderedContext({self.fields!r})"
+
+
+LOG_CONTEXT : ContextVar[RenderedContext | None] = ContextVar("gamuLogger_context", default=None)
+
+
+@contextmanager
+def log_context(**fields : Any) -> Iterator[RenderedContext]:
+    """
+    Add fields to the records logged within the block (or the decorated function), in this thread or asyncio task
+    and in the tasks it creates. The blocks can be nested; the inner fields replace the outer fields of the same name.
+    The context is rendered once, when entering the block.
+
+    ```python
+    with log_context(request_id="abc"):
+        Logger.info("order placed") # request_id=abc order placed
+    ```
+    """
+    current = LOG_CONTEXT.get()
+    context = RenderedContext(fields) if current is None else current.merge(fields)
+    token = LOG_CONTEXT.set(context)
+    try:
+        yield context
+    finally:
+        LOG_CONTEXT.reset(token)
+
+
+def get_context() -> Fields:
+    """
+    Return the fields of the current context.
+    """
+    context = LOG_CONTEXT.get()
+    return dict(context.fields) if context is not None else {}
+
+
+def propagate(func : Callable[..., T]) -> Callable[..., T]:
+    """
+    Return a function calling `func` with the current context, wherever it is called;
+    e.g. `executor.submit(propagate(work), item)` for a thread pool.
+    """
+    context = LOG_CONTEXT.get()
+
+    @functools.wraps(func)
+    def wrapper(*args : Any, **kwargs : Any) -> T:
+        token = LOG_CONTEXT.set(context)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            LOG_CONTEXT.reset(token)
+    return wrapper
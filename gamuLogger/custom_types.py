@@ -12,7 +12,7 @@ Utility class for the logger module
 
 import inspect
 from enum import Enum, IntEnum
-from typing import Protocol
+from typing import Any, Protocol
 
 
 class COLORS(Enum):
@@ -168,3 +168,8 @@ type Callerinfo = tuple[str, str]
 type Message = str|SupportsStr
 
 type Stack = list[inspect.FrameInfo]
+
+type Fields = dict[str, Any] # structured key/value fields of a record, kept unrendered
+
+
+type LogRow = tuple[float, Levels, str, int, str, str, Message, Fields] # timestamp, level, module path, pid, process name, thread name, message, fields
@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+from json import dumps
+
+from .custom_types import LogRow
+from .utils import CustomEncoder
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    id          INTEGER PRIMARY KEY,
+    timestamp   REAL NOT NULL,
+    level       INTEGER NOT NULL,
+    module      TEXT NOT NULL,
+    pid         INTEGER NOT NULL,
+    process     TEXT NOT NULL,
+    thread      TEXT NOT NULL,
+    message     TEXT NOT NULL,
+    fields      TEXT
+);
+CREATE INDEX IF NOT EXISTS logs_timestamp ON logs (timestamp);
+CREATE INDEX IF NOT EXISTS logs_level ON logs (level, timestamp);
+CREATE INDEX IF NOT EXISTS logs_module ON logs (module, timestamp);
+"""
+
+INSERT = "INSERT INTO logs (timestamp, level, module, pid, process, thread, message, fields) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+class SqliteWriter:
+    """
+    Store the log records in a SQLite database, in the `logs` table
+    (timestamp, level, module, pid, process, thread, message, fields), indexed on the time, the level and the module.
+    The messages that are not strings are stored as JSON, and so are the structured fields (NULL if there are none).
+
+    The database is in WAL mode, so it can be read while the logs are written.
+    The records are inserted in batches, each in a single transaction: when `batch_size` records are pending,
+    every `flush_interval` seconds (by a background thread), and at exit.
+
+    The writes are not locked: they must be serialized with `lock`
+    (a Target does it, with its own lock), which `flush` and the background flusher acquire.
+    """
+    def __init__(self, path : str, batch_size : int = 500, flush_interval : float = 1.0, lock : 'threading.Lock | None' = None):
+        if batch_size <= 0:
+            raise ValueError("The batch size must be positive")
+        if flush_interval <= 0:
+            raise ValueError("The flush interval must be positive")
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.lock = lock if lock is not None else threading.Lock()
+        self.__pending : list[LogRow] = []
+        self.__closed = threading.Event()
+        self.__flusher : threading.Thread | None = None
+
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None) # transactions are explicit
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL") # durable at each checkpoint, consistent at each commit
+        connection.executescript(SCHEMA)
+        self.__connection : sqlite3.Connection | None = connection
+        atexit.register(self.close)
+
+    def __call__(self, row : LogRow):
+        """
+        Add a record to the pending batch, and insert the batch if it is full.
+        """
+        self.write_many([row])
+
+    def write_many(self, rows : list[LogRow]):
+        """
+        Add several records to the pending batch, and insert the batch if it is full.
+        """
+        self.__pending.extend(rows)
+        if len(self.__pending) >= self.batch_size:
+            self.__insert_pending()
+        elif self.__flusher is None:
+            self.__flusher = threading.Thread(target=self.__flush_periodically, name="gamuLogger-sqlite", daemon=True)
+            self.__flusher.start()
+
+    def flush(self):
+        """
+        Insert the pending records.
+        """
+        with self.lock:
+            self.__insert_pending()
+
+    def close(self):
+        """
+        Insert the pending records, stop the background flusher and close the database.
+        """
+        self.__closed.set()
+        with self.lock:
+            self.__insert_pending()
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+        atexit.unregister(self.close)
+
+    def __flush_periodically(self):
+        while not self.__closed.wait(self.flush_interval):
+            self.flush()
+
+    def __insert_pending(self):
+        """
+        Insert the pending records in a single transaction. The writes must be serialized by the caller.
+        """
+        if not self.__pending or self.__connection is None: # nothing to insert, or closed
+            return
+        rows, self.__pending = self.__pending, []
+        rows = [
+            (*row[:6], row[6] if isinstance(row[6], str) else dumps(row[6], cls=CustomEncoder),
+             dumps(row[7], cls=CustomEncoder, ensure_ascii=False) if row[7] else None)
+            for row in rows
+        ]
+        with self.__connection: # COMMIT, or ROLLBACK on error
+            self.__connection.execute("BEGIN")
+            self.__connection.executemany(INSERT, rows) # the statement is prepared once, and cached by sqlite3
+
+    def __str__(self) -> str:
+        return self.path
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Decode a binary log file written by `Target.from_binary_file`, as text or JSON lines.
+
+usage: python -m gamuLogger.decode [-h] [--format {text,jsonl}] [--show-process-name] [--show-pid] [--show-threads-name] [file]
+
+The file is decoded as a stream (`-` or no file for the standard input), so it can be piped.
+"""
+
+import argparse
+import sys
+from json import dumps
+from typing import BinaryIO, TextIO
+
+from .binary import iter_records
+from .custom_types import LogRow
+from .gamu_logger import PLAIN_TEMPLATES
+from .jsonl import format_record
+from .utils import CustomEncoder, format_fields, get_time, replace_newline
+
+
+def format_text(row : LogRow, show_process_name : bool = False, show_pid : bool = False, show_threads_name : bool = False) -> str:
+    """
+    Render a row in the text format of the file targets.
+    """
+    timestamp, level, module, pid, process_name, thread_name, msg, fields = row
+    result = PLAIN_TEMPLATES["time"].format(get_time(timestamp))
+    indent = 20 + 12
+    if show_process_name:
+        result += PLAIN_TEMPLATES["name"].format(process_name.center(20))
+        indent += 25
+    if show_pid:
+        result += PLAIN_TEMPLATES["pid"].format(f"{pid:^8d}")
+        indent += 12
+    if show_threads_name:
+        result += PLAIN_TEMPLATES["name"].format(thread_name.center(20))
+        indent += 25
+    result += PLAIN_TEMPLATES[level]
+    if module:
+        for name in module.split("."):
+            result += PLAIN_TEMPLATES["module"].format(name.center(15))
+            indent += 20
+    if not isinstance(msg, str):
+        msg = dumps(msg, indent=4, cls=CustomEncoder)
+    return f"{result} {replace_newline(msg, indent)}{format_fields(fields)}\n"
+
+
+def decode(stream : BinaryIO, output : TextIO, output_format : str = "text", #pylint: disable=R0913, R0917
+           show_process_name : bool = False, show_pid : bool = False, show_threads_name : bool = False):
+    """
+    Decode a binary log stream, writing each record to `output` as it is read.
+    """
+    for row in iter_records(stream):
+        if output_format == "jsonl":
+            output.write(format_record(row[1], row[6], row[2], row[0], row[3], row[4], row[5], row[7]))
+        else:
+            output.write(format_text(row, show_process_name, show_pid, show_threads_name))
+
+
+def main(argv : list[str] | None = None):
+    """
+    Entry point of `python -m gamuLogger.decode`.
+    """
+    parser = argparse.ArgumentParser(prog="python -m gamuLogger.decode", description="Decode a gamuLogger binary log file.")
+    parser.add_argument("file", nargs="?", default="-", help="the binary log file, or - for the standard input (default)")
+    parser.add_argument("--format", choices=("text", "jsonl"), default="text", help="the output format (default: text)")
+    parser.add_argument("--show-process-name", action="store_true", help="show the process name (text format)")
+    parser.add_argument("--show-pid", action="store_true", help="show the process id (text format)")
+    parser.add_argument("--show-threads-name", action="store_true", help="show the thread name (text format)")
+    args = parser.parse_args(argv)
+
+    options = (args.format, args.show_process_name, args.show_pid, args.show_threads_name)
+    try:
+        if args.file == "-":
+            decode(sys.stdin.buffer, sys.stdout, *options)
+        else:
+            with open(args.file, "rb") as f:
+                decode(f, sys.stdout, *options)
+    except ValueError as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+    except BrokenPipeError: #pragma: no cover
+        sys.stderr.close() # e.g. piped to head
+
+
+if __name__ == "__main__":
+    main()
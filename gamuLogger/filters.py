@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+
+Filter chains of the targets: an ordered list of rules, compiled into a single predicate evaluated on the log record,
+before it is formatted. The first rule matching a record decides the minimum level it must have;
+a record matching no rule is dropped.
+
+```python
+db_log = Target.get("db.log")
+db_log.add_filter(modules=("db",), level=Levels.DEBUG) # db.* at DEBUG
+db_log.add_filter(level=Levels.INFO)                   # everything else at INFO
+```
+"""
+
+import re
+from typing import Callable, Iterable
+
+from .custom_types import Fields, Levels, Message
+from .module import Module
+from .record import LogRecord
+
+MAX_CACHED_MODULES = 4096 # bound of the caches of module matches, in case the modules are created dynamically
+
+type Predicate = Callable[[LogRecord], bool] # keep the record
+type CustomPredicate = Callable[[Levels, Message, str, Fields], bool] # level, message, complete module name, fields -> keep the record
+
+
+class FilterRule:
+    """
+    A rule of a filter chain: the criteria a record must match (all of them; the ones left empty are not checked),
+    and the minimum level of the matching records (`Levels.NONE` drops them).
+    - `modules`: module prefixes (`db` or `db.*` match `db` and its submodules)
+    - `exclude_modules`: module prefixes the record must not match
+    - `message`: a regular expression searched in the message
+    - `threads`: thread names
+    - `predicate`: a function of the level, the message, the complete module name ("" if none) and the fields
+    """
+    __slots__ = ("level", "modules", "exclude_modules", "message", "threads", "predicate")
+
+    def __init__(self, level : Levels = Levels.TRACE, modules : Iterable[str] = (), exclude_modules : Iterable[str] = (), #pylint: disable=R0913, R0917
+                 message : str|re.Pattern[str]|None = None, threads : Iterable[str] = (), predicate : CustomPredicate|None = None):
+        self.level = level
+        self.modules = tuple(self.__prefix(name) for name in modules)
+        self.exclude_modules = tuple(self.__prefix(name) for name in exclude_modules)
+        self.message = re.compile(message) if isinstance(message, str) else message
+        self.threads = frozenset(threads)
+        self.predicate = predicate
+
+    @staticmethod
+    def __prefix(name : str) -> tuple[str, ...]:
+        if name.endswith(".*"):
+            name = name[:-2]
+        if not name:
+            raise ValueError("A module prefix cannot be empty")
+        return tuple(name.split("."))
+
+    def compile(self) -> Predicate:
+        """
+        Return a predicate telling if a record matches the criteria of the rule; only the criteria that are set are checked.
+        """
+        checks : list[Predicate] = []
+        if self.modules or self.exclude_modules:
+            checks.append(module_matcher(self.modules, self.exclude_modules))
+        if self.message is not None:
+            search = self.message.search
+            checks.append(lambda record: search(record.msg if isinstance(record.msg, str) else str(record.msg)) is not None)
+        if self.threads:
+            threads = self.threads
+            checks.append(lambda record: record.thread_name in threads)
+        if self.predicate is not None:
+            predicate = self.predicate
+            checks.append(lambda record: predicate(record.level, record.msg, record.module.get_complete_name() if record.module is not None else "", record.fields))
+
+        if not checks:
+            return lambda record: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda record: all(check(record) for check in checks)
+
+    def __repr__(self) -> str:
+        return f"FilterRule(level={self.level.name}, modules={self.modules}, exclude_modules={self.exclude_modules}, message={self.message}, threads={set(self.threads)}, predicate={self.predicate})"
+
+
+def module_matcher(include : tuple[tuple[str, ...], ...], exclude : tuple[tuple[str, ...], ...]) -> Predicate:
+    """
+    Return a predicate telling if the module of a record is in one of the `include` prefixes (if any), and in none of the `exclude` ones.
+    The answer is computed once per module, from its path, then looked up.
+    """
+    cache : dict[Module|None, bool] = {}
+
+    def matches(record : LogRecord) -> bool:
+        module = record.module
+        result = cache.get(module)
+        if result is None:
+            path = tuple(module.get_complete_path()) if module is not None else ()
+            result = (not include or any(path[:len(prefix)] == prefix for prefix in include)) \
+                and not any(path[:len(prefix)] == prefix for prefix in exclude)
+            if len(cache) >= MAX_CACHED_MODULES:
+                cache.clear()
+            cache[module] = result
+        return result
+    return matches
+
+
+def compile_filters(rules : Iterable[FilterRule]) -> Predicate:
+    """
+    Compile a filter chain into a single predicate: the first rule matching a record decides if its level is high enough;
+    a record matching no rule is dropped.
+    """
+    compiled = tuple((rule.compile(), rule.level) for rule in rules)
+
+    def accept(record : LogRecord) -> bool:
+        for matches, minimum in compiled:
+            if matches(record):
+                return record.level >= minimum
+        return False
+    return accept
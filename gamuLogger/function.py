@@ -21,12 +21,13 @@ from .custom_types import Message
 
 T = TypeVar('T')
 
-trace : Callable[[Message], None] = Logger.trace
-debug : Callable[[Message], None] = Logger.debug
-info : Callable[[Message], None] = Logger.info
-warning : Callable[[Message], None] = Logger.warning
-error : Callable[[Message], None] = Logger.error
-fatal : Callable[[Message], None] = Logger.fatal
+trace : Callable[..., None] = Logger.trace
+debug : Callable[..., None] = Logger.debug
+info : Callable[..., None] = Logger.info
+warning : Callable[..., None] = Logger.warning
+error : Callable[..., None] = Logger.error
+fatal : Callable[..., None] = Logger.fatal
+exception : Callable[..., None] = Logger.exception
 message : Callable[[Message, COLORS], None] = Logger.message
 
 
@@ -13,19 +13,55 @@ Antoine Buirey 2025
 """
 
 
-import multiprocessing as mp
+import atexit
 import os
+import re
+import sys
 import threading
 from json import dumps
-from typing import Callable
+from types import CodeType
+from typing import Any, Callable, Iterable
 
 from .config import Config
-from .custom_types import COLORS, Callerinfo, Levels, Message
-from .module import Module
-from .targets import Target, TerminalTarget
-from .utils import (CustomEncoder, colorize, get_caller_info,
-                    get_executable_formatted, get_time, replace_newline,
-                    split_long_string)
+from .context import LOG_CONTEXT, RenderedContext
+from .custom_types import COLORS, Callerinfo, Fields, Levels, LogRow, Message
+from .filters import CustomPredicate, Predicate
+from .jsonl import format_record
+from .limits import Collapser, Flusher, Limiter
+from .module import Module, ModuleRegistry
+from .record import LogRecord
+from .targets import FlightRecorder, Target, TargetRegistry, TerminalTarget
+from .tracebacks import ExcInfo, LoggedException, TracebackCache, get_exception
+from .utils import (CustomEncoder, format_fields, get_caller_info,
+                    get_executable_formatted, get_function_name, get_time,
+                    replace_newline, split_long_string)
+
+type Templates = dict[str | Levels, str] # element name (or level) -> format string
+
+
+def build_templates(colored : bool) -> Templates:
+    """
+    Build the format strings of the log elements, with or without ANSI colors.
+    """
+    def paint(color : COLORS, template : str) -> str:
+        return template.replace("{}", f"{color}{{}}{COLORS.RESET}") if colored else template
+
+    templates : Templates = {
+        "start": str(COLORS.RESET) if colored else "",
+        "time": paint(COLORS.BLUE, "[{}]"),
+        "name": paint(COLORS.CYAN, " [ {} ]"),
+        "pid": paint(COLORS.MAGENTA, " [ {} ]"),
+        "module": paint(COLORS.BLUE, " [ {} ]"),
+    }
+    for level in Levels:
+        if level != Levels.NONE:
+            templates[level] = paint(level.color(), " [{}]").format(level) # the level tags are rendered once
+    return templates
+
+COLORED_TEMPLATES = build_templates(True)
+PLAIN_TEMPLATES = build_templates(False)
+SUMMARY = "suppressed {:,} similar messages" # the message of the summaries of the limiters
+REPEATED = "last message repeated {:,} times" # the message of the summaries of the collapsers
 
 
 class Logger:
@@ -34,6 +70,11 @@ class Logger:
     """
 
     __instance : 'Logger|None' = None
+    __targets : TargetRegistry = TargetRegistry.current() # the registries of the default logger
+    __modules : ModuleRegistry = ModuleRegistry.current()
+    __named : dict[str, 'Logger'] = {}
+    __named_lock = threading.Lock()
+    name : str = "" # the name of a named logger, "" for the default one
 
     def __new__(cls):
         if cls.__instance is None:
@@ -45,104 +86,248 @@ class Logger:
         self.config = Config(
             show_process_name = False,
             show_threads_name = False,
-            show_pid = False
+            show_pid = False,
+            traceback_window = 60.0
         )
+        self.__tracebacks = TracebackCache()
+        self.__callsite_limiter : Limiter|None = None
+        self.__callsite_limiters : dict[tuple[CodeType, int], Limiter] = {} # code location -> its copy of the callsite limiter
+        self.__callsite_callers : dict[tuple[CodeType, int], Callerinfo] = {} # code location -> its caller info
+        self.__flusher = Flusher(self.__flush_expired, f"gamuLogger-flusher[{self.name}]" if self.name else "gamuLogger-flusher")
 
         #configuring default target
-        default_target = Target(TerminalTarget.STDOUT)
+        with self.__targets.active():
+            default_target = Target(TerminalTarget.STDOUT)
         default_target["level"] = Levels.INFO
 
 #---------------------------------------- Internal methods ----------------------------------------
 
 
-    def __print(self, level : Levels, msg : Message, caller_info : Callerinfo): #pylint: disable=W0238
-        for target in Target.list():
-            self.__print_in_target(level, msg, caller_info, target)
+    def __print(self, level : Levels, msg : Message, caller_info : Callerinfo, fields : Fields, #pylint: disable=W0238, R0913, R0917
+                context : RenderedContext|None = None, exc_info : ExcInfo = None, suppressed : int = 0):
+        module = self.__modules.get(*caller_info) if self.__modules.exist(*caller_info) else None
+        if level < self.__module_level(module):
+            return
+        routes = self.__targets.routes(level)
+        if not routes: # no target accepts the level: nothing to build
+            return
+        if self.__modules.has_limiters():
+            limiter = self.__modules.get_limiter(module.get_complete_name() if module is not None else "")
+            if limiter is not None:
+                admitted = limiter.admit((level, caller_info, module, context))
+                if admitted is None:
+                    return
+                suppressed += admitted
+        ambient = LOG_CONTEXT.get() # set by log_context
+        if ambient is not None:
+            context = ambient if context is None else context.under(ambient)
+        if suppressed: # by the callsite or module limiter
+            self.__dispatch(LogRecord.acquire(level, SUMMARY.format(suppressed), caller_info, module, {"suppressed": suppressed}, context), routes)
+        exception = get_exception(exc_info) if exc_info else None
+        logged = LoggedException(exception, self.__tracebacks, self.config['traceback_window']) if exception is not None else None # rendered by the first target printing it
+        self.__dispatch(LogRecord.acquire(level, msg, caller_info, module, fields, context, logged), routes)
+
+    def __module_level(self, module : Module|None) -> Levels:
+        """
+        The minimum level of the records of a module (the default level if the caller is not in a module).
+        """
+        return self.__modules.get_level(module.get_complete_name()) if module is not None else self.__modules.get_default_level()
+
+    def __dispatch(self, record : LogRecord, routes : tuple[Target, ...]):
+        """
+        Send a record to the targets of `routes` (the routing table of its level, so the targets with a higher level
+        are not visited) whose filter chain and limiter, if any, accept it, then release it.
+        """
+        try:
+            for target in routes:
+                accept : Predicate|None = target.properties.get("filter")
+                if accept is not None and not accept(record):
+                    continue
+                collapser : Collapser|None = target.properties.get("collapser")
+                if collapser is not None:
+                    pushed = collapser.push(self.__collapse_key(record), (record.level, record.caller_info, record.module, record.context))
+                    if pushed is None: # a repetition of the previous record
+                        continue
+                    if pushed[0]:
+                        self.__write_summary(target, pushed[1], REPEATED.format(pushed[0]), {"repeated": pushed[0]})
+                limiter : Limiter|None = target.properties.get("limiter")
+                if limiter is not None:
+                    suppressed = limiter.admit((record.level, record.caller_info, record.module, record.context))
+                    if suppressed is None:
+                        continue
+                    if suppressed:
+                        self.__write_summary(target, (record.level, record.caller_info, record.module, record.context), SUMMARY.format(suppressed), {"suppressed": suppressed})
+                self.__write(target, record)
+        finally:
+            record.release()
+
+    @staticmethod
+    def __collapse_key(record : LogRecord) -> tuple[object, ...]|None:
+        """
+        The key comparing a record with the previous one, from the values given to the logging method;
+        the records with an exception are never collapsed.
+        """
+        if record.exception is not None:
+            return None
+        return (record.level, record.msg, record.caller_info, record.context, tuple(record.fields.items()) if record.fields else ())
 
-    def __print_in_target(self, msg_level : Levels, msg : Message, caller_info : Callerinfo, target : Target):
-        if Module.exist(*caller_info):
-            name = Module.get(*caller_info).get_complete_name()
-            module_level = Module.get_level(name)
+    def __write_summary(self, target : Target, origin : tuple[Levels, Callerinfo, Module|None, RenderedContext|None], msg : str, fields : Fields):
+        """
+        Write a summary record (suppressed or repeated records) with the level, caller and context of the records it summarizes.
+        """
+        summary = LogRecord.acquire(origin[0], msg, origin[1], origin[2], fields, origin[3])
+        try:
+            self.__write(target, summary)
+        finally:
+            summary.release()
+
+    def __write(self, target : Target, record : LogRecord):
+        if target.type == Target.Type.RECORDER:
+            self.__record_in_target(record, target)
+        elif target.type in (Target.Type.DATABASE, Target.Type.BINARY):
+            target(self.__to_row(record)) # type: ignore[arg-type]
         else:
-            module_level = Module.get_default_level()
+            target(self.__format(record, target))
+
+    def __admit_callsite(self, level : Levels, context : RenderedContext|None = None) -> int|None:
+        """
+        Apply the callsite limiter, if any, to the caller of the logging method; the callsite is identified
+        by its code location, before the caller info is resolved. Return None if the record is suppressed,
+        or dropped by the level of its module or of the targets (so the limiter only counts the records that
+        would be written), otherwise the number of suppressed records to report.
+        """
+        template = self.__callsite_limiter
+        if template is None:
+            return 0
+        frame = sys._getframe(2) #pylint: disable=W0212 # the caller of the logging method
+        key = (frame.f_code, frame.f_lineno)
+        caller_info = self.__callsite_caller(key)
+        module = self.__modules.get(*caller_info) if self.__modules.exist(*caller_info) else None
+        if level < self.__module_level(module) or not self.__targets.routes(level):
+            return None
+        limiter = self.__callsite_limiters.get(key)
+        if limiter is None:
+            limiter = self.__callsite_limiters.setdefault(key, template.copy())
+        return limiter.admit((level, context))
+
+    def __callsite_caller(self, callsite : tuple[CodeType, int]) -> Callerinfo:
+        """
+        The caller info of a callsite (code and line), as resolved by `get_caller_info`; computed once per callsite.
+        """
+        caller_info = self.__callsite_callers.get(callsite)
+        if caller_info is None:
+            code, lineno = callsite
+            caller_info = (os.path.abspath(code.co_filename), get_function_name(code.co_filename, lineno, code.co_name))
+            self.__callsite_callers[callsite] = caller_info
+        return caller_info
+
+    def __record_in_target(self, record : LogRecord, target : Target):
+        recorder : FlightRecorder = target.target # type: ignore[assignment]
+        record.retain() # kept by the recorder after the call
+        recorder.record(record)
+        if record.level >= recorder.trigger:
+            downstream = recorder.downstream
+            if downstream.type in (Target.Type.DATABASE, Target.Type.BINARY):
+                downstream.write_many([self.__to_row(recorded) for recorded in recorder.drain()])
+                return
+            downstream.write_many([self.__format(recorded, downstream) for recorded in recorder.drain()])
 
-        # Check if the message level is below the effective level
-        if msg_level < module_level or msg_level < target["level"]:
-            return
+    @staticmethod
+    def __to_row(record : LogRecord) -> LogRow:
+        """
+        Convert a record to a row; the message and the fields are left unrendered, for the target to serialize.
+        The fields of the bound context are stored with the fields of the record, and so is the exception, as an `exception` field.
+        """
+        fields = record.fields
+        if record.context is not None:
+            fields = {**record.context.fields, **fields}
+        if record.exception is not None:
+            fields = {**fields, "exception": record.exception.report()}
+        module = record.module.get_complete_name() if record.module is not None else ""
+        return (record.time, record.level, module, record.pid, record.process_name, record.thread_name, record.msg, fields)
+
+    def __format(self, record : LogRecord, target : Target) -> str:
+        """
+        Format a log record for a target.
+        """
+        if target.format == "jsonl":
+            module = record.module.get_complete_name() if record.module is not None else ""
+            return format_record(record.level, record.msg, module, record.time, record.pid, record.process_name, record.thread_name,
+                                 record.fields, record.context.json if record.context is not None else "",
+                                 record.exception.report() if record.exception is not None else None)
+
+        templates = COLORED_TEMPLATES if target.color else PLAIN_TEMPLATES
 
-        result = f"{COLORS.RESET}" if target.type == Target.Type.TERMINAL else ""
+        result = templates["start"]
 
-        # add the current time
-        result += self.__log_element_time(target)
+        # add the time
+        result += self.__log_element_time(templates, record.time)
 
         # add the process name if needed
-        result += self.__log_element_process_name(target)
+        result += self.__log_element_process_name(templates, record.process_name)
 
         # add the process ID if needed
-        result += self.__log_element_pid(target)
+        result += self.__log_element_pid(templates, record.pid)
 
         # add the thread name if needed
-        result += self.__log_element_thread_name(target)
+        result += self.__log_element_thread_name(templates, record.thread_name)
 
         # add the level of the message
-        result += self.__log_element_level(msg_level, target)
+        result += templates[record.level]
 
         # add the module name if needed
-        result += self.__log_element_module(caller_info, target)
+        result += self.__log_element_module(record.module, templates)
 
-        # add the message
-        result += self.__log_element_message(msg, caller_info)
+        # add the message, after the bound context
+        result += self.__log_element_message(record.msg, record.module, record.context)
 
-        target(result+"\n")
+        # add the fields
+        if record.fields:
+            result += format_fields(record.fields)
 
-    def __log_element_time(self, target : Target) -> str: # length : + 20
-        if target.type == Target.Type.TERMINAL:
-            return f"[{COLORS.BLUE}{get_time()}{COLORS.RESET}]"
-        # if the target is a file, we don't need to color the output
-        return f"[{get_time()}]"
+        # add the exception, on the next lines
+        if record.exception is not None:
+            result += replace_newline("\n" + record.exception.text(), self.__message_indent(record.module))
 
-    def __log_element_process_name(self, target : Target) -> str: # length : + 25
+        return result + "\n"
+
+    @staticmethod
+    def __log_element_time(templates : Templates, timestamp : float) -> str: # length : + 20
+        return templates["time"].format(get_time(timestamp))
+
+    def __log_element_process_name(self, templates : Templates, process_name : str) -> str: # length : + 25
         if self.config['show_process_name']:
-            name = mp.current_process().name.center(20)
-            if target.type == Target.Type.TERMINAL:
-                return f" [ {COLORS.CYAN}{name}{COLORS.RESET} ]"
-            return f" [ {name} ]"
+            return templates["name"].format(process_name.center(20))
         return ""
 
-    def __log_element_pid(self, target : Target) -> str: # length : + 12
+    def __log_element_pid(self, templates : Templates, pid : int) -> str: # length : + 12
         if self.config['show_pid']:
-            pid = f"{os.getpid():^8d}"
-            if target.type == Target.Type.TERMINAL:
-                return f" [ {COLORS.MAGENTA}{pid}{COLORS.RESET} ]"
-            return f" [ {pid} ]"
+            return templates["pid"].format(f"{pid:^8d}")
         return ""
 
-    def __log_element_thread_name(self, target : Target) -> str: # length : + 25
+    def __log_element_thread_name(self, templates : Templates, thread_name : str) -> str: # length : + 25
         if self.config['show_threads_name']:
-            name = threading.current_thread().name.center(20)
-            if target.type == Target.Type.TERMINAL:
-                return f" [ {COLORS.CYAN}{name}{COLORS.RESET} ]"
-            return f" [ {name} ]"
+            return templates["name"].format(thread_name.center(20))
         return ""
 
-    def __log_element_level(self, level : Levels, target : Target) -> str: # length : + 12
-        if target.type == Target.Type.TERMINAL:
-            return f" [{level.color()}{level}{COLORS.RESET}]"
-        return f" [{level}]"
-
-    def __log_element_module(self, caller_info : Callerinfo, target : Target) -> str: # length : + 20 per module
+    @staticmethod
+    def __log_element_module(module : Module|None, templates : Templates) -> str: # length : + 20 per module
         result = ""
-        if Module.exist(*caller_info):
-            for module in Module.get(*caller_info).get_complete_path():
-                if target.type == Target.Type.TERMINAL:
-                    result += f" [ {colorize(COLORS.BLUE, module.center(15))} ]"
-                else:
-                    result += f" [ {module.center(15)} ]"
+        if module is not None:
+            for name in module.get_complete_path():
+                result += templates["module"].format(name.center(15))
         return result
 
-    def __log_element_message(self, msg : Message, caller_info : Callerinfo) -> str:
+    def __log_element_message(self, msg : Message, module : Module|None, context : RenderedContext|None = None) -> str:
         if not isinstance(msg, str):
             msg = dumps(msg, indent=4, cls=CustomEncoder)
+        prefix = context.text if context is not None else ""
+        return f" {prefix}{replace_newline(msg, self.__message_indent(module))}"
+
+    def __message_indent(self, module : Module|None) -> int:
+        """
+        The length of the header of a log line, to align the next lines of the message.
+        """
         indent = 20 + 12
         if self.config['show_process_name']:
             indent += 25
@@ -150,100 +335,212 @@ class Logger:
             indent += 12
         if self.config['show_threads_name']:
             indent += 25
-        if Module.exist(*caller_info):
-            indent += 20 * len(Module.get(*caller_info).get_complete_path())
-        return f" {replace_newline(msg, indent)}"
+        if module is not None:
+            indent += 20 * len(module.get_complete_path())
+        return indent
+
+    def __flush_repeats_in_target(self, target : Target, expired : bool = False):
+        repeated, origin = target["collapser"].flush(expired)
+        if repeated:
+            self.__write_summary(target, origin, REPEATED.format(repeated), {"repeated": repeated})
+
+    def __flush_summaries(self, expired : bool = False):
+        """
+        Write the summaries not reported yet, of the collapsers and of the limiters; if `expired`, only the ones whose delay has passed.
+        """
+        for target in self.__targets.snapshot():
+            if "collapser" in target:
+                self.__flush_repeats_in_target(target, expired)
+            limiter : Limiter|None = target.properties.get("limiter")
+            if limiter is not None:
+                suppressed, origin = limiter.flush(expired)
+                if suppressed:
+                    self.__write_summary(target, origin, SUMMARY.format(suppressed), {"suppressed": suppressed})
+        for limiter in self.__modules.limiters():
+            suppressed, origin = limiter.flush(expired)
+            if suppressed:
+                self.__dispatch_summary(origin, suppressed)
+        for callsite, limiter in list(self.__callsite_limiters.items()):
+            suppressed, origin = limiter.flush(expired)
+            if suppressed:
+                caller_info = self.__callsite_caller(callsite)
+                module = self.__modules.get(*caller_info) if self.__modules.exist(*caller_info) else None
+                self.__dispatch_summary((origin[0], caller_info, module, origin[1]), suppressed)
+
+    def __dispatch_summary(self, origin : tuple[Levels, Callerinfo, Module|None, RenderedContext|None], suppressed : int):
+        """
+        Send the summary of the records suppressed by a module or callsite limiter to the targets accepting their level,
+        unless their module does not accept it.
+        """
+        if origin[0] < self.__module_level(origin[2]):
+            return
+        routes = self.__targets.routes(origin[0])
+        if routes:
+            self.__dispatch(LogRecord.acquire(origin[0], SUMMARY.format(suppressed), origin[1], origin[2], {"suppressed": suppressed}, origin[3]), routes)
+
+    def __flush_expired(self):
+        self.__flush_summaries(expired=True)
 
     def __print_message_in_target(self, msg : Message, color : COLORS, target : Target):
-        if target.type == Target.Type.TERMINAL:
+        if target.color:
             target(f"{color}{msg}{COLORS.RESET}\n")
         else:
             target(str(msg) + "\n")
 
     def __print_message(self, msg : Message, color : COLORS): #pylint: disable=W0238
-        for target in Target.list():
-            self.__print_message_in_target(msg, color, target)
+        for target in self.__targets.snapshot():
+            if target.type in (Target.Type.FILE, Target.Type.TERMINAL) and target.format == "text": # the others only keep log records
+                self.__print_message_in_target(msg, color, target)
 
 
 #---------------------------------------- Logging methods -----------------------------------------
 
     @classmethod
-    def trace(cls, msg : Message, caller_info : Callerinfo|None = None):
+    def trace(cls, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
         """
         Print a trace message to the standard output, in blue color
 
         Args:
             msg (Message): The message to print
             caller_info (Callerinfo|None): The caller info. If None, the caller info will be retrieved from the stack.
-        """
+            exc_info (ExcInfo): An exception to log with the message: an exception, a `sys.exc_info()` tuple, or True for
+                the exception being handled. Its traceback is printed in full once, then as a reference while it repeats.
+            **fields (Any): Structured fields of the record (e.g. `order_id=42`), written as `key=value` by the text targets
+                and kept as values by the others. They are only serialized by the targets that print the record.
+        """
+        instance = cls.get_instance()
+        suppressed = instance.__admit_callsite(Levels.TRACE) #pylint: disable=W0212
+        if suppressed is None:
+            return
         if caller_info is None: #pragma: no cover
             caller_info = get_caller_info()
-        cls.get_instance().__print(Levels.TRACE, msg, caller_info) #pylint: disable=W0212
+        instance.__print(Levels.TRACE, msg, caller_info, fields, None, exc_info, suppressed) #pylint: disable=W0212
 
     @classmethod
-    def debug(cls, msg : Message, caller_info : Callerinfo|None = None):
+    def debug(cls, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
         """
         Print a debug message to the standard output, in magenta color
 
         Args:
             msg (Message): The message to print
             caller_info (Callerinfo|None): The caller info. If None, the caller info will be retrieved from the stack.
-        """
+            exc_info (ExcInfo): An exception to log with the message: an exception, a `sys.exc_info()` tuple, or True for
+                the exception being handled. Its traceback is printed in full once, then as a reference while it repeats.
+            **fields (Any): Structured fields of the record (e.g. `order_id=42`), written as `key=value` by the text targets
+                and kept as values by the others. They are only serialized by the targets that print the record.
+        """
+        instance = cls.get_instance()
+        suppressed = instance.__admit_callsite(Levels.DEBUG) #pylint: disable=W0212
+        if suppressed is None:
+            return
         if caller_info is None: #pragma: no cover
             caller_info = get_caller_info()
-        cls.get_instance().__print(Levels.DEBUG, msg, caller_info) #pylint: disable=W0212
+        instance.__print(Levels.DEBUG, msg, caller_info, fields, None, exc_info, suppressed) #pylint: disable=W0212
 
     @classmethod
-    def info(cls, msg : Message, caller_info : Callerinfo|None = None):
+    def info(cls, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
         """
         Print an info message to the standard output, in green color
 
         Args:
             msg (Message): The message to print
             caller_info (Callerinfo|None): The caller info. If None, the caller info will be retrieved from the stack.
-        """
+            exc_info (ExcInfo): An exception to log with the message: an exception, a `sys.exc_info()` tuple, or True for
+                the exception being handled. Its traceback is printed in full once, then as a reference while it repeats.
+            **fields (Any): Structured fields of the record (e.g. `order_id=42`), written as `key=value` by the text targets
+                and kept as values by the others. They are only serialized by the targets that print the record.
+        """
+        instance = cls.get_instance()
+        suppressed = instance.__admit_callsite(Levels.INFO) #pylint: disable=W0212
+        if suppressed is None:
+            return
         if caller_info is None: #pragma: no cover
             caller_info = get_caller_info()
-        cls.get_instance().__print(Levels.INFO, msg, caller_info) #pylint: disable=W0212
+        instance.__print(Levels.INFO, msg, caller_info, fields, None, exc_info, suppressed) #pylint: disable=W0212
 
     @classmethod
-    def warning(cls, msg : Message, caller_info : Callerinfo|None = None):
+    def warning(cls, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
         """
         Print a warning message to the standard output, in yellow color
 
         Args:
             msg (Message): The message to print
             caller_info (Callerinfo|None): The caller info. If None, the caller info will be retrieved from the stack.
-        """
+            exc_info (ExcInfo): An exception to log with the message: an exception, a `sys.exc_info()` tuple, or True for
+                the exception being handled. Its traceback is printed in full once, then as a reference while it repeats.
+            **fields (Any): Structured fields of the record (e.g. `order_id=42`), written as `key=value` by the text targets
+                and kept as values by the others. They are only serialized by the targets that print the record.
+        """
+        instance = cls.get_instance()
+        suppressed = instance.__admit_callsite(Levels.WARNING) #pylint: disable=W0212
+        if suppressed is None:
+            return
         if caller_info is None: #pragma: no cover
             caller_info = get_caller_info()
-        cls.get_instance().__print(Levels.WARNING, msg, caller_info) #pylint: disable=W0212
+        instance.__print(Levels.WARNING, msg, caller_info, fields, None, exc_info, suppressed) #pylint: disable=W0212
 
     @classmethod
-    def error(cls, msg : Message, caller_info : Callerinfo|None = None):
+    def error(cls, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
         """
         Print an error message to the standard output, in red color
 
         Args:
             msg (Message): The message to print
             caller_info (Callerinfo|None): The caller info. If None, the caller info will be retrieved from the stack.
-        """
+            exc_info (ExcInfo): An exception to log with the message: an exception, a `sys.exc_info()` tuple, or True for
+                the exception being handled. Its traceback is printed in full once, then as a reference while it repeats.
+            **fields (Any): Structured fields of the record (e.g. `order_id=42`), written as `key=value` by the text targets
+                and kept as values by the others. They are only serialized by the targets that print the record.
+        """
+        instance = cls.get_instance()
+        suppressed = instance.__admit_callsite(Levels.ERROR) #pylint: disable=W0212
+        if suppressed is None:
+            return
         if caller_info is None: #pragma: no cover
             caller_info = get_caller_info()
-        cls.get_instance().__print(Levels.ERROR, msg, caller_info) #pylint: disable=W0212
+        instance.__print(Levels.ERROR, msg, caller_info, fields, None, exc_info, suppressed) #pylint: disable=W0212
 
     @classmethod
-    def fatal(cls, msg : Message, caller_info : Callerinfo|None = None):
+    def fatal(cls, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
         """
         Print a fatal message to the standard output, in red color
 
         Args:
             msg (Message): The message to print
             caller_info (Callerinfo|None): The caller info. If None, the caller info will be retrieved from the stack.
+            exc_info (ExcInfo): An exception to log with the message: an exception, a `sys.exc_info()` tuple, or True for
+                the exception being handled. Its traceback is printed in full once, then as a reference while it repeats.
+            **fields (Any): Structured fields of the record (e.g. `order_id=42`), written as `key=value` by the text targets
+                and kept as values by the others. They are only serialized by the targets that print the record.
+        """
+        instance = cls.get_instance()
+        suppressed = instance.__admit_callsite(Levels.FATAL) #pylint: disable=W0212
+        if suppressed is None:
+            return
+        if caller_info is None: #pragma: no cover
+            caller_info = get_caller_info()
+        instance.__print(Levels.FATAL, msg, caller_info, fields, None, exc_info, suppressed) #pylint: disable=W0212
+
+    @classmethod
+    def exception(cls, msg : Message, caller_info : Callerinfo|None = None, **fields : Any):
         """
+        Print an error message with the exception being handled, in red color; to be called in an `except` block.
+        The full traceback is printed the first time an exception is logged; while the same exception (same type,
+        raised from the same code locations) is logged again within the traceback window (see `set_traceback_window`),
+        only its fingerprint and the number of repetitions are printed.
+
+        Args:
+            msg (Message): The message to print
+            caller_info (Callerinfo|None): The caller info. If None, the caller info will be retrieved from the stack.
+            **fields (Any): Structured fields of the record (see `info`).
+        """
+        instance = cls.get_instance()
+        suppressed = instance.__admit_callsite(Levels.ERROR) #pylint: disable=W0212
+        if suppressed is None:
+            return
         if caller_info is None: #pragma: no cover
             caller_info = get_caller_info()
-        cls.get_instance().__print(Levels.FATAL, msg, caller_info) #pylint: disable=W0212
+        instance.__print(Levels.ERROR, msg, caller_info, fields, None, True, suppressed) #pylint: disable=W0212
 
     @classmethod
     def message(cls, msg : Message, color : COLORS = COLORS.NONE):
@@ -257,8 +554,50 @@ class Logger:
         """
         cls.get_instance().__print_message(msg, color) #pylint: disable=W0212
 
+    @classmethod
+    def bind(cls, **context : Any) -> 'BoundLogger':
+        """
+        Return a logger adding context fields (e.g. a request id) to all its records.
+        The context is rendered once, here: the text targets print it before the message (`request_id=abc order placed`),
+        the JSON lines targets in a `context` object, and the others store it with the fields of the record.
+
+        Args:
+            **context (Any): The context fields
+        Returns:
+            BoundLogger: The bound logger
+        """
+        instance = cls.get_instance()
+        return BoundLogger(RenderedContext(context), instance.__print, instance.__admit_callsite) #pylint: disable=W0212
+
 #---------------------------------------- Configuration methods -----------------------------------
 
+    @staticmethod
+    def named(name : str) -> 'Logger':
+        """
+        Get the logger of the given name, created on the first call. A named logger has its own targets (a stdout target
+        at INFO, at first), modules and module levels, configuration and routing table, separate from the ones of
+        the default logger and of the other named loggers; e.g. a library can log to its own targets without changing
+        the ones of the application.
+        It has the methods of `Logger`, called on it: `Logger.named("ingest").add_target(...)`, `Logger.named("ingest").info(...)`.
+        The class methods of `Logger` (and the functions of `gamuLogger`) keep working on the default logger.
+        Args:
+            name (str): The name of the logger.
+        Returns:
+            Logger: The named logger.
+        """
+        if not name:
+            raise ValueError("The name of a logger cannot be empty")
+        with Logger.__named_lock:
+            logger = Logger.__named.get(name)
+            if logger is None:
+                named_class = type(f"Logger[{name}]", (Logger,), {"name": name}) # its class methods work on its own instance
+                named_class.__instance = None
+                named_class.__targets = TargetRegistry()
+                named_class.__modules = ModuleRegistry()
+                logger = named_class()
+                Logger.__named[name] = logger
+        return logger
+
     @classmethod
     def get_instance(cls) -> 'Logger':
         """
@@ -267,7 +606,7 @@ class Logger:
             Logger: The instance of the logger.
         """
         if cls.__instance is None:
-            Logger()
+            cls()
         return cls.__instance # type: ignore
 
     @classmethod
@@ -279,7 +618,7 @@ class Logger:
             level (Levels): The level of the target. It can be one of the Levels enum values.
         """
         cls.get_instance()
-        target = Target.get(target_name)
+        target = cls.__targets.get(target_name)
         target["level"] = level
 
     @classmethod
@@ -291,7 +630,8 @@ class Logger:
             level (Levels): The level of the module. It can be one of the Levels enum values.
         """
         cls.get_instance()
-        Module.set_level(name, level)
+        with cls.__modules.active():
+            Module.set_level(name, level)
 
     @classmethod
     def set_default_module_level(cls, level : Levels):
@@ -301,7 +641,8 @@ class Logger:
             level (Levels): The level of the module. It can be one of the Levels enum values.
         """
         cls.get_instance()
-        Module.set_default_level(level)
+        with cls.__modules.active():
+            Module.set_default_level(level)
 
     @classmethod
     def set_module(cls, name : str|None):
@@ -315,12 +656,142 @@ class Logger:
         """
         cls.get_instance()
         caller_info = get_caller_info()
-        if not name:
-            Module.delete(*caller_info)
-        elif any(len(token) > 15 for token in name.split(".")):
-            raise ValueError("Each module name should be less than 15 characters")
+        with cls.__modules.active():
+            if not name:
+                Module.delete(*caller_info)
+            elif any(len(token) > 15 for token in name.split(".")):
+                raise ValueError("Each module name should be less than 15 characters")
+            else:
+                Module.new(name, *caller_info)
+
+    @classmethod
+    def set_limiter(cls, target_name : str, limiter : Limiter|None):
+        """
+        Set the limiter of a target: a `RateLimiter` or a `Sampler` deciding which of the records accepted by the target
+        are written to it (the suppressed ones are summarized). The decision is taken before the record is formatted.
+        The summary of the suppressed records is written before the next admitted record, or by a background thread
+        once the summary interval of the limiter has passed, and at exit (see `flush_repeats`).
+        Args:
+            target_name (str): The name of the target.
+            limiter (Limiter|None): The limiter of the target. If None, the limiter will be removed.
+        """
+        cls.get_instance()
+        target = cls.__targets.get(target_name)
+        if limiter is None:
+            target.properties.pop("limiter", None)
         else:
-            Module.new(name, *caller_info)
+            target["limiter"] = limiter
+            cls.__schedule_flush(limiter.summary_interval)
+
+    @classmethod
+    def add_filter(cls, target_name : str, level : Levels = Levels.TRACE, modules : Iterable[str] = (), exclude_modules : Iterable[str] = (), #pylint: disable=R0913, R0917
+                   message : str|re.Pattern[str]|None = None, threads : Iterable[str] = (), predicate : CustomPredicate|None = None):
+        """
+        Append a rule to the filter chain of a target (see `Target.add_filter`). The first rule matching a record decides
+        the minimum level it must have; a record matching no rule is dropped.
+        Args:
+            target_name (str): The name of the target.
+            level (Levels): The minimum level of the records matching the rule; `Levels.NONE` drops them.
+            modules (Iterable[str]): The module prefixes the record must match (`db` or `db.*` for `db` and its submodules).
+            exclude_modules (Iterable[str]): The module prefixes the record must not match.
+            message (str|re.Pattern[str]|None): A regular expression searched in the message.
+            threads (Iterable[str]): The names of the threads the record must come from.
+            predicate (CustomPredicate|None): A function of the level, message, complete module name and fields of the record.
+        """
+        cls.get_instance()
+        cls.__targets.get(target_name).add_filter(level, modules, exclude_modules, message, threads, predicate)
+
+    @classmethod
+    def clear_filters(cls, target_name : str):
+        """
+        Remove the filter chain of a target.
+        Args:
+            target_name (str): The name of the target.
+        """
+        cls.get_instance()
+        cls.__targets.get(target_name).clear_filters()
+
+    @classmethod
+    def set_module_limiter(cls, name : str, limiter : Limiter|None):
+        """
+        Set the limiter of a module, applied to all the records of the module (not of its submodules),
+        before they are sent to the targets.
+        Args:
+            name (str): The complete name of the module.
+            limiter (Limiter|None): The limiter of the module. If None, the limiter will be removed.
+        """
+        cls.get_instance()
+        with cls.__modules.active():
+            Module.set_limiter(name, limiter)
+        if limiter is not None:
+            cls.__schedule_flush(limiter.summary_interval)
+
+    @classmethod
+    def set_callsite_limiter(cls, limiter : Limiter|None):
+        """
+        Limit each callsite (each line of code logging a message) with its own copy of `limiter`.
+        The decision is taken first, before the caller info is resolved, so a suppressed record costs almost nothing.
+        Args:
+            limiter (Limiter|None): The limiter to copy for each callsite. If None, the callsites are not limited.
+        """
+        instance = cls.get_instance()
+        instance.__callsite_limiter = limiter #pylint: disable=W0212
+        instance.__callsite_limiters = {} #pylint: disable=W0212
+        if limiter is not None:
+            cls.__schedule_flush(limiter.summary_interval)
+
+    @classmethod
+    def set_collapse(cls, target_name : str, max_delay : float|None = 30.0):
+        """
+        Collapse the repetitions of a record written to a target: a record with the same level, message, caller,
+        context and fields as the previous one is not written (nor formatted), only counted. A `last message repeated N times`
+        record is written when a different record arrives, and at exit (see `flush_repeats`).
+        A record repeated for more than `max_delay` seconds is written again, after the summary of its repetitions;
+        if the repetitions stop, their summary is written by a background thread once `max_delay` has passed.
+        The records with an exception are never collapsed.
+        Args:
+            target_name (str): The name of the target.
+            max_delay (float|None): The maximum time, in seconds, a record is collapsed. If None, the repetitions of the target are no longer collapsed.
+        """
+        cls.get_instance()
+        target = cls.__targets.get(target_name)
+        if max_delay is None:
+            if "collapser" in target:
+                cls.get_instance().__flush_repeats_in_target(target) #pylint: disable=W0212
+                del target["collapser"]
+            return
+        target["collapser"] = Collapser(max_delay)
+        cls.__schedule_flush(max_delay)
+
+    @classmethod
+    def __schedule_flush(cls, delay : float):
+        """
+        Write the summaries due after `delay` seconds from the background thread, and the pending ones at exit.
+        """
+        atexit.unregister(cls.flush_repeats) # registered once
+        atexit.register(cls.flush_repeats)
+        cls.get_instance().__flusher.schedule(delay) #pylint: disable=W0212
+
+    @classmethod
+    def flush_repeats(cls):
+        """
+        Write the summaries not reported yet: the repetitions of the targets collapsing them,
+        and the records suppressed by the limiters (of the targets, modules and callsites).
+        It is called at exit.
+        """
+        cls.get_instance().__flush_summaries() #pylint: disable=W0212
+
+    @classmethod
+    def set_traceback_window(cls, seconds : float):
+        """
+        Set the time during which a repeated exception is printed as a reference to its first traceback.
+        After it, the full traceback is printed again. The default is 60 seconds; 0 prints every traceback in full.
+        Args:
+            seconds (float): The duration of the window, in seconds.
+        """
+        if seconds < 0:
+            raise ValueError("The traceback window must be positive or zero")
+        cls.get_instance().config['traceback_window'] = seconds
 
     @classmethod
     def show_threads_name(cls, value : bool = True):
@@ -350,43 +821,147 @@ class Logger:
         cls.get_instance().config['show_pid'] = value
 
     @classmethod
-    def add_target(cls, target_func : Callable[[str], None] | str | Target | TerminalTarget, level : Levels = Levels.INFO) -> str:
+    def add_target(cls, target_func : Callable[[str], None] | str | Target | TerminalTarget, level : Levels = Levels.INFO, #pylint: disable=R0913, R0917
+                   color : bool|None = None, format : str|None = None) -> str: #pylint: disable=redefined-builtin
         """
         Add a target to the logger. This will register the target and add it to the list of targets.
         Args:
             target_func (Callable[[str], None] | str | Target | TerminalTarget): The target to add. It can be a callable, a string or a Target object.
             level (Levels): The level of the target. It can be one of the Levels enum values.
+            color (bool|None): Write the logs with ANSI colors or not. If None, terminal targets are colored when their stream
+                is a terminal (see the `NO_COLOR` and `FORCE_COLOR` environment variables), and other targets are not.
+            format (str|None): The output format of the target: "text" (the default) or "jsonl" (one JSON object per record;
+                the raw messages of `Logger.message` are not written). If None, the format of the target is kept.
         Returns:
             str: The name of the target.
         """
         cls.get_instance()
         target : Target|None = None
-        if isinstance(target_func, str):
-            target = Target.from_file(target_func)
-        elif isinstance(target_func, Target):
-            target = target_func
-        else:
-            target = Target(target_func)
+        with cls.__targets.active(): # the targets created here are registered in the targets of this logger
+            if isinstance(target_func, str):
+                target = Target.from_file(target_func)
+            elif isinstance(target_func, Target):
+                target = target_func
+                owner = TargetRegistry.owner(target)
+                if owner is not None and owner is not cls.__targets: # created for another logger
+                    owner.unregister(target)
+                    cls.__targets.register(target)
+            else:
+                target = Target(target_func)
+        if color is not None:
+            target.color = color
+        if format is not None:
+            target.format = format
         cls.set_level(target.name, level)
         return target.name
 
-    @staticmethod
-    def remove_target(target_name : str):
+    @classmethod
+    def remove_target(cls, target_name : str):
         """
         Remove a target from the logger. This will unregister the target and remove it from the list of targets.
         Args:
             target_name (str): The name of the target to remove
         """
-        Target.unregister(target_name)
+        cls.__targets.unregister(target_name)
 
     @classmethod
     def reset(cls):
         """
         Reset the logger to its default state. This will remove all targets and clear the configuration.
         """
-        Target.clear()
+        cls.__targets.clear()
+        cls.get_instance().__flusher.stop() #pylint: disable=W0212
         cls.get_instance().config.clear()
+        cls.get_instance().__tracebacks.clear() #pylint: disable=W0212
+        cls.set_callsite_limiter(None)
 
         #configuring default target
-        default_target = Target(TerminalTarget.STDOUT)
+        with cls.__targets.active():
+            default_target = Target(TerminalTarget.STDOUT)
         default_target["level"] = Levels.INFO
+
+
+class BoundLogger:
+    """
+    A logger adding context fields to all its records, created by `Logger.bind`.
+    It has the logging methods of `Logger`; the configuration is shared with it.
+    """
+    __slots__ = ("__context", "__log", "__admit")
+
+    def __init__(self, context : RenderedContext, log : Callable[[Levels, Message, Callerinfo, Fields, RenderedContext, ExcInfo, int], None],
+                 admit : Callable[[Levels, RenderedContext], int|None]):
+        self.__context = context
+        self.__log = log
+        self.__admit = admit
+
+    @property
+    def context(self) -> Fields:
+        """
+        The context fields of the logger.
+        """
+        return dict(self.__context.fields)
+
+    def bind(self, **context : Any) -> 'BoundLogger':
+        """
+        Return a logger with the context of this one and the given fields, which replace the fields of the same name.
+        """
+        return BoundLogger(self.__context.merge(context), self.__log, self.__admit)
+
+    def trace(self, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
+        """
+        Log a trace message, with the context of the logger (see `Logger.trace`).
+        """
+        suppressed = self.__admit(Levels.TRACE, self.__context)
+        if suppressed is not None:
+            self.__log(Levels.TRACE, msg, caller_info or get_caller_info(), fields, self.__context, exc_info, suppressed)
+
+    def debug(self, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
+        """
+        Log a debug message, with the context of the logger (see `Logger.debug`).
+        """
+        suppressed = self.__admit(Levels.DEBUG, self.__context)
+        if suppressed is not None:
+            self.__log(Levels.DEBUG, msg, caller_info or get_caller_info(), fields, self.__context, exc_info, suppressed)
+
+    def info(self, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
+        """
+        Log an info message, with the context of the logger (see `Logger.info`).
+        """
+        suppressed = self.__admit(Levels.INFO, self.__context)
+        if suppressed is not None:
+            self.__log(Levels.INFO, msg, caller_info or get_caller_info(), fields, self.__context, exc_info, suppressed)
+
+    def warning(self, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
+        """
+        Log a warning message, with the context of the logger (see `Logger.warning`).
+        """
+        suppressed = self.__admit(Levels.WARNING, self.__context)
+        if suppressed is not None:
+            self.__log(Levels.WARNING, msg, caller_info or get_caller_info(), fields, self.__context, exc_info, suppressed)
+
+    def error(self, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
+        """
+        Log an error message, with the context of the logger (see `Logger.error`).
+        """
+        suppressed = self.__admit(Levels.ERROR, self.__context)
+        if suppressed is not None:
+            self.__log(Levels.ERROR, msg, caller_info or get_caller_info(), fields, self.__context, exc_info, suppressed)
+
+    def fatal(self, msg : Message, caller_info : Callerinfo|None = None, exc_info : ExcInfo = None, **fields : Any):
+        """
+        Log a fatal message, with the context of the logger (see `Logger.fatal`).
+        """
+        suppressed = self.__admit(Levels.FATAL, self.__context)
+        if suppressed is not None:
+            self.__log(Levels.FATAL, msg, caller_info or get_caller_info(), fields, self.__context, exc_info, suppressed)
+
+    def exception(self, msg : Message, caller_info : Callerinfo|None = None, **fields : Any):
+        """
+        Log an error message with the exception being handled, and the context of the logger (see `Logger.exception`).
+        """
+        suppressed = self.__admit(Levels.ERROR, self.__context)
+        if suppressed is not None:
+            self.__log(Levels.ERROR, msg, caller_info or get_caller_info(), fields, self.__context, True, suppressed)
+
+    def __repr__(self) -> str:
+        return f"BoundLogger({self.__context.fields!r})"
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+"""
+
+from json import dumps
+from json.encoder import encode_basestring  # type: ignore[attr-defined]
+from typing import Any
+
+from .custom_types import Fields, Levels, Message
+from .utils import CustomEncoder, encode_field_value, field_key_fragment
+
+FORMATS = ("text", "jsonl")
+
+# the constant parts of a record, encoded once
+LEVEL_FRAGMENTS : dict[Levels, str] = {
+    level: f',"level":"{level.name}"' for level in Levels if level != Levels.NONE
+}
+MODULE_KEY = ',"module":'
+PID_KEY = ',"pid":'
+PROCESS_KEY = ',"process":'
+THREAD_KEY = ',"thread":'
+MESSAGE_KEY = ',"message":'
+FIELDS_KEY = ',"fields":'
+CONTEXT_KEY = ',"context":'
+EXCEPTION_KEY = ',"exception":'
+_FIELD_KEYS : dict[str, str] = {} # field name -> encoded key
+
+
+def _encode_key(key : str) -> str:
+    return f"{encode_basestring(key)}:"
+
+
+def format_fields(fields : Fields) -> str:
+    """
+    Format structured fields as a JSON object; the values are kept as JSON values.
+    """
+    return "{" + ",".join(
+        field_key_fragment(_FIELD_KEYS, key, _encode_key) + encode_field_value(value)
+        for key, value in fields.items()
+    ) + "}"
+
+
+def format_record(msg_level : Levels, msg : Message, module : str, timestamp : float, #pylint: disable=R0913, R0917
+                  pid : int, process_name : str, thread_name : str, fields : Fields | None = None, context : str = "",
+                  exception : dict[str, Any] | None = None) -> str:
+    """
+    Format a record as a single-line JSON object, followed by a newline:
+    `{"ts":1735732800.123,"level":"INFO","module":"app.db","pid":42,"process":"MainProcess","thread":"MainThread","message":"..."}`
+    `ts` is the timestamp in seconds since the epoch, and `module` the complete name of the module ("" if none).
+    A message that is not a string is kept as a JSON value instead of being converted to a string.
+    The structured fields, if any, are added as a `fields` object: `..."message":"order placed","fields":{"order_id":42}}`,
+    and the bound context, given already encoded (the members of an object, see `RenderedContext`), as a `context` object.
+    An exception is added as an `exception` object (see `TracebackCache.report`).
+    """
+    message = encode_basestring(msg) if isinstance(msg, str) else dumps(msg, cls=CustomEncoder, ensure_ascii=False)
+    return (
+        f'{{"ts":{timestamp!r}{LEVEL_FRAGMENTS[msg_level]}{MODULE_KEY}{encode_basestring(module)}'
+        f'{PID_KEY}{pid}{PROCESS_KEY}{encode_basestring(process_name)}{THREAD_KEY}{encode_basestring(thread_name)}'
+        f'{MESSAGE_KEY}{message}{FIELDS_KEY + format_fields(fields) if fields else ""}'
+        f'{CONTEXT_KEY + "{" + context + "}" if context else ""}'
+        f'{EXCEPTION_KEY + encode_field_value(exception) if exception is not None else ""}}}\n'
+    )
@@ -0,0 +1,265 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+
+Rate limiting, sampling and collapsing of the log records.
+
+A limiter can be attached to a target (`Logger.set_limiter`), to a module (`Logger.set_module_limiter`),
+or to every callsite (`Logger.set_callsite_limiter`, each line logging a message gets its own copy).
+The records it suppresses are counted; the next record it admits after `summary_interval` seconds is preceded
+by a summary record: `suppressed 48,210 similar messages`, with a `suppressed` field. If no record is admitted
+(the flood stopped, or a sampler drops everything), the summary is written once `summary_interval` has passed, and at exit.
+
+A collapser (`Logger.set_collapse`) suppresses the records of a target that repeat the previous one,
+and writes `last message repeated 12 times` when a different record arrives, when the repetitions last for
+`max_delay` seconds, or at exit. A `Flusher` thread writes the summaries of both due while no record arrives.
+"""
+
+import math
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Hashable
+
+MIN_FLUSH_PERIOD = 0.05 # the flusher wakes at most every 50 ms
+
+
+class Limiter(ABC):
+    """
+    Base class of the limiters: decide if a record is kept, and count the suppressed ones.
+    """
+    def __init__(self, summary_interval : float = 10.0):
+        if summary_interval < 0:
+            raise ValueError("The summary interval must be positive or zero")
+        self.summary_interval = summary_interval
+        self.__lock = threading.Lock()
+        self.__suppressed = 0
+        self.__origin : Any = None
+        self.__last_summary = time.monotonic()
+
+    @abstractmethod
+    def allow(self) -> bool:
+        """
+        Decide if a record is kept. Must be implemented by the subclasses; the calls are serialized.
+        """
+        raise NotImplementedError("Subclasses should implement this method.") #pragma: no cover
+
+    def admit(self, origin : Any = None) -> int | None:
+        """
+        Return None if the record is suppressed; otherwise the number of records suppressed to report before it
+        (0 if none were suppressed, or if the last summary is more recent than `summary_interval`).
+        The `origin` of the last suppressed record (e.g. its level and caller) is kept for `flush`.
+        """
+        with self.__lock:
+            if not self.allow():
+                self.__suppressed += 1
+                self.__origin = origin
+                return None
+            if not self.__suppressed:
+                return 0
+            now = time.monotonic()
+            if now - self.__last_summary < self.summary_interval:
+                return 0
+            suppressed, self.__suppressed = self.__suppressed, 0
+            self.__last_summary = now
+            return suppressed
+
+    def flush(self, expired : bool = False) -> tuple[int, Any]:
+        """
+        Return the number of records suppressed and not reported yet, and the origin of the last one; reset the count.
+        If `expired`, they are only reported once the last summary is older than `summary_interval` (0 is returned before).
+        """
+        with self.__lock:
+            now = time.monotonic()
+            if not self.__suppressed or (expired and now - self.__last_summary < self.summary_interval):
+                return (0, self.__origin)
+            suppressed, self.__suppressed = self.__suppressed, 0
+            self.__last_summary = now
+            return (suppressed, self.__origin)
+
+    @property
+    def suppressed(self) -> int:
+        """
+        The number of records suppressed since the last summary.
+        """
+        return self.__suppressed
+
+    @abstractmethod
+    def copy(self) -> 'Limiter':
+        """
+        Return a new limiter with the same settings, and no history.
+        """
+        raise NotImplementedError("Subclasses should implement this method.") #pragma: no cover
+
+
+class RateLimiter(Limiter):
+    """
+    A token bucket: keep at most `rate` records per second on average, and up to `burst` records at once
+    (`rate` rounded up, at least 1, by default).
+    """
+    def __init__(self, rate : float, burst : int | None = None, summary_interval : float = 10.0):
+        super().__init__(summary_interval)
+        if rate <= 0:
+            raise ValueError("The rate must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("The burst must be at least 1")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, math.ceil(rate))
+        self.__tokens = float(self.burst)
+        self.__last = time.monotonic()
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        self.__tokens = min(self.burst, self.__tokens + (now - self.__last) * self.rate)
+        self.__last = now
+        if self.__tokens >= 1:
+            self.__tokens -= 1
+            return True
+        return False
+
+    def copy(self) -> 'RateLimiter':
+        return RateLimiter(self.rate, self.burst, self.summary_interval)
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate={self.rate}, burst={self.burst})"
+
+
+class Sampler(Limiter):
+    """
+    Keep each record with the given probability, between 0 and 1.
+    """
+    def __init__(self, probability : float, summary_interval : float = 10.0):
+        super().__init__(summary_interval)
+        if not 0 <= probability <= 1:
+            raise ValueError("The probability must be between 0 and 1")
+        self.probability = probability
+
+    def allow(self) -> bool:
+        return random.random() < self.probability
+
+    def copy(self) -> 'Sampler':
+        return Sampler(self.probability, self.summary_interval)
+
+    def __repr__(self) -> str:
+        return f"Sampler(probability={self.probability})"
+
+
+class Collapser:
+    """
+    Suppress the records identical to the previous one, and count them.
+    The records are compared by a key built from the raw record (see `Logger.set_collapse`), its hash first.
+    After `max_delay` seconds, a repeated record is written again (after the summary of its repetitions),
+    so a long run of repetitions is still visible.
+    """
+    def __init__(self, max_delay : float = 30.0):
+        if max_delay <= 0:
+            raise ValueError("The maximum delay must be positive")
+        self.max_delay = max_delay
+        self.__lock = threading.Lock()
+        self.__key : Hashable | None = None
+        self.__hash = 0
+        self.__record : Any = None
+        self.__repeated = 0
+        self.__since = 0.0
+
+    def push(self, key : Hashable | None, record : Any) -> tuple[int, Any] | None:
+        """
+        Compare a record with the previous one; a None key never matches (e.g. an unhashable message).
+        Return None if the record is a repetition to suppress; otherwise the number of repetitions of the previous
+        record to report before writing this one (0 if none), and the previous record.
+        """
+        key_hash = 0
+        if key is not None:
+            try:
+                key_hash = hash(key)
+            except TypeError:
+                key = None
+        now = time.monotonic()
+        with self.__lock:
+            if key is not None and key_hash == self.__hash and key == self.__key and now - self.__since < self.max_delay:
+                self.__repeated += 1
+                return None
+            result = (self.__repeated, self.__record)
+            self.__key, self.__hash, self.__record = key, key_hash, record
+            self.__repeated = 0
+            self.__since = now
+            return result
+
+    def flush(self, expired : bool = False) -> tuple[int, Any]:
+        """
+        Return the number of repetitions of the previous record not reported yet, and the record; reset the count.
+        If `expired`, the repetitions are only reported once the record was first written `max_delay` seconds ago
+        (0 is returned before); the next repetition is then written again, as if pushed after `max_delay`.
+        """
+        with self.__lock:
+            if expired and time.monotonic() - self.__since < self.max_delay:
+                return (0, self.__record)
+            result = (self.__repeated, self.__record)
+            self.__repeated = 0
+            return result
+
+
+class Flusher:
+    """
+    A daemon thread calling `flush` periodically, so the summaries due are written even if no record arrives.
+    It is started by the first `schedule`; its period is half the shortest delay scheduled (at least `MIN_FLUSH_PERIOD`),
+    so a summary is written at most half its delay late.
+    """
+    def __init__(self, flush : Callable[[], None], name : str = "gamuLogger-flusher"):
+        self.__flush = flush
+        self.__name = name
+        self.__period : float | None = None
+        self.__condition = threading.Condition()
+        self.__thread : threading.Thread | None = None
+
+    def schedule(self, delay : float):
+        """
+        Make sure the summaries due after `delay` seconds are written in time; start the thread if needed.
+        """
+        period = max(MIN_FLUSH_PERIOD, delay / 2)
+        with self.__condition:
+            if self.__period is not None and self.__period <= period:
+                return
+            self.__period = period
+            if self.__thread is None or not self.__thread.is_alive(): # not started, or not inherited by a forked child
+                self.__thread = threading.Thread(target=self.__run, name=self.__name, daemon=True)
+                self.__thread.start()
+            else:
+                self.__condition.notify_all() # wake it to take the new period
+
+    def stop(self):
+        """
+        Stop the thread; the next `schedule` starts a new one.
+        """
+        with self.__condition:
+            self.__period = None
+            self.__thread = None
+            self.__condition.notify_all()
+
+    @property
+    def period(self) -> float | None:
+        """
+        The period of the thread, in seconds; None if it is not started.
+        """
+        return self.__period
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                self.__condition.wait(self.__period)
+                if self.__thread is not threading.current_thread(): # stopped
+                    return
+            try:
+                self.__flush()
+            except Exception: #pylint: disable=W0718 # a failing target must not stop the summaries of the others
+                pass
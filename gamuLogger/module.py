@@ -12,17 +12,21 @@ GamuLogger - A simple and powerful logging library for Python
 Antoine Buirey 2025
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
 from .custom_types import Levels
+from .limits import Limiter
 
 
 class Module:
     """
     A class that represents a module in the logger system.
     It is used to keep track of the modules that are being logged.
+    The class methods work on the registry of the default logger, or on the one made active by a named logger
+    (see `ModuleRegistry`).
     """
-    __instances : dict[tuple[str|None, str|None], 'Module'] = {}
-    __levels : dict[str, Levels] = {}
-    __default_level : Levels = Levels.TRACE # if the module level is not set, it will use this level
     def __init__(self,
                  name : str,
                  parent : 'Module|None' = None,
@@ -34,7 +38,7 @@ class Module:
         self.file = file
         self.function = function
 
-        Module.__instances[(self.file, self.function)] = self
+        ModuleRegistry.current().add(self)
 
     def get_complete_name(self) -> str:
         """
@@ -58,14 +62,7 @@ class Module:
         Get the module instance by its filename and function name.
         If the function is a.b.c.d, we check if a.b.c.d, a.b.c, a.b, a are in the instances
         """
-        functions = function.split('.')
-        for i in range(len(functions), 0, -1):
-            # if the function is a.b.c.d, we check if a.b.c.d, a.b.c, a.b, a are in the instances
-            if (filename, '.'.join(functions[:i])) in cls.__instances:
-                return cls.__instances[(filename, '.'.join(functions[:i]))]
-        if (filename, '<module>') in cls.__instances:
-            return cls.__instances[(filename, '<module>')]
-        raise ValueError(f"No module found for file {filename} and function {function}")
+        return ModuleRegistry.current().get(filename, function)
 
     @classmethod
     def exist(cls, filename : str, function : str) -> bool:
@@ -73,21 +70,14 @@ class Module:
         Check if the module instance exists by its filename and function name.
         If the function is a.b.c.d, we check if a.b.c.d, a.b.c, a.b, a are in the instances
         """
-        functions = function.split('.')
-        for i in range(len(functions), 0, -1):
-            # if the function is a.b.c.d, we check if a.b.c.d, a.b.c, a.b, a are in the instances
-            if (filename, '.'.join(functions[:i])) in cls.__instances:
-                return True
-        if (filename, '<module>') in cls.__instances:
-            return True
-        return False
+        return ModuleRegistry.current().exist(filename, function)
 
     @classmethod
     def exist_exact(cls, filename : str, function : str) -> bool:
         """
         Check if the module instance exists by its filename and function name.
         """
-        return (filename, function) in cls.__instances
+        return ModuleRegistry.current().exist_exact(filename, function)
 
 
     @classmethod
@@ -95,41 +85,28 @@ class Module:
         """
         Delete the module instance by its filename and function name.
         """
-        if cls.exist_exact(filename, function):
-            # del Module.__instances[(filename, function)]
-            cls.__instances.pop((filename, function), None)
-        else:
-            raise ValueError(f"No module found for file {filename} and function {function}")
+        ModuleRegistry.current().delete(filename, function)
 
     @classmethod
     def get_by_name(cls, name : str) -> 'Module':
         """
         Get the module instance by its name.
         """
-        for module in cls.__instances.values():
-            if module.get_complete_name() == name:
-                return module
-        raise ValueError(f"No module found for name {name}")
+        return ModuleRegistry.current().get_by_name(name)
 
     @classmethod
     def exist_by_name(cls, name : str) -> bool:
         """
         Check if the module instance exists by its name.
         """
-        return any(
-            module.get_complete_name() == name
-            for module in cls.__instances.values()
-        )
+        return ModuleRegistry.current().exist_by_name(name)
 
     @classmethod
     def delete_by_name(cls, name : str):
         """
         Delete the module instance by its name.
         """
-        if not cls.exist_by_name(name):
-            raise ValueError(f"No module found for name {name}")
-        module = cls.get_by_name(name)
-        del cls.__instances[(module.file, module.function)]
+        ModuleRegistry.current().delete_by_name(name)
 
 
     @classmethod
@@ -137,7 +114,7 @@ class Module:
         """
         Clear all the module instances.
         """
-        cls.__instances = {}
+        ModuleRegistry.current().clear()
 
     @classmethod
     def new(cls, name : str, file : str|None = None, function : str|None = None) -> 'Module':
@@ -147,29 +124,14 @@ class Module:
         If the module is a.b.c.d, we check if a.b.c.d, a.b.c, a.b, a are in the instances
         and create the parent modules if they don't exist.
         """
-        if cls.exist_by_name(name):
-            existing = cls.get_by_name(name)
-            if file == existing.file and function == existing.function:
-                return existing
-            raise ValueError(f"Module {name} already exists with file {existing.file} and function {existing.function}")
-
-        if '.' in name:
-            parent_name, module_name = name.rsplit('.', 1)
-            if not cls.exist_by_name(parent_name):
-                #create the parent module
-                parent = cls.new(parent_name, file, function)
-            else:
-                #get the parent module
-                parent = cls.get_by_name(parent_name)
-            return cls(module_name, parent, file, function)
-        return cls(name, None, file, function)
+        return ModuleRegistry.current().new(name, file, function)
 
     @classmethod
     def all(cls) -> dict[tuple[str|None, str|None], 'Module']:
         """
         Get all the module instances.
         """
-        return cls.__instances
+        return ModuleRegistry.current().all()
 
 
     @classmethod
@@ -177,25 +139,242 @@ class Module:
         """
         Set the level of the module instance by its name.
         """
-        cls.__levels[name] = level
+        ModuleRegistry.current().set_level(name, level)
 
     @classmethod
     def get_level(cls, name : str) -> Levels:
         """
         Get the level of the module instance by its name.
         """
-        return cls.__levels[name] if name in cls.__levels else cls.__default_level
+        return ModuleRegistry.current().get_level(name)
 
     @classmethod
     def set_default_level(cls, level : Levels):
         """
         Set the default level of the module instance.
         """
-        cls.__default_level = level
+        ModuleRegistry.current().set_default_level(level)
 
     @classmethod
     def get_default_level(cls) -> Levels:
         """
         Get the default level of the module instance.
         """
-        return cls.__default_level
+        return ModuleRegistry.current().get_default_level()
+
+    @classmethod
+    def set_limiter(cls, name : str, limiter : Limiter | None):
+        """
+        Set the limiter of the module instance by its name; None removes it.
+        """
+        ModuleRegistry.current().set_limiter(name, limiter)
+
+    @classmethod
+    def get_limiter(cls, name : str) -> Limiter | None:
+        """
+        Get the limiter of the module instance by its name, if it has one.
+        """
+        return ModuleRegistry.current().get_limiter(name)
+
+    @classmethod
+    def has_limiters(cls) -> bool:
+        """
+        Check if a module has a limiter.
+        """
+        return ModuleRegistry.current().has_limiters()
+
+
+class ModuleRegistry:
+    """
+    The modules of a logger (by the file and function they are set in), and their levels and limiters (by complete name).
+    The class methods of `Module` work on the registry of the default logger, or on the one made active by a named logger
+    (see `active`).
+    """
+    def __init__(self):
+        self.__instances : dict[tuple[str|None, str|None], Module] = {}
+        self.__levels : dict[str, Levels] = {}
+        self.__limiters : dict[str, Limiter] = {}
+        self.__default_level : Levels = Levels.TRACE # if the module level is not set, it will use this level
+
+    @staticmethod
+    def current() -> 'ModuleRegistry':
+        """
+        Get the active registry: the one of the default logger, unless a named logger made its own active.
+        """
+        return _ACTIVE_MODULES.get()
+
+    @contextmanager
+    def active(self) -> Iterator['ModuleRegistry']:
+        """
+        Make this registry the active one within the block, in this thread or asyncio task:
+        the modules created in the block are registered in it.
+        """
+        token = _ACTIVE_MODULES.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_MODULES.reset(token)
+
+    def add(self, module : Module):
+        """
+        Register a module, by its file and function.
+        """
+        self.__instances[(module.file, module.function)] = module
+
+    def get(self, filename : str, function : str) -> Module:
+        """
+        Get a module by its filename and function name.
+        If the function is a.b.c.d, we check if a.b.c.d, a.b.c, a.b, a are in the instances
+        """
+        functions = function.split('.')
+        for i in range(len(functions), 0, -1):
+            # if the function is a.b.c.d, we check if a.b.c.d, a.b.c, a.b, a are in the instances
+            if (filename, '.'.join(functions[:i])) in self.__instances:
+                return self.__instances[(filename, '.'.join(functions[:i]))]
+        if (filename, '<module>') in self.__instances:
+            return self.__instances[(filename, '<module>')]
+        raise ValueError(f"No module found for file {filename} and function {function}")
+
+    def exist(self, filename : str, function : str) -> bool:
+        """
+        Check if a module exists by its filename and function name.
+        If the function is a.b.c.d, we check if a.b.c.d, a.b.c, a.b, a are in the instances
+        """
+        functions = function.split('.')
+        for i in range(len(functions), 0, -1):
+            # if the function is a.b.c.d, we check if a.b.c.d, a.b.c, a.b, a are in the instances
+            if (filename, '.'.join(functions[:i])) in self.__instances:
+                return True
+        if (filename, '<module>') in self.__instances:
+            return True
+        return False
+
+    def exist_exact(self, filename : str, function : str) -> bool:
+        """
+        Check if a module exists by its filename and function name.
+        """
+        return (filename, function) in self.__instances
+
+    def delete(self, filename : str, function : str):
+        """
+        Delete a module by its filename and function name.
+        """
+        if self.exist_exact(filename, function):
+            self.__instances.pop((filename, function), None)
+        else:
+            raise ValueError(f"No module found for file {filename} and function {function}")
+
+    def get_by_name(self, name : str) -> Module:
+        """
+        Get a module by its complete name.
+        """
+        for module in self.__instances.values():
+            if module.get_complete_name() == name:
+                return module
+        raise ValueError(f"No module found for name {name}")
+
+    def exist_by_name(self, name : str) -> bool:
+        """
+        Check if a module exists by its complete name.
+        """
+        return any(
+            module.get_complete_name() == name
+            for module in self.__instances.values()
+        )
+
+    def delete_by_name(self, name : str):
+        """
+        Delete a module by its complete name.
+        """
+        if not self.exist_by_name(name):
+            raise ValueError(f"No module found for name {name}")
+        module = self.get_by_name(name)
+        del self.__instances[(module.file, module.function)]
+
+    def clear(self):
+        """
+        Clear all the modules.
+        """
+        self.__instances = {}
+
+    def new(self, name : str, file : str|None = None, function : str|None = None) -> Module:
+        """
+        Create a module by its name, file and function (see `Module.new`).
+        """
+        if self.exist_by_name(name):
+            existing = self.get_by_name(name)
+            if file == existing.file and function == existing.function:
+                return existing
+            raise ValueError(f"Module {name} already exists with file {existing.file} and function {existing.function}")
+
+        with self.active(): # the modules register themselves in the active registry
+            if '.' in name:
+                parent_name, module_name = name.rsplit('.', 1)
+                if not self.exist_by_name(parent_name):
+                    #create the parent module
+                    parent = self.new(parent_name, file, function)
+                else:
+                    #get the parent module
+                    parent = self.get_by_name(parent_name)
+                return Module(module_name, parent, file, function)
+            return Module(name, None, file, function)
+
+    def all(self) -> dict[tuple[str|None, str|None], Module]:
+        """
+        Get all the modules.
+        """
+        return self.__instances
+
+    def set_level(self, name : str, level : Levels):
+        """
+        Set the level of a module by its name.
+        """
+        self.__levels[name] = level
+
+    def get_level(self, name : str) -> Levels:
+        """
+        Get the level of a module by its name.
+        """
+        return self.__levels[name] if name in self.__levels else self.__default_level
+
+    def set_default_level(self, level : Levels):
+        """
+        Set the level of the modules without a level.
+        """
+        self.__default_level = level
+
+    def get_default_level(self) -> Levels:
+        """
+        Get the level of the modules without a level.
+        """
+        return self.__default_level
+
+    def set_limiter(self, name : str, limiter : Limiter | None):
+        """
+        Set the limiter of a module by its name; None removes it.
+        """
+        if limiter is None:
+            self.__limiters.pop(name, None)
+        else:
+            self.__limiters[name] = limiter
+
+    def get_limiter(self, name : str) -> Limiter | None:
+        """
+        Get the limiter of a module by its name, if it has one.
+        """
+        return self.__limiters.get(name)
+
+    def limiters(self) -> list[Limiter]:
+        """
+        Get the limiters of the modules.
+        """
+        return list(self.__limiters.values())
+
+    def has_limiters(self) -> bool:
+        """
+        Check if a module has a limiter.
+        """
+        return bool(self.__limiters)
+
+
+_ACTIVE_MODULES : ContextVar[ModuleRegistry] = ContextVar("gamuLogger_modules", default=ModuleRegistry())
@@ -0,0 +1,347 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+"""
+
+import atexit
+import gzip
+import http.client
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from urllib.parse import urlsplit
+
+type Address = str | tuple[str, int] # path of a Unix socket, or (host, port)
+
+
+class BatchSender(ABC):
+    """
+    Base class of the targets shipping the logs to a remote endpoint.
+
+    The logs are appended to a bounded in-memory spool, and a background thread sends them in batches:
+    as soon as the spool holds `batch_size` bytes, and at least every `flush_interval` seconds.
+    If a batch cannot be sent, it is kept at the front of the spool, and sending is retried
+    with an exponential backoff (up to `max_backoff` seconds), at most `max_retries` times (None for no limit)
+    before the batch is dropped. Meanwhile the new logs are spooled; when the spool exceeds `spool_size` bytes,
+    the `drop` policy tells which logs are dropped: the `oldest` ones, or the `newest` ones (see `dropped`).
+
+    Subclasses implement `send(batch)`, raising OSError on failure, and `disconnect()`.
+    """
+    def __init__(self, batch_size : int, flush_interval : float, spool_size : int, max_backoff : float, #pylint: disable=R0913, R0917
+                 max_retries : int | None = None, drop : str = "oldest"):
+        if batch_size <= 0 or spool_size <= 0:
+            raise ValueError("The batch size and the spool size must be positive")
+        if flush_interval <= 0 or max_backoff <= 0:
+            raise ValueError("The flush interval and the maximum backoff must be positive")
+        if max_retries is not None and max_retries < 0:
+            raise ValueError("The maximum number of retries cannot be negative")
+        if drop not in ("oldest", "newest"):
+            raise ValueError(f"Invalid drop policy: {drop}")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool_size = spool_size
+        self.max_backoff = max_backoff
+        self.max_retries = max_retries
+        self.drop = drop
+        self.dropped = 0
+        self.__spool : deque[str] = deque()
+        self.__spool_bytes = 0
+        self.__in_flight = False
+        self.__flush_requested = False
+        self.__closed = False
+        self.__condition = threading.Condition()
+        self.__thread : threading.Thread | None = None
+        atexit.register(self.close)
+
+    def __call__(self, string : str):
+        """
+        Spool a log; it is sent by the background thread.
+        """
+        self.write_many([string])
+
+    def write_many(self, strings : list[str]):
+        """
+        Spool several logs at once.
+        """
+        with self.__condition:
+            if self.__closed:
+                self.dropped += len(strings)
+                return
+            for string in strings:
+                self.__spool.append(string)
+                self.__spool_bytes += len(string)
+            self.__drop_excess()
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name=f"gamuLogger-{type(self).__name__}", daemon=True)
+                self.__thread.start()
+            elif self.__spool_bytes >= self.batch_size:
+                self.__condition.notify_all()
+
+    def flush(self, timeout : float | None = None) -> bool:
+        """
+        Wait until the spooled logs are sent.
+        Return False if they could not be sent within `timeout` seconds.
+        """
+        with self.__condition:
+            self.__flush_requested = True
+            self.__condition.notify_all()
+            return self.__condition.wait_for(lambda: not self.__spool and not self.__in_flight, timeout)
+
+    def close(self, timeout : float = 5.0):
+        """
+        Send the spooled logs (waiting at most `timeout` seconds), then stop the background thread and disconnect.
+        The logs written after closing are dropped.
+        """
+        self.flush(timeout)
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join(timeout)
+        self.disconnect()
+        atexit.unregister(self.close)
+
+    @property
+    def pending(self) -> int:
+        """
+        Get the number of logs waiting to be sent.
+        """
+        with self.__condition:
+            return len(self.__spool)
+
+    @abstractmethod
+    def send(self, batch : list[str]):
+        """
+        Send a batch of logs, raising OSError if it cannot be sent.
+        """
+        raise NotImplementedError("Subclasses should implement this method.") #pragma: no cover
+
+    @abstractmethod
+    def disconnect(self):
+        """
+        Close the connection, if any. The next `send` reconnects.
+        """
+        raise NotImplementedError("Subclasses should implement this method.") #pragma: no cover
+
+    def __drop_excess(self):
+        """
+        Drop logs, according to the drop policy, while the spool is too large. Must be called with the condition held.
+        """
+        pop = self.__spool.popleft if self.drop == "oldest" else self.__spool.pop
+        while self.__spool_bytes > self.spool_size and self.__spool:
+            self.__spool_bytes -= len(pop())
+            self.dropped += 1
+
+    def __take_batch(self) -> list[str]:
+        """
+        Take the oldest logs, up to `batch_size` bytes (at least one log). Must be called with the condition held.
+        """
+        batch : list[str] = []
+        size = 0
+        while self.__spool and (not batch or size + len(self.__spool[0]) <= self.batch_size):
+            string = self.__spool.popleft()
+            size += len(string)
+            batch.append(string)
+        self.__spool_bytes -= size
+        return batch
+
+    def __give_back(self, batch : list[str]):
+        """
+        Put back a batch that could not be sent at the front of the spool. Must be called with the condition held.
+        """
+        self.__spool.extendleft(reversed(batch))
+        self.__spool_bytes += sum(len(string) for string in batch)
+        self.__drop_excess()
+
+    def __run(self):
+        backoff = 0.0
+        retry_at = 0.0
+        failures = 0 # of the batch at the front of the spool
+        while True:
+            with self.__condition:
+                while not self.__closed and time.monotonic() < retry_at: # the new logs do not interrupt the backoff
+                    self.__condition.wait(retry_at - time.monotonic())
+                if not self.__closed and not self.__flush_requested and self.__spool_bytes < self.batch_size:
+                    self.__condition.wait(self.flush_interval)
+                if not self.__spool:
+                    self.__flush_requested = False
+                    self.__condition.notify_all()
+                    if self.__closed:
+                        return
+                    continue
+                batch = self.__take_batch()
+                self.__in_flight = True
+
+            try:
+                self.send(batch)
+            except OSError:
+                self.disconnect()
+                with self.__condition:
+                    self.__in_flight = False
+                    if self.__closed: # do not retry forever while closing
+                        self.dropped += len(batch) + len(self.__spool)
+                        self.__spool.clear()
+                        self.__spool_bytes = 0
+                        self.__condition.notify_all()
+                        return
+                    failures += 1
+                    if self.max_retries is not None and failures > self.max_retries:
+                        self.dropped += len(batch)
+                        failures = 0
+                        self.__condition.notify_all()
+                    else:
+                        self.__give_back(batch)
+                    backoff = min(self.max_backoff, backoff * 2 if backoff else 0.1)
+                    retry_at = time.monotonic() + backoff
+                continue
+
+            backoff = 0.0
+            failures = 0
+            with self.__condition:
+                self.__in_flight = False
+                self.__condition.notify_all()
+
+
+class SocketWriter(BatchSender):
+    """
+    Send the logs to a collector over a socket: TCP or Unix stream (`socket.SOCK_STREAM`),
+    UDP or Unix datagram (`socket.SOCK_DGRAM`).
+    The connection is kept open between batches, and reopened when sending fails.
+    With a datagram socket, the logs of a batch are packed in datagrams of at most `datagram_size` bytes
+    (a longer log is truncated).
+    A batch is sent again as a whole after a failure, so a log may be received twice if the connection breaks during a send.
+    """
+    def __init__(self, address : Address, kind : int = socket.SOCK_STREAM, #pylint: disable=R0913, R0917
+                 batch_size : int = 65536, flush_interval : float = 1.0, spool_size : int = 1 << 20,
+                 max_backoff : float = 30.0, timeout : float = 5.0, datagram_size : int = 8192):
+        if kind not in (socket.SOCK_STREAM, socket.SOCK_DGRAM):
+            raise ValueError("The socket kind must be socket.SOCK_STREAM or socket.SOCK_DGRAM")
+        super().__init__(batch_size, flush_interval, spool_size, max_backoff)
+        self.address = address
+        self.kind = kind
+        self.timeout = timeout
+        self.datagram_size = datagram_size
+        self.__socket : socket.socket | None = None
+
+    def __connect(self) -> socket.socket:
+        if isinstance(self.address, str):
+            sock = socket.socket(socket.AF_UNIX, self.kind) #pylint: disable=no-member
+            try:
+                sock.settimeout(self.timeout)
+                sock.connect(self.address)
+            except OSError:
+                sock.close()
+                raise
+            return sock
+        if self.kind == socket.SOCK_STREAM:
+            return socket.create_connection(self.address, self.timeout)
+        family, kind, proto, _, address = socket.getaddrinfo(*self.address, type=socket.SOCK_DGRAM)[0]
+        sock = socket.socket(family, kind, proto)
+        sock.settimeout(self.timeout)
+        sock.connect(address)
+        return sock
+
+    def send(self, batch : list[str]):
+        if self.__socket is None:
+            self.__socket = self.__connect()
+        if self.kind == socket.SOCK_STREAM:
+            self.__socket.sendall("".join(batch).encode("utf-8"))
+            return
+        datagram = bytearray()
+        for string in batch:
+            data = string.encode("utf-8")[:self.datagram_size]
+            if len(datagram) + len(data) > self.datagram_size:
+                self.__socket.send(datagram)
+                datagram.clear()
+            datagram += data
+        if datagram:
+            self.__socket.send(datagram)
+
+    def disconnect(self):
+        if self.__socket is not None:
+            self.__socket.close()
+            self.__socket = None
+
+    def __str__(self) -> str:
+        if isinstance(self.address, str):
+            return self.address
+        return f"{self.address[0]}:{self.address[1]}"
+
+
+class HttpWriter(BatchSender):
+    """
+    POST the logs to an HTTP(S) endpoint, in batches, over a persistent (keep-alive) connection.
+    The body of a request is either the logs as newline-delimited text (`payload="ndjson"`),
+    or a JSON array of the logs (`payload="json"`), which must then be JSON documents (e.g. the lines of a `jsonl` target);
+    it is gzip-compressed if `compress` is True.
+    A batch is retried when the request fails or the endpoint answers 429 or 5xx;
+    it is dropped (see `rejected`) when the endpoint answers another error status.
+    """
+    def __init__(self, url : str, payload : str = "ndjson", compress : bool = True, #pylint: disable=R0913, R0917
+                 batch_size : int = 1 << 20, flush_interval : float = 5.0, spool_size : int = 8 << 20,
+                 max_backoff : float = 60.0, max_retries : int | None = 5, drop : str = "oldest",
+                 headers : dict[str, str] | None = None, timeout : float = 10.0):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Invalid HTTP url: {url}")
+        if payload not in ("ndjson", "json"):
+            raise ValueError(f"Invalid payload: {payload}")
+        super().__init__(batch_size, flush_interval, spool_size, max_backoff, max_retries, drop)
+        self.url = url
+        self.payload = payload
+        self.compress = compress
+        self.timeout = timeout
+        self.rejected = 0
+        self.__scheme = parts.scheme
+        self.__host = parts.hostname
+        self.__port = parts.port
+        self.__path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self.__headers = {
+            "Content-Type": "application/x-ndjson" if payload == "ndjson" else "application/json",
+            **({"Content-Encoding": "gzip"} if compress else {}),
+            **(headers or {})
+        }
+        self.__connection : http.client.HTTPConnection | None = None
+
+    def __body(self, batch : list[str]) -> bytes:
+        if self.payload == "ndjson":
+            body = "".join(batch).encode("utf-8")
+        else:
+            body = ("[" + ",".join(string.removesuffix("\n") for string in batch) + "]").encode("utf-8") # the records are embedded as they are
+        return gzip.compress(body, compresslevel=6) if self.compress else body
+
+    def send(self, batch : list[str]):
+        if self.__connection is None:
+            connection_class = http.client.HTTPSConnection if self.__scheme == "https" else http.client.HTTPConnection
+            self.__connection = connection_class(self.__host, self.__port, timeout=self.timeout)
+        try:
+            self.__connection.request("POST", self.__path, self.__body(batch), self.__headers)
+            response = self.__connection.getresponse()
+            response.read() # the response must be read before the connection is reused
+        except http.client.HTTPException as e:
+            raise ConnectionError(f"HTTP request to {self.url} failed: {e}") from e
+        if response.status == 429 or response.status >= 500:
+            raise ConnectionError(f"HTTP request to {self.url} failed: {response.status} {response.reason}")
+        if response.status >= 400:
+            self.rejected += len(batch) # retrying would not help
+        if response.will_close:
+            self.disconnect()
+
+    def disconnect(self):
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+    def __str__(self) -> str:
+        return self.url
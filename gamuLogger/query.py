@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+Query the log databases written by `Target.from_sqlite`.
+
+The rows are yielded lazily, oldest first, as (timestamp, level, module, pid, process, thread, message, fields) tuples;
+the structured fields are decoded to a dictionary (empty if the record has none).
+"""
+
+import sqlite3
+from json import loads
+from pathlib import Path
+from typing import Iterator
+
+from .custom_types import Levels, LogRow
+
+COLUMNS = "timestamp, level, module, pid, process, thread, message, fields"
+
+
+def select(path : str, #pylint: disable=R0913
+           start : float | None = None, end : float | None = None,
+           level : Levels | None = None, module : str | None = None,
+           limit : int | None = None) -> Iterator[LogRow]:
+    """
+    Yield the logs of a database matching all the given criteria, oldest first:
+    - logged at or after `start`, and before `end` (timestamps in seconds since the epoch)
+    - with a level greater than or equal to `level`
+    - logged in `module` or in one of its submodules (e.g. `app` matches `app` and `app.db`, but not `application`)
+    The database is opened read-only, and the rows are fetched as they are consumed.
+    """
+    clauses : list[str] = []
+    parameters : list[object] = []
+    if start is not None:
+        clauses.append("timestamp >= ?")
+        parameters.append(start)
+    if end is not None:
+        clauses.append("timestamp < ?")
+        parameters.append(end)
+    if level is not None:
+        clauses.append("level >= ?")
+        parameters.append(int(level))
+    if module is not None:
+        # a range on the module index: the module itself, or any name starting with "module." ("/" follows "." in ASCII)
+        clauses.append("(module = ? OR (module >= ? AND module < ?))")
+        parameters.extend((module, f"{module}.", f"{module}/"))
+    sql = f"SELECT {COLUMNS} FROM logs"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY timestamp, id"
+    if limit is not None:
+        sql += " LIMIT ?"
+        parameters.append(limit)
+
+    connection = sqlite3.connect(f"{Path(path).absolute().as_uri()}?mode=ro", uri=True)
+    try:
+        for timestamp, level_value, module_name, pid, process, thread, message, fields in connection.execute(sql, parameters):
+            yield (timestamp, Levels(level_value), module_name, pid, process, thread, message, loads(fields) if fields else {})
+    finally:
+        connection.close()
+
+
+def time_range(path : str, start : float, end : float) -> Iterator[LogRow]:
+    """
+    Yield the logs of a database logged between `start` (included) and `end` (excluded), oldest first.
+    """
+    return select(path, start=start, end=end)
+
+
+def min_level(path : str, level : Levels) -> Iterator[LogRow]:
+    """
+    Yield the logs of a database with a level greater than or equal to `level`, oldest first.
+    """
+    return select(path, level=level)
+
+
+def module_prefix(path : str, module : str) -> Iterator[LogRow]:
+    """
+    Yield the logs of a database logged in `module` or in one of its submodules, oldest first.
+    """
+    return select(path, module=module)
@@ -0,0 +1,154 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+"""
+
+import atexit
+import os
+import select
+import threading
+import time
+from enum import Enum
+
+
+class FlushPolicy(Enum):
+    """
+    Enum for the flush policies of the raw terminal targets.
+    - LINE: every log is written as soon as it is logged
+    - SIZE: the logs are written when the buffer is full
+    - TIME: the logs are written every `flush_interval` seconds, or when the buffer is full
+    """
+    LINE = 40
+    SIZE = 41
+    TIME = 42
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    @staticmethod
+    def from_string(policy : str) -> 'FlushPolicy':
+        """
+        Convert a string to a FlushPolicy enum.
+        The string can be any case (lower, upper, mixed).
+        """
+        match policy.lower():
+            case 'line':
+                return FlushPolicy.LINE
+            case 'size':
+                return FlushPolicy.SIZE
+            case 'time':
+                return FlushPolicy.TIME
+            case _:
+                raise ValueError(f"Invalid flush policy: {policy}")
+
+
+class FdWriter:
+    """
+    Write the logs as bytes to a file descriptor (e.g. 1 for stdout, 2 for stderr),
+    through its own buffer instead of the TextIOWrapper of sys.stdout/sys.stderr.
+    Each log is encoded once; the buffer is written according to the flush policy.
+    Partial writes are resumed, and non-blocking file descriptors are waited for when they would block (EAGAIN).
+
+    The writes are not locked, to keep them cheap: they must be serialized with `lock`
+    (a Target does it, with its own lock), which `flush` and the background flusher of the TIME policy acquire.
+    """
+    def __init__(self, fd : int, flush : FlushPolicy = FlushPolicy.LINE, buffer_size : int = 65536, flush_interval : float = 1.0,
+                 lock : 'threading.Lock | None' = None):
+        if buffer_size <= 0:
+            raise ValueError("The buffer size must be positive")
+        if flush_interval <= 0:
+            raise ValueError("The flush interval must be positive")
+        self.fd = fd
+        self.policy = flush
+        self.__write_each = flush == FlushPolicy.LINE
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.__buffer = bytearray()
+        self.lock = lock if lock is not None else threading.Lock()
+        self.__flusher : threading.Thread | None = None
+        self.__closed = threading.Event()
+        atexit.register(self.__flush_at_exit)
+
+    def __call__(self, string : str):
+        """
+        Buffer a log, and write the buffer if the flush policy requires it.
+        """
+        buffer = self.__buffer
+        buffer += string.encode("utf-8")
+        if self.__write_each or len(buffer) >= self.buffer_size:
+            self.__write_buffer()
+        elif self.__flusher is None and self.policy == FlushPolicy.TIME:
+            self.__start_flusher()
+
+    def write_many(self, strings : list[str]):
+        """
+        Buffer several logs, then apply the flush policy once.
+        """
+        self("".join(strings))
+
+    def flush(self):
+        """
+        Write the buffered logs.
+        """
+        with self.lock:
+            self.__write_buffer()
+
+    def drain(self):
+        """
+        Write the buffered logs, the caller holding `lock`.
+        """
+        self.__write_buffer()
+
+    def close(self):
+        """
+        Write the buffered logs and stop the background flusher. The file descriptor is left open.
+        """
+        self.__closed.set()
+        self.flush()
+        atexit.unregister(self.__flush_at_exit)
+
+    def __flush_at_exit(self):
+        try:
+            self.flush()
+        except OSError: # the output is already closed
+            pass
+
+    def __start_flusher(self):
+        self.__flusher = threading.Thread(target=self.__flush_periodically, name="gamuLogger-flusher", daemon=True)
+        self.__flusher.start()
+
+    def __flush_periodically(self):
+        while not self.__closed.wait(self.flush_interval):
+            self.flush()
+
+    def __write_buffer(self):
+        """
+        Write the whole buffer, resuming partial writes. The writes must be serialized by the caller.
+        """
+        if not self.__buffer:
+            return
+        buffer, self.__buffer = self.__buffer, bytearray() # on error (e.g. broken pipe), the logs are dropped rather than retried forever
+        offset = 0
+        with memoryview(buffer) as view:
+            while offset < len(buffer):
+                try:
+                    offset += os.write(self.fd, view[offset:])
+                except BlockingIOError: # EAGAIN on a non-blocking file descriptor
+                    self.__wait_writable()
+                except InterruptedError: #pragma: no cover
+                    pass
+
+    def __wait_writable(self):
+        try:
+            select.select([], [self.fd], [], self.flush_interval)
+        except (OSError, ValueError): #pragma: no cover
+            time.sleep(0.001) # select does not support this file descriptor (e.g. on Windows)
@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+
+The log record: created once per logging call, with the time, process and thread it comes from,
+then passed to the filters, the collapsers and limiters, and the formatters of the targets.
+The records are reused from a free list, so a logging call does not allocate one.
+"""
+
+import itertools
+import multiprocessing as mp
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from .custom_types import Callerinfo, Fields, Levels, Message
+
+if TYPE_CHECKING:
+    from .context import RenderedContext
+    from .module import Module
+    from .tracebacks import LoggedException
+
+MAX_FREE_RECORDS = 64 # bound of the free list: the records released above it are left to the garbage collector
+
+_SEQUENCE = itertools.count() # next() on a count is atomic
+_PID = [os.getpid()] # os.getpid is a system call; the pid only changes in a forked child
+
+
+def _update_pid():
+    _PID[0] = os.getpid()
+
+os.register_at_fork(after_in_child=_update_pid)
+
+
+class LogRecord:
+    """
+    A log record, as given to the logging method, and where and when it was logged:
+    - `level`, `msg`, `caller_info`, `module` (None if the caller is not in a module), `fields`, `context` (the bound and ambient context, if any)
+      and `exception` (if any)
+    - `time` (wall clock, as `time.time()`), `monotonic` (as `time.monotonic()`), and `sequence`, increasing with each record of the process
+    - `pid`, `process_name`, `thread_id` and `thread_name`
+
+    Use `acquire` to get a record from the free list and `release` to give it back, once no stage uses it anymore;
+    a stage keeping it after the call (e.g. a flight recorder) must `retain` it, so it is not reused.
+    """
+    __slots__ = ("level", "msg", "caller_info", "module", "fields", "context", "exception",
+                 "time", "monotonic", "sequence", "pid", "process_name", "thread_id", "thread_name", "retained")
+
+    __free : list['LogRecord'] = [] # list.pop and list.append are atomic, no lock is needed
+
+    def __init__(self, level : Levels, msg : Message, caller_info : Callerinfo, module : 'Module|None', fields : Fields, #pylint: disable=R0913, R0917
+                 context : 'RenderedContext|None' = None, exception : 'LoggedException|None' = None):
+        self.__fill(level, msg, caller_info, module, fields, context, exception)
+
+    def __fill(self, level : Levels, msg : Message, caller_info : Callerinfo, module : 'Module|None', fields : Fields, #pylint: disable=R0913, R0917
+               context : 'RenderedContext|None', exception : 'LoggedException|None'):
+        self.level = level
+        self.msg = msg
+        self.caller_info = caller_info
+        self.module = module
+        self.fields = fields
+        self.context = context
+        self.exception = exception
+        self.time = time.time()
+        self.monotonic = time.monotonic()
+        self.sequence = next(_SEQUENCE)
+        self.pid = _PID[0]
+        self.process_name = mp.current_process().name
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.retained = False
+
+    @classmethod
+    def acquire(cls, level : Levels, msg : Message, caller_info : Callerinfo, module : 'Module|None', fields : Fields, #pylint: disable=R0913, R0917
+                context : 'RenderedContext|None' = None, exception : 'LoggedException|None' = None) -> 'LogRecord':
+        """
+        Get a record from the free list (or a new one if it is empty), filled with the given values and the current time, process and thread.
+        """
+        try:
+            record = cls.__free.pop()
+        except IndexError:
+            return cls(level, msg, caller_info, module, fields, context, exception)
+        record.__fill(level, msg, caller_info, module, fields, context, exception) #pylint: disable=W0212
+        return record
+
+    def retain(self):
+        """
+        Keep the record after the logging call: it will not be reused.
+        """
+        self.retained = True
+
+    def release(self):
+        """
+        Give the record back to the free list, unless it is retained; the message, fields, context and exception are dropped,
+        so they can be freed.
+        """
+        if self.retained or len(LogRecord.__free) >= MAX_FREE_RECORDS:
+            return
+        self.msg = self.fields = self.context = self.exception = self.module = None # type: ignore[assignment]
+        LogRecord.__free.append(self)
+
+    def __repr__(self) -> str:
+        return f"LogRecord(#{self.sequence}, {self.level.name}, {self.msg!r})"
@@ -0,0 +1,161 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+"""
+
+import mmap
+import os
+import struct
+from typing import Iterator
+
+# header: magic, capacity of the data region, write offset, wrap marker (1 once the data region was filled)
+HEADER = struct.Struct("<8sQQQ")
+MAGIC = b"GAMURING"
+
+# every record starts with this byte, which never appears in UTF-8 text
+RECORD_START = b"\xff"
+
+
+class RingFile:
+    """
+    A fixed-size log file used as a circular buffer.
+    The file is preallocated and mapped in memory; when it is full, the oldest records are overwritten.
+    It starts with a small header holding the write offset and the wrap marker,
+    so the records can be read back in chronological order with `read_ring_file`.
+
+    An existing ring file of the same size is reused (the new records follow the previous ones);
+    any other file is overwritten.
+    """
+    def __init__(self, path : str, size : int):
+        if size <= HEADER.size + 1:
+            raise ValueError(f"The size of a ring file must be larger than {HEADER.size + 1} bytes")
+        self.path = path
+        self.capacity = size - HEADER.size
+
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            reuse = os.fstat(fd).st_size == size and self.__is_ring_file(fd)
+            if not reuse:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+                if hasattr(os, "posix_fallocate"):
+                    os.posix_fallocate(fd, 0, size) # reserve the blocks now, so writing never fails for lack of space
+            self.__mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd) # the mapping stays valid
+
+        if reuse:
+            _, _, self.__offset, wrapped = HEADER.unpack_from(self.__mmap, 0)
+            self.__wrapped = bool(wrapped)
+        else:
+            self.__offset = 0
+            self.__wrapped = False
+            self.__write_header()
+
+    def __is_ring_file(self, fd : int) -> bool:
+        """
+        Check if an existing file is a valid ring file of this size.
+        """
+        os.lseek(fd, 0, os.SEEK_SET)
+        magic, capacity, offset, _ = HEADER.unpack(os.read(fd, HEADER.size))
+        return magic == MAGIC and capacity == self.capacity and offset < capacity
+
+    def __write_header(self):
+        HEADER.pack_into(self.__mmap, 0, MAGIC, self.capacity, self.__offset, int(self.__wrapped))
+
+    def __call__(self, string : str):
+        """
+        Append a record to the ring file, overwriting the oldest records if needed.
+        A record larger than the file is truncated.
+        """
+        self.__append(string)
+        self.__write_header()
+
+    def write_many(self, strings : list[str]):
+        """
+        Append several records to the ring file, updating the header once.
+        """
+        for string in strings:
+            self.__append(string)
+        self.__write_header()
+
+    def __append(self, string : str):
+        data = RECORD_START + string.encode("utf-8")
+        if len(data) > self.capacity:
+            data = data[:self.capacity]
+        start = HEADER.size + self.__offset
+        end = self.__offset + len(data)
+        if end <= self.capacity:
+            self.__mmap[start:start + len(data)] = data
+        else: # split the record around the end of the buffer
+            first = self.capacity - self.__offset
+            self.__mmap[start:start + first] = data[:first]
+            self.__mmap[HEADER.size:HEADER.size + len(data) - first] = data[first:]
+        if end >= self.capacity:
+            self.__wrapped = True
+        self.__offset = end % self.capacity
+
+    def flush(self):
+        """
+        Flush the mapped memory to the disk.
+        """
+        self.__mmap.flush()
+
+    def close(self):
+        """
+        Flush and unmap the ring file.
+        """
+        if not self.__mmap.closed:
+            self.__mmap.flush()
+            self.__mmap.close()
+
+    def records(self) -> list[str]:
+        """
+        Get the records currently stored in the ring file, oldest first.
+        """
+        return list(iter_records(self.__mmap))
+
+    def __del__(self):
+        try:
+            self.close()
+        except (AttributeError, ValueError): #pragma: no cover
+            pass
+
+
+def iter_records(buffer : bytes | mmap.mmap) -> Iterator[str]:
+    """
+    Yield the records of a ring file content (header included), oldest first.
+    """
+    magic, capacity, offset, wrapped = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a ring file")
+    data = bytes(buffer[HEADER.size:HEADER.size + capacity])
+    if wrapped:
+        # the oldest bytes are right after the write offset; the first record there may be partially overwritten
+        data = data[offset:] + data[:offset]
+        data = data[data.find(RECORD_START):] if RECORD_START in data else b""
+    else:
+        data = data[:offset]
+    for record in data.split(RECORD_START)[1:]:
+        yield record.decode("utf-8", errors="replace")
+
+
+def read_ring_file(path : str) -> list[str]:
+    """
+    Read the records of a ring file, oldest first.
+    """
+    with open(path, "rb") as f:
+        return list(iter_records(f.read()))
@@ -0,0 +1,202 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+"""
+
+import os
+import re
+import time
+
+from .regex import (RE_DAY, RE_HOUR, RE_MINUTE, RE_MONTH, RE_PID,
+                    RE_PLACEHOLDER, RE_SECOND, RE_YEAR)
+
+type Token = tuple[bool, str] # (is_field, value)
+
+# field name -> (format fragment applied to (struct_time, pid), regex of the field)
+FIELDS : dict[str, tuple[str, str]] = {
+    "year":     ("{0.tm_year:04d}", RE_YEAR),
+    "month":    ("{0.tm_mon:02d}",  RE_MONTH),
+    "day":      ("{0.tm_mday:02d}", RE_DAY),
+    "hour":     ("{0.tm_hour:02d}", RE_HOUR),
+    "minute":   ("{0.tm_min:02d}",  RE_MINUTE),
+    "second":   ("{0.tm_sec:02d}",  RE_SECOND),
+    "pid":      ("{1}",             RE_PID),
+}
+
+# placeholder name -> tokens it expands to
+PLACEHOLDERS : dict[str, tuple[Token, ...]] = {
+    "date":     ((True, "year"), (False, "-"), (True, "month"), (False, "-"), (True, "day")),
+    "time":     ((True, "hour"), (False, "-"), (True, "minute"), (False, "-"), (True, "second")),
+    "datetime": ((True, "year"), (False, "-"), (True, "month"), (False, "-"), (True, "day"), (False, "_"),
+                 (True, "hour"), (False, "-"), (True, "minute"), (False, "-"), (True, "second")),
+    **{name: ((True, name),) for name in FIELDS}
+}
+
+
+class FileSchema:
+    """
+    A file name schema, parsed once into a list of tokens.
+
+    The schema can contain the following placeholders:
+        - `${date}`: the current date in YYYY-MM-DD format
+        - `${time}`: the current time in HH-MM-SS format
+        - `${datetime}`: the current date and time in YYYY-MM-DD_HH-MM-SS format
+
+        - `${year}`: the current year in YYYY format
+        - `${month}`: the current month in MM format
+        - `${day}`: the current day in DD format
+
+        - `${hour}`: the current hour in HH format
+        - `${minute}`: the current minute in MM format
+        - `${second}`: the current second in SS format
+
+        - `${pid}`: the current process id
+
+    Any other `${...}` placeholder raises a ValueError.
+
+    The schema can contain directories, separated by `/` (e.g. `${year}/${month}/${day}/${hour}.log`);
+    placeholders can be used in directory names too.
+    """
+
+    def __init__(self, schema : str):
+        self.__schema = schema
+        self.__tokens = self.tokenize(schema)
+        self.__format = self.__build_format(self.__tokens)
+        self.__regex = self.__build_regex(self.__tokens)
+        self.__components = [self.__build_regex(component) for component in self.__split_components(self.__tokens)]
+        fields = {value for is_field, value in self.__tokens if is_field}
+        self.__dated = {"year", "month", "day"} <= fields
+
+    @staticmethod
+    def tokenize(schema : str) -> list[Token]:
+        """
+        Split a schema into a list of literal and field tokens.
+        Composite placeholders (`${date}`, `${time}`, `${datetime}`) are expanded into their fields.
+        """
+        tokens : list[Token] = []
+        position = 0
+        for match in RE_PLACEHOLDER.finditer(schema):
+            if match.start() > position:
+                tokens.append((False, schema[position:match.start()]))
+            name = match.group('name')
+            if name not in PLACEHOLDERS:
+                raise ValueError(f"Unknown placeholder in schema {schema!r}: ${{{name}}}")
+            tokens.extend(PLACEHOLDERS[name])
+            position = match.end()
+        if position < len(schema):
+            tokens.append((False, schema[position:]))
+        return tokens
+
+    @staticmethod
+    def __split_components(tokens : list[Token]) -> list[list[Token]]:
+        """
+        Split the tokens into path components, on the `/` of the literal tokens.
+        """
+        components : list[list[Token]] = [[]]
+        for is_field, value in tokens:
+            if is_field:
+                components[-1].append((True, value))
+                continue
+            parts = value.split("/")
+            if parts[0]:
+                components[-1].append((False, parts[0]))
+            for part in parts[1:]:
+                components.append([(False, part)] if part else [])
+        if any(not component or component in ([(False, ".")], [(False, "..")]) for component in components):
+            raise ValueError("Schema path components cannot be empty, '.' or '..'")
+        return components
+
+    @staticmethod
+    def __build_format(tokens : list[Token]) -> str:
+        return "".join(
+            FIELDS[value][0] if is_field else value.replace("{", "{{").replace("}", "}}")
+            for is_field, value in tokens
+        )
+
+    @staticmethod
+    def __build_regex(tokens : list[Token]) -> re.Pattern[str]:
+        pattern = ""
+        seen : set[str] = set()
+        for is_field, value in tokens:
+            if not is_field:
+                pattern += re.escape(value)
+            elif value in seen: # the same field appearing twice must hold the same value
+                pattern += f"(?P={value})"
+            else:
+                seen.add(value)
+                pattern += f"(?P<{value}>{FIELDS[value][1]})"
+        return re.compile(rf"\A{pattern}\Z")
+
+    @property
+    def tokens(self) -> list[Token]:
+        """
+        Get the tokens of the schema.
+        """
+        return list(self.__tokens)
+
+    @property
+    def regex(self) -> re.Pattern[str]:
+        """
+        Get the anchored regex matching the file names produced by the schema.
+        Each field is captured in a named group (`year`, `month`, `day`, `hour`, `minute`, `second`, `pid`).
+        """
+        return self.__regex
+
+    @property
+    def components(self) -> list[re.Pattern[str]]:
+        """
+        Get the anchored regexes matching each component of the paths produced by the schema
+        (the directories, then the file name).
+        """
+        return list(self.__components)
+
+    @property
+    def dated(self) -> bool:
+        """
+        True if the schema contains enough fields (year, month and day) to date a file from its name.
+        """
+        return self.__dated
+
+    def render(self, current_time : time.struct_time) -> str:
+        """
+        Render the file name for the given time, relative to the log folder and using `/` as separator.
+        """
+        return self.__format.format(current_time, os.getpid())
+
+    def match(self, name : str) -> re.Match[str] | None:
+        """
+        Match a file name against the schema.
+        """
+        return self.__regex.match(name)
+
+    def timestamp(self, name : str) -> float | None:
+        """
+        Get the timestamp encoded in a file name, in seconds since the epoch.
+        Return None if the name does not match the schema or if the schema is not dated.
+        """
+        if not self.__dated:
+            return None
+        match = self.__regex.match(name)
+        if match is None:
+            return None
+        groups = match.groupdict()
+        return time.mktime((
+            int(groups["year"]), int(groups["month"]), int(groups["day"]),
+            int(groups.get("hour") or 0), int(groups.get("minute") or 0), int(groups.get("second") or 0),
+            0, 0, -1
+        ))
+
+    def __str__(self) -> str:
+        return self.__schema
+
+    def __repr__(self) -> str:
+        return f"FileSchema({self.__schema!r})"
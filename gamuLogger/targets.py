@@ -13,17 +13,198 @@ Antoine Buirey 2025
 """
 
 import os
+import re
+import socket
 import sys
 import threading
 import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 
+from .binary import BinaryWriter
 from .condition import (AgeCondition, NbFilesCondition, SizeCondition,
-                        condition_factory)
+                        TotalSizeCondition, condition_factory)
+from .custom_types import Levels
+from .database import SqliteWriter
+from .filters import CustomPredicate, FilterRule, compile_filters
+from .jsonl import FORMATS
+from .network import Address, HttpWriter, SocketWriter
+from .raw_terminal import FdWriter, FlushPolicy
+from .record import LogRecord
+from .ring_file import RingFile
+from .schema import FileSchema
+from .utils import supports_color
+
+try:
+    import fcntl
+except ImportError: #pragma: no cover
+    fcntl = None # not available on Windows
+
+
+class RetentionIndex:
+    """
+    Index of the log files of a folder matching a schema, sorted by age (oldest first).
+    It keeps the creation time and the size of each file, and the total size of the folder.
+    The folder is scanned once; the writer then keeps the index up to date as it appends, rotates and deletes.
+    """
+    def __init__(self, folder : str, schema : FileSchema):
+        self.folder = folder
+        self.schema = schema
+        self.__files : dict[str, list[float]] = {} # name -> [creation time, size], oldest first
+        self.__total_size = 0
+        self.refresh()
+
+    def refresh(self):
+        """
+        Rebuild the index from the content of the folder.
+        """
+        entries : list[tuple[float, str, int]] = []
+        for entry, name in self.__walk(self.folder, 0, ""):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError: #pragma: no cover
+                continue # deleted since the listing
+            timestamp = self.schema.timestamp(name)
+            entries.append((stat.st_ctime if timestamp is None else timestamp, name, stat.st_size))
+        entries.sort()
+        self.__files = {name: [creation_time, size] for creation_time, name, size in entries}
+        self.__total_size = sum(size for _, _, size in entries)
+
+    def __walk(self, directory : str, depth : int, prefix : str) -> Iterator[tuple[os.DirEntry[str], str]]:
+        """
+        Yield the files matching the schema, with their name relative to the folder.
+        Only the directories matching the corresponding component of the schema are visited.
+        """
+        components = self.schema.components
+        is_last = depth == len(components) - 1
+        try:
+            it = os.scandir(directory)
+        except FileNotFoundError: #pragma: no cover
+            return # deleted since the listing
+        with it:
+            for entry in it:
+                if not components[depth].match(entry.name):
+                    continue
+                name = prefix + entry.name
+                if not is_last:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self.__walk(entry.path, depth + 1, name + "/")
+                elif self.schema.match(name) and entry.is_file():
+                    yield entry, name
+
+    def add(self, name : str, creation_time : float, size : int = 0):
+        """
+        Add a file to the index. Nothing is done if the file is already indexed.
+        """
+        if name in self.__files:
+            return
+        newest = next(reversed(self.__files.values()), None)
+        self.__files[name] = [creation_time, size]
+        self.__total_size += size
+        if newest is not None and creation_time < newest[0]: # keep the index sorted (e.g. clock set back)
+            self.__files = dict(sorted(self.__files.items(), key=lambda item: (item[1][0], item[0])))
+
+    def grow(self, name : str, size : int):
+        """
+        Account for `size` bytes appended to a file of the index.
+        """
+        self.__files[name][1] += size
+        self.__total_size += size
+
+    def remove(self, name : str):
+        """
+        Remove a file from the index.
+        """
+        _, size = self.__files.pop(name)
+        self.__total_size -= int(size)
 
-from.utils import schema2regex
+    def files(self) -> list[str]:
+        """
+        Get the names of the indexed files, oldest first.
+        """
+        return list(self.__files)
+
+    def creation_time(self, name : str) -> float:
+        """
+        Get the creation time of an indexed file.
+        """
+        return self.__files[name][0]
+
+    def size(self, name : str) -> int:
+        """
+        Get the size of an indexed file, in bytes.
+        """
+        return int(self.__files[name][1])
 
+    @property
+    def total_size(self) -> int:
+        """
+        Get the total size of the indexed files, in bytes.
+        """
+        return self.__total_size
+
+    def __contains__(self, name : str) -> bool:
+        return name in self.__files
+
+    def __len__(self) -> int:
+        return len(self.__files)
+
+
+class FolderLock:
+    """
+    An advisory lock (`fcntl.flock`) on a lock file of a folder, used to coordinate the processes writing in it.
+    The lock file also records the name of the file currently written, so all the processes write in the same one.
+    Only available on POSIX systems.
+    """
+    FILE_NAME = ".gamuLogger.lock"
+
+    def __init__(self, folder : str):
+        if fcntl is None: #pragma: no cover
+            raise OSError("Shared log folders require fcntl, which is not available on this platform")
+        self.path = os.path.join(folder, FolderLock.FILE_NAME)
+        self.__pid = -1
+        self.__fd = -1
+        self.__open()
+
+    def __open(self):
+        """
+        Open the lock file. Locks are bound to the open file, so a forked process must reopen it.
+        """
+        if self.__fd >= 0:
+            os.close(self.__fd)
+        self.__fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.__pid = os.getpid()
+
+    def acquire(self, exclusive : bool = False):
+        """
+        Acquire the lock, shared (writing) or exclusive (rotating and deleting files).
+        """
+        if self.__pid != os.getpid():
+            self.__open()
+        fcntl.flock(self.__fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) # type: ignore[union-attr]
+
+    def release(self):
+        """
+        Release the lock.
+        """
+        fcntl.flock(self.__fd, fcntl.LOCK_UN) # type: ignore[union-attr]
+
+    def read(self) -> str:
+        """
+        Read the name of the current file recorded in the lock file.
+        """
+        return os.pread(self.__fd, 4096, 0).decode("utf-8")
+
+    def write(self, name : str):
+        """
+        Record the name of the current file in the lock file. The exclusive lock must be held.
+        """
+        data = name.encode("utf-8")
+        os.ftruncate(self.__fd, 0)
+        os.pwrite(self.__fd, data, 0)
 
 
 class WriteToFile: #pylint: disable=R0903
@@ -31,15 +212,14 @@ class WriteToFile: #pylint: disable=R0903
     A class that writes to a file based on a schema.
     See the docstring of Target.from_file_schema for more details.
     """
-    def __init__(self, folder : str, schema : str, switch_condition : tuple[str], delete_condition : tuple[str]):
+    def __init__(self, folder : str, schema : str, switch_condition : tuple[str], delete_condition : tuple[str], shared : bool = False): #pylint: disable=R0913, R0917
         self.folder = folder
 
         # create the folder if it does not exist
-        if not os.path.exists(self.folder): #pragma: no cover
-            os.makedirs(self.folder, exist_ok=True)
+        os.makedirs(self.folder, exist_ok=True)
 
-        self.schema = schema
-        self.schema_regex = schema2regex(self.schema)
+        self.schema = FileSchema(schema)
+        self.current_name = "" # relative to the folder, `/` separated
         self.current_file = ""
         self.__create_new_file()
 
@@ -47,101 +227,238 @@ class WriteToFile: #pylint: disable=R0903
 
         self.delete_condition = [condition_factory(condition) for condition in delete_condition]
 
+        self.index = RetentionIndex(self.folder, self.schema)
+
+        self.lock = FolderLock(self.folder) if shared else None
+        if self.lock is not None:
+            self.lock.acquire(exclusive=True)
+            try:
+                self.__switch_shared_file()
+            finally:
+                self.lock.release()
+
     def __create_new_file(self):
         """
         Create a new file based on the schema and the current time.
         """
-        # get the current time
-        current_time = time.localtime()
-        # create the file name based on the schema
-        file_name = self.schema.replace("${date}", f"{current_time.tm_year}-{current_time.tm_mon:02d}-{current_time.tm_mday:02d}")
-        file_name = file_name.replace("${time}", f"{current_time.tm_hour:02d}-{current_time.tm_min:02d}-{current_time.tm_sec:02d}")
-        file_name = file_name.replace("${datetime}", f"{current_time.tm_year}-{current_time.tm_mon:02d}-{current_time.tm_mday:02d}_{current_time.tm_hour:02d}-{current_time.tm_min:02d}-{current_time.tm_sec:02d}")
+        self.__set_current_file(self.schema.render(time.localtime()))
 
-        file_name = file_name.replace("${year}", str(current_time.tm_year))
-        file_name = file_name.replace("${month}", f"{current_time.tm_mon:02d}")
-        file_name = file_name.replace("${day}", f"{current_time.tm_mday:02d}")
-
-        file_name = file_name.replace("${hour}", f"{current_time.tm_hour:02d}")
-        file_name = file_name.replace("${minute}", f"{current_time.tm_min:02d}")
-        file_name = file_name.replace("${second}", f"{current_time.tm_sec:02d}")
-        file_name = file_name.replace("${pid}", str(os.getpid()))
-
-        # create the full path for the file
-        self.current_file = os.path.join(self.folder, file_name)
+    def __set_current_file(self, name : str):
+        """
+        Set the current file from its name relative to the folder.
+        """
+        self.current_name = name
+        self.current_file = os.path.join(self.folder, name)
 
     def __get_log_files_by_age(self) -> list[str]:
         """
-        Return the list of files in the folder that match the schema and are older than the current file.
+        Return the list of files in the folder that match the schema, sorted by age (oldest first).
         """
-        # get the list of files in the folder
-        files = os.listdir(self.folder)
-        # filter the files that match the schema
-        files = [file for file in files if self.schema_regex.match(file)]
-        # sort the files by age (oldest first)
-        files.sort(key=lambda x: os.path.getctime(os.path.join(self.folder, x)))
-        return files
+        return self.index.files()
 
-    def __is_outdated(self) -> bool:
+    def __get_creation_time(self, name : str) -> float:
         """
-        Check if the file is outdated based on the switch condition.
+        Return the creation time of a file, from the index if it is known, otherwise from the file system.
         """
-        if not os.path.exists(self.current_file):
+        if name in self.index:
+            return self.index.creation_time(name)
+        timestamp = self.schema.timestamp(name)
+        if timestamp is None:
+            return os.path.getctime(os.path.join(self.folder, name))
+        return timestamp
+
+    def __is_outdated(self, name : str|None = None) -> bool:
+        """
+        Check if the file (the current one by default) is outdated based on the switch condition.
+        """
+        if name is None:
+            name = self.current_name
+        file = os.path.join(self.folder, name)
+        if not os.path.exists(file):
             return True
 
         for condition in self.switch_condition:
             if isinstance(condition, AgeCondition):
-                if condition(os.path.getctime(self.current_file)):
+                if condition(time.time() - self.__get_creation_time(name)):
                     return True
             elif isinstance(condition, SizeCondition):
-                if condition(os.path.getsize(self.current_file)):
+                if condition(os.path.getsize(file)):
                     return True
             elif isinstance(condition, NbFilesCondition):
                 raise ValueError("NbFilesCondition is not supported for switching")
+            elif isinstance(condition, TotalSizeCondition):
+                raise ValueError("TotalSizeCondition is not supported for switching")
             else: # pragma: no cover
                 raise ValueError(f"Unknown condition type: {type(condition)}")
         return False
 
     def __delete_excess_files(self) -> None:
         """
-        Delete the files that exceed the limit.
+        Delete the files that exceed the limit. The current file is never deleted.
         """
         oldest_files = self.__get_log_files_by_age()
+        current_file = self.current_name
         to_delete: set[str] = set()
 
         for condition in self.delete_condition:
             if isinstance(condition, NbFilesCondition):
-                while condition(len(oldest_files)):
-                    to_delete.add(oldest_files.pop(0))  # Delete oldest files first
+                nb_files = len(oldest_files) - len(to_delete)
+                for file in oldest_files: # Delete oldest files first
+                    if not condition(nb_files):
+                        break
+                    if file not in to_delete and file != current_file:
+                        to_delete.add(file)
+                        nb_files -= 1
             elif isinstance(condition, AgeCondition):
                 for file in oldest_files:
-                    edit_date = os.path.getctime(os.path.join(self.folder, file))
-                    age = time.time() - edit_date
-                    if condition(age):
+                    age = time.time() - self.index.creation_time(file)
+                    if condition(age) and file != current_file:
                         to_delete.add(file)
+            elif isinstance(condition, TotalSizeCondition):
+                total_size = self.index.total_size - sum(self.index.size(file) for file in to_delete)
+                for file in oldest_files: # Delete oldest files first
+                    if not condition(total_size):
+                        break
+                    if file not in to_delete and file != current_file:
+                        to_delete.add(file)
+                        total_size -= self.index.size(file)
             elif isinstance(condition, SizeCondition):
                 raise ValueError("SizeCondition is not supported for deletion")
 
         # Delete the files
         for file in to_delete:
-            os.remove(os.path.join(self.folder, file))
+            try:
+                os.remove(os.path.join(self.folder, file))
+            except FileNotFoundError: #pragma: no cover
+                pass # already deleted by someone else
+            self.index.remove(file)
+            self.__prune_directories(file)
+
+    def __prune_directories(self, name : str):
+        """
+        Remove the directories of a deleted file that are now empty, up to the folder.
+        """
+        directory = os.path.dirname(name)
+        while directory:
+            try:
+                os.rmdir(os.path.join(self.folder, directory))
+            except OSError:
+                return # not empty
+            directory = os.path.dirname(directory)
+
+    def __switch_shared_file(self):
+        """
+        Switch to the file shared by all the processes writing in the folder.
+        If another process already switched to a new file, this file is reused;
+        otherwise a new file is created and recorded, and the excess files are deleted.
+        Must be called with the exclusive lock held.
+        """
+        assert self.lock is not None
+        recorded = self.lock.read()
+        if recorded:
+            recorded_file = os.path.join(self.folder, recorded)
+            if recorded != self.current_name and not (os.path.exists(recorded_file) and self.__is_outdated(recorded)):
+                self.__set_current_file(recorded) # another process already switched
+                return
+        self.__create_new_file()
+        self.lock.write(self.current_name)
+        self.index.refresh() # the other processes wrote in the folder too
+        self.__delete_excess_files()
+
+    def __write(self, string : str):
+        """
+        Append the string to the current file and account for the written bytes.
+        Batches are written joined, with a single write.
+        """
+        try:
+            f = open(self.current_file, 'a', encoding="utf-8") #pylint: disable=R1732
+        except FileNotFoundError: # the directories of the file are created lazily
+            os.makedirs(os.path.dirname(self.current_file), exist_ok=True)
+            f = open(self.current_file, 'a', encoding="utf-8") #pylint: disable=R1732
+        with f:
+            f.write(string)
+
+        name = self.current_name
+        if name not in self.index:
+            self.index.add(name, self.schema.timestamp(name) or time.time())
+        self.index.grow(name, len(string) if string.isascii() else len(string.encode("utf-8")))
 
     def __call__(self, string : str):
         """
         Write the string to the file.
         If the file is outdated, create a new file.
         """
+        if self.lock is not None:
+            self.__call_shared(string)
+            return
+
         # check if the file is outdated
         if self.__is_outdated():
             self.__create_new_file()
 
         # write the string to the file
-        with open(self.current_file, 'a', encoding="utf-8") as f:
-            f.write(string)
+        self.__write(string)
 
         # delete the excedent files
         self.__delete_excess_files()
 
+    def write_many(self, strings : list[str]):
+        """
+        Write several strings at once: the switch and delete conditions are checked once for the whole batch.
+        """
+        self("".join(strings))
+
+    def __call_shared(self, string : str):
+        """
+        Write the string to the file shared with the other processes.
+        Writes hold the shared lock; only the process that switches file takes the exclusive lock,
+        so no file is switched or deleted while another process writes in it.
+        """
+        assert self.lock is not None
+        self.lock.acquire()
+        try:
+            if self.__is_outdated():
+                self.lock.release()
+                self.lock.acquire(exclusive=True)
+                self.__switch_shared_file()
+            self.__write(string)
+        finally:
+            self.lock.release()
+
+
+class FlightRecorder:
+    """
+    Keep the last log records in memory, without formatting them,
+    and dump them to a downstream target when a record reaches the trigger level.
+    See the docstring of Target.from_flight_recorder for more details.
+    """
+    def __init__(self, downstream : 'Target', size : int = 1000, trigger : Levels = Levels.ERROR):
+        if size <= 0:
+            raise ValueError("The size of a flight recorder must be positive")
+        self.downstream = downstream
+        self.trigger = trigger
+        self.__records : deque[LogRecord] = deque(maxlen=size)
+        self.__lock = threading.Lock()
+
+    def record(self, record : LogRecord):
+        """
+        Keep a record, dropping the oldest one if the recorder is full.
+        """
+        with self.__lock:
+            self.__records.append(record)
+
+    def drain(self) -> list[LogRecord]:
+        """
+        Get the kept records, oldest first, and forget them.
+        """
+        with self.__lock:
+            records = list(self.__records)
+            self.__records.clear()
+        return records
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
 
 class TerminalTarget(Enum):
     """
@@ -172,18 +489,23 @@ class TerminalTarget(Enum):
 class Target:
     """
     A class that represents a target for the logger.
+    The `color` attribute tells if the logs are written with ANSI colors: terminal targets are colored
+    when their stream is a terminal (unless `NO_COLOR` is set, or if `FORCE_COLOR` is set), other targets are not.
     """
-    __instances : dict[str, 'Target'] = {}
-    __lock = threading.Lock()
-
     class Type(Enum):
         """
         Enum for the target types.
         - FILE: file target (a function that takes a string as input and writes it to a file)
         - TERMINAL: terminal target (sys.stdout or sys.stderr)
+        - RECORDER: flight recorder (keeps the raw records, and dumps them to another target)
+        - DATABASE: SQLite database (stores the records as rows instead of formatted strings)
+        - BINARY: binary log file (stores the records as rows, in the compact binary format)
         """
         FILE = 20
         TERMINAL = 21
+        RECORDER = 22
+        DATABASE = 23
+        BINARY = 24
 
         def __str__(self) -> str:
             match self:
@@ -191,42 +513,66 @@ class Target:
                     return 'file'
                 case Target.Type.TERMINAL:
                     return 'terminal'
+                case Target.Type.RECORDER:
+                    return 'recorder'
+                case Target.Type.DATABASE:
+                    return 'database'
+                case Target.Type.BINARY:
+                    return 'binary'
+
+    _registry : 'TargetRegistry|None' = None # set by the registry the target is published in
 
     def __new__(cls, target : Callable[[str], None] | TerminalTarget, name : str|None = None):
         if name is None:
             if isinstance(target, TerminalTarget):
                 name = name if name is not None else str(target)
+            elif isinstance(target, FlightRecorder):
+                name = f"recorder:{target.downstream.name}"
+            elif isinstance(target, (SqliteWriter, BinaryWriter)):
+                name = target.path
             elif callable(target):
                 name = target.__name__
             else:
                 raise ValueError("The target must be a function or a TerminalTarget; use Target.from_file(file) to create a file target")
-        with cls.__lock: # prevent multiple threads to create the same target
-            if name in cls.__instances:
-                return cls.__instances[name]
-            instance = super().__new__(cls)
-            cls.__instances[name] = instance
-        return instance
+        return TargetRegistry.current().setdefault(name, lambda: super(Target, cls).__new__(cls)) # prevent multiple threads to create the same target
 
     def __init__(self, target : Callable[[str], None] | TerminalTarget, name : str|None = None):
 
         if isinstance(target, TerminalTarget):
-            match target:
-                case TerminalTarget.STDOUT:
-                    self.target = sys.stdout.write
-                case TerminalTarget.STDERR:
-                    self.target = sys.stderr.write
+            stream = sys.stdout if target == TerminalTarget.STDOUT else sys.stderr
+            self.target = stream.write
+            self.color = supports_color(stream) # detected once, when the target is registered
             self.__type = Target.Type.TERMINAL
             self.__name = name if name is not None else str(target)
+        elif isinstance(target, FlightRecorder):
+            self.__type = Target.Type.RECORDER
+            self.__name = name if name is not None else f"recorder:{target.downstream.name}"
+            self.target = target
+            self.color = False
+        elif isinstance(target, SqliteWriter):
+            self.__type = Target.Type.DATABASE
+            self.__name = name if name is not None else target.path
+            self.target = target
+            self.color = False
+        elif isinstance(target, BinaryWriter):
+            self.__type = Target.Type.BINARY
+            self.__name = name if name is not None else target.path
+            self.target = target
+            self.color = False
         elif callable(target):
             self.__type = Target.Type.FILE
             self.__name = name if name is not None else target.__name__
             self.target = target
+            self.color = False
         else:
             raise ValueError("The target must be a function or a TerminalTarget; use Target.from_file(file) to create a file target")
 
 
         self.properties : dict[str, Any] = {}
+        self.__filters : list[FilterRule] = []
+        self.__format = "text"
         self.__lock = threading.Lock()
+        self.__republish() # the properties (and the level) of an existing target are reset
 
     @classmethod
     def from_file(cls, file : str) -> 'Target':
@@ -238,6 +584,12 @@ class Target:
             with open(file, 'a', encoding="utf-8") as f:
                 f.write(string)
 
+        def write_many(strings : list[str]):
+            with open(file, 'a', encoding="utf-8") as f:
+                f.write("".join(strings)) # a single write for the whole batch
+
+        write_to_file.write_many = write_many # type: ignore[attr-defined]
+
         dirname = os.path.dirname(file)
         if dirname:
             os.makedirs(dirname, exist_ok=True)
@@ -250,7 +602,8 @@ class Target:
     def from_file_schema(cls,
             folder : str, schema : str = "${date}_${hour}-${minute}.log",
             switch_condition : tuple[str] = ("age > 1 hour",),
-            delete_condition : tuple[str] = ("nb_files >= 5",)
+            delete_condition : tuple[str] = ("nb_files >= 5",),
+            shared : bool = False
         )-> 'Target':
         """create a Target to write logs in files where the name is based on a schema
 
@@ -269,6 +622,13 @@ class Target:
 
         - `${pid}`: the current process id
 
+        Any other `${...}` placeholder raises a ValueError.
+        If the schema contains the date, the age of the files is read from their name instead of the file system.
+
+        The schema can contain directories, separated by `/`, with placeholders in their names
+        (e.g. `${year}/${month}/${day}/${hour}.log`). They are created when the first log is written in them,
+        and removed when their last file is deleted.
+
         The switch condition can be:
         - `age > x unit`: the file will be created if it is older than x unit (e.g. `age > 1 hour`)
         - `size > x unit`: the file will be created if it is larger than x unit (e.g. `size > 1 MB`)
@@ -280,28 +640,255 @@ class Target:
         The delete condition can be:
         - `age > x unit`: the file will be deleted if it is older than x unit (e.g. `age > 1 hour`)
         - `nb_files > x`: the file will be deleted if there are more than x files in the folder (e.g. `nb_files > 5`)
+        - `total_size > x unit`: files will be deleted while the total size of the log files is larger than x unit (e.g. `total_size > 10 GB`)
         If multiple condition are provided, the file will be deleted if any of them is true. (OR condition)
         Operators allowed : `>`, `>=`, `==`
-        To fullfill the `nb_files` condition, older files will be deleted first.
+        To fullfill the `nb_files` and `total_size` conditions, older files will be deleted first.
+        The file currently written is never deleted.
+        The size of the folder is scanned once, then maintained as the logs are written, rotated and deleted.
+
+        If several processes write in the same folder, set `shared` to True (POSIX only).
+        The processes then coordinate through advisory locks on a `.gamuLogger.lock` file in the folder:
+        they all write in the same file, and only one of them switches to a new file and deletes the excess files,
+        while no other process is writing. In this mode, the delete conditions are applied when the file is switched.
 
         Args:
             folder (str): folder where the files will be created
             schema (str): schema for the file name. The default is "${date}_${hour}-${minute}.log".
             switch_condition (str): condition to switch the file. The default is "age > 1 hour".
             delete_condition (str): condition to delete the file. The default is "nb_files > 5".
+            shared (bool): coordinate with the other processes writing in the same folder. The default is False.
 
         Returns:
             Target: a Target instance that writes to the file specified by the schema
         """
 
-        write_to_file = WriteToFile(folder, schema, switch_condition, delete_condition)
+        write_to_file = WriteToFile(folder, schema, switch_condition, delete_condition, shared)
 
         return cls(write_to_file, folder)
 
+    @classmethod
+    def from_flight_recorder(cls, downstream : 'Target', size : int = 1000, trigger : Levels = Levels.ERROR) -> 'Target':
+        """
+        Create a Target that keeps the last `size` log records in memory, without formatting them.
+        When a record reaches the `trigger` level, the kept records (including this one) are formatted
+        and written to the `downstream` target in one batch, then forgotten.
+
+        The level of the recorder (set with Logger.add_target) is the level of the records it keeps,
+        so it can keep the TRACE and DEBUG context of an error while the other targets log at INFO.
+        The downstream target is removed from the logger targets: it only receives the dumps.
+
+        Args:
+            downstream (Target): the target the records are dumped to
+            size (int): the number of records to keep. The default is 1000.
+            trigger (Levels): the level of the records that trigger a dump. The default is ERROR.
+
+        Returns:
+            Target: a Target instance that records the logs
+        """
+        if Target.exist(downstream.name):
+            Target.unregister(downstream)
+        return cls(FlightRecorder(downstream, size, trigger))
+
+    @classmethod
+    def from_ring_file(cls, path : str, size : int) -> 'Target':
+        """
+        Create a Target writing in a fixed-size file used as a circular buffer.
+        The file is preallocated to `size` bytes and mapped in memory: writing a log is a memory copy,
+        the file is never reopened nor rotated, and the oldest logs are overwritten when it is full.
+        Use `gamuLogger.read_ring_file(path)` to read the logs back, oldest first.
+
+        Args:
+            path (str): path of the file
+            size (int): size of the file, in bytes (including a 32 bytes header)
+
+        Returns:
+            Target: a Target instance that writes to the ring file
+        """
+        return cls(RingFile(path, size), path)
+
+    @classmethod
+    def from_raw_terminal(cls,
+            terminal : TerminalTarget = TerminalTarget.STDOUT,
+            flush : FlushPolicy = FlushPolicy.LINE,
+            buffer_size : int = 65536,
+            flush_interval : float = 1.0
+        ) -> 'Target':
+        """
+        Create a terminal Target writing directly to the file descriptor of stdout or stderr,
+        bypassing the text layer of sys.stdout and sys.stderr: each log is encoded once in UTF-8,
+        appended to the target own buffer, and written with os.write according to the flush policy:
+        - FlushPolicy.LINE: every log is written as soon as it is logged (one system call per log)
+        - FlushPolicy.SIZE: the buffer is written when it holds `buffer_size` bytes, and at exit
+        - FlushPolicy.TIME: the buffer is written every `flush_interval` seconds (by a background thread),
+          when it holds `buffer_size` bytes, and at exit
+        Partial writes are resumed, and a non-blocking output (EAGAIN) is waited for, so no log is lost.
+
+        The target has the same name as the regular terminal target (`stdout` or `stderr`): if it is registered,
+        its writer is swapped under its lock, and its configuration (level, filters, limiter, collapsing, format, color) is kept;
+        sys.stdout/sys.stderr and the logs buffered by a previous raw writer are written first.
+        Otherwise, the new target has the default level of `Logger.add_target` (INFO).
+        Text printed with `print` is not ordered with the buffered logs.
+
+        Args:
+            terminal (TerminalTarget): the terminal to write to. The default is STDOUT.
+            flush (FlushPolicy): when the buffer is written. The default is LINE.
+            buffer_size (int): the size of the buffer, in bytes. The default is 64 KiB.
+            flush_interval (float): the interval between two writes with the TIME policy, in seconds. The default is 1 second.
+
+        Returns:
+            Target: a terminal Target instance that writes to the file descriptor
+        """
+        stream = sys.stdout if terminal == TerminalTarget.STDOUT else sys.stderr
+        target = cls.get(terminal) if cls.exist(terminal) else None
+        if target is None or target.type != Target.Type.TERMINAL:
+            target = cls(terminal)
+            target["level"] = Levels.INFO
+        with target.__lock: # the writes in progress end on the previous writer
+            stream.flush()
+            previous = target.target
+            if isinstance(previous, FdWriter):
+                previous.drain() # before the new writer writes, to keep the logs in order
+            target.target = FdWriter(stream.fileno(), flush, buffer_size, flush_interval, target.__lock) # the target lock serializes the writes and the flushes
+        if isinstance(previous, FdWriter):
+            previous.close() # stop its flusher; its buffer is already written
+        return target
+
+    @classmethod
+    def from_sqlite(cls, path : str, batch_size : int = 500, flush_interval : float = 1.0) -> 'Target':
+        """
+        Create a Target storing the log records in a SQLite database, to query them with `gamuLogger.query`.
+        Each record is a row of the `logs` table: timestamp, level, module (complete name, e.g. `app.db`),
+        pid, process name, thread name and message; the table is indexed on the time, the level and the module.
+
+        The database is in WAL mode, so it can be queried while the logs are written.
+        The records are inserted in batches, each in a single transaction: when `batch_size` records are pending,
+        at least every `flush_interval` seconds, and at exit. Call `target.target.flush()` to insert them now.
+
+        Args:
+            path (str): path of the database file (created if it does not exist)
+            batch_size (int): the number of records inserted per transaction. The default is 500.
+            flush_interval (float): the maximum time a record waits before being inserted, in seconds. The default is 1 second.
+
+        Returns:
+            Target: a Target instance that stores the records in the database
+        """
+        writer = SqliteWriter(path, batch_size, flush_interval)
+        target = cls(writer, path)
+        writer.lock = target.__lock # the target lock serializes the writes and the flushes
+        return target
+
+    @classmethod
+    def from_binary_file(cls, path : str) -> 'Target':
+        """
+        Create a Target writing the log records to a file in a compact binary format:
+        the module, process and thread names and the repeated messages are written once per file, in a dictionary,
+        and referenced by their id; the timestamps are stored as varint differences.
+        The file is cleared when the target is created.
+        Use `python -m gamuLogger.decode path` to render it as text or JSON lines,
+        or `gamuLogger.binary.read_binary_file(path)` to read the records.
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            Target: a Target instance that writes to the binary file
+        """
+        return cls(BinaryWriter(path), path)
+
+    @classmethod
+    def from_socket(cls, address : Address, kind : int = socket.SOCK_STREAM, #pylint: disable=R0913, R0917
+            batch_size : int = 65536, flush_interval : float = 1.0, spool_size : int = 1 << 20,
+            max_backoff : float = 30.0
+        ) -> 'Target':
+        """
+        Create a Target sending the logs to a collector over a socket.
+        The address is the path of a Unix socket, or a (host, port) tuple for TCP/UDP.
+
+        The connection is kept open, and the logs are sent in batches by a background thread:
+        when `batch_size` bytes are waiting, and at least every `flush_interval` seconds.
+        While the collector cannot be reached, the logs are kept in memory (at most `spool_size` bytes,
+        the oldest are dropped first), and the connection is retried with an exponential backoff, up to `max_backoff` seconds.
+        Call `target.target.flush()` to wait until the logs are sent.
+
+        Args:
+            address (str | tuple[str, int]): the path of a Unix socket, or a (host, port) tuple
+            kind (int): socket.SOCK_STREAM (TCP or Unix stream) or socket.SOCK_DGRAM (UDP or Unix datagram). The default is SOCK_STREAM.
+            batch_size (int): the size of the batches, in bytes. The default is 64 KiB.
+            flush_interval (float): the maximum time a log waits before being sent, in seconds. The default is 1 second.
+            spool_size (int): the maximum size of the logs kept while disconnected, in bytes. The default is 1 MiB.
+            max_backoff (float): the maximum delay between two connection attempts, in seconds. The default is 30 seconds.
+
+        Returns:
+            Target: a Target instance that sends the logs to the socket
+        """
+        writer = SocketWriter(address, kind, batch_size, flush_interval, spool_size, max_backoff)
+        return cls(writer, str(writer))
+
+    @classmethod
+    def from_http(cls, url : str, payload : str = "ndjson", compress : bool = True, #pylint: disable=R0913, R0917
+            batch_size : int = 1 << 20, flush_interval : float = 5.0, spool_size : int = 8 << 20,
+            max_retries : int | None = 5, max_backoff : float = 60.0, drop : str = "oldest",
+            headers : dict[str, str] | None = None
+        ) -> 'Target':
+        """
+        Create a Target POSTing the logs to an HTTP(S) endpoint.
+
+        The logs are sent in batches by a background thread, so logging never waits for the network:
+        when `batch_size` bytes are waiting, and at least every `flush_interval` seconds.
+        The connection is kept alive between the requests. The body of a request is the batch of logs,
+        as newline-delimited text (`payload="ndjson"`) or as a JSON array of records (`payload="json"`: the format
+        of the target is set to `jsonl`, and each record is an object of the array), gzip-compressed unless `compress` is False.
+
+        When the endpoint is down (connection error, status 429 or 5xx), a batch is retried with an exponential backoff
+        (up to `max_backoff` seconds), at most `max_retries` times, then dropped. Meanwhile, the logs are kept in memory,
+        up to `spool_size` bytes: beyond, the `oldest` or the `newest` logs are dropped, according to `drop`.
+        A batch answered with another error status (e.g. 400) is dropped at once.
+        Call `target.target.flush()` to wait until the logs are sent.
+
+        Args:
+            url (str): the URL of the endpoint (http:// or https://)
+            payload (str): "ndjson" or "json". The default is "ndjson".
+            compress (bool): gzip the requests. The default is True.
+            batch_size (int): the size of the batches, in bytes (before compression). The default is 1 MiB.
+            flush_interval (float): the maximum time a log waits before being sent, in seconds. The default is 5 seconds.
+            spool_size (int): the maximum size of the logs waiting to be sent, in bytes. The default is 8 MiB.
+            max_retries (int|None): the number of retries of a batch before it is dropped, None to retry forever. The default is 5.
+            max_backoff (float): the maximum delay between two attempts, in seconds. The default is 60 seconds.
+            drop (str): the logs dropped when the spool is full, "oldest" or "newest". The default is "oldest".
+            headers (dict[str, str]|None): additional headers of the requests (e.g. an authorization token).
+
+        Returns:
+            Target: a Target instance that sends the logs to the endpoint
+        """
+        writer = HttpWriter(url, payload, compress, batch_size, flush_interval, spool_size, max_backoff, max_retries, drop, headers)
+        target = cls(writer, url)
+        if payload == "json":
+            target.format = "jsonl"
+        return target
+
     def __call__(self, string : str):
         with self.__lock: # prevent multiple threads to write at the same time
             self.target(string)
 
+    def write_many(self, strings : list[str]):
+        """
+        Write several strings with a single lock acquisition.
+        If the underlying callable has a `write_many(strings)` method, it is called once with the whole batch;
+        terminal targets write the joined batch at once; other callables are called once per string.
+        """
+        if not strings:
+            return
+        with self.__lock:
+            write_many = getattr(self.target, "write_many", None)
+            if write_many is not None:
+                write_many(strings)
+            elif self.__type == Target.Type.TERMINAL:
+                self.target("".join(strings))
+            else:
+                for string in strings:
+                    self.target(string)
+
     def __str__(self) -> str:
         return self.__name
 
@@ -313,9 +900,21 @@ class Target:
 
     def __setitem__(self, key: str, value: Any):
         self.properties[key] = value
+        if key == "level":
+            self.__republish()
 
     def __delitem__(self, key: str):
         del self.properties[key]
+        if key == "level":
+            self.__republish()
+
+    def __republish(self):
+        """
+        Rebuild the routing table of the registry the target is registered in; the other registries are not affected.
+        """
+        registry = self._registry
+        if registry is not None:
+            registry.republish()
 
     def __contains__(self, key: str) -> bool:
         return key in self.properties
@@ -336,17 +935,57 @@ class Target:
 
     @name.setter
     def name(self, name : str):
-        old_name = self.__name
-        self.__name = name
-        del Target.__instances[old_name]
-        Target.__instances[name] = self
+        registry = TargetRegistry.owner(self)
+        old_name, self.__name = self.__name, name
+        if registry is not None:
+            registry.rename(old_name, self)
+
+    @property
+    def format(self) -> str:
+        """
+        Get the output format of the target:
+        - `text`: the bracketed, aligned text format (the default)
+        - `jsonl`: one JSON object per line (see `gamuLogger.jsonl.format_record`)
+        """
+        return self.__format
+
+    @format.setter
+    def format(self, output_format : str):
+        if output_format not in FORMATS:
+            raise ValueError(f"Invalid format: {output_format}; expected one of {', '.join(FORMATS)}")
+        self.__format = output_format
+
+    def add_filter(self, level : Levels = Levels.TRACE, modules : Iterable[str] = (), exclude_modules : Iterable[str] = (), #pylint: disable=R0913, R0917
+                   message : str|re.Pattern[str]|None = None, threads : Iterable[str] = (), predicate : CustomPredicate|None = None):
+        """
+        Append a rule to the filter chain of the target (see `gamuLogger.filters.FilterRule`), and recompile the chain.
+        The first rule matching a record decides the minimum level it must have; a record matching no rule is dropped.
+        The chain is evaluated on the raw record, after the level of the target: to write the DEBUG records of a module,
+        the level of the target must be DEBUG too.
+        """
+        self.__filters.append(FilterRule(level, modules, exclude_modules, message, threads, predicate))
+        self.properties["filter"] = compile_filters(self.__filters)
+
+    def clear_filters(self):
+        """
+        Remove all the rules of the filter chain: every record accepted by the level of the target is written.
+        """
+        self.__filters.clear()
+        self.properties.pop("filter", None)
+
+    @property
+    def filters(self) -> tuple[FilterRule, ...]:
+        """
+        Get the rules of the filter chain, in order.
+        """
+        return tuple(self.__filters)
 
     def delete(self):
         """
         Delete the target from the logger system.
         This will remove the target from the list of targets and free the memory.
         """
-        Target.unregister(self)
+        (TargetRegistry.owner(self) or TargetRegistry.current()).unregister(self)
 
 
     @staticmethod
@@ -354,39 +993,49 @@ class Target:
         """
         Get the target instance by its name.
         """
-        name = str(name)
-        if not Target.exist(name):
-            raise ValueError(f"Target {name} does not exist")
-        return Target.__instances[name]
+        return TargetRegistry.current().get(name)
 
     @staticmethod
     def exist(name : str | TerminalTarget) -> bool:
         """
         Check if the target instance exists by its name.
         """
-        name = str(name)
-        return name in Target.__instances
+        return TargetRegistry.current().exist(name)
 
     @staticmethod
     def list() -> list['Target']:
         """
         Get the list of all targets.
         """
-        return list(Target.__instances.values())
+        return TargetRegistry.current().list()
+
+    @staticmethod
+    def snapshot() -> tuple['Target', ...]:
+        """
+        Get the registered targets, as an immutable tuple (see `TargetRegistry.snapshot`).
+        """
+        return TargetRegistry.current().snapshot()
+
+    @staticmethod
+    def routes(level : Levels) -> tuple['Target', ...]:
+        """
+        Get the registered targets whose level accepts a record of the given level (see `TargetRegistry.routes`).
+        """
+        return TargetRegistry.current().routes(level)
 
     @staticmethod
     def clear():
         """
         Clear all the target instances.
         """
-        Target.__instances = {}
+        TargetRegistry.current().clear()
 
     @staticmethod
     def register(target : 'Target'):
         """
         Register a target instance in the logger system.
         """
-        Target.__instances[target.name] = target
+        TargetRegistry.current().register(target)
 
     @staticmethod
     def unregister(target : 'Target|str'):
@@ -394,8 +1043,160 @@ class Target:
         Unregister a target instance from the logger system.
         Target can be a Target instance or a string (name of the target).
         """
-        name = target if isinstance(target, str) else target.name
-        if Target.exist(name):
-            Target.__instances.pop(name, None)
-        else:
+        TargetRegistry.current().unregister(target)
+
+
+class TargetRegistry:
+    """
+    The targets of a logger, by name. The static methods of `Target` work on the registry of the default logger,
+    or on the one made active by a named logger (see `active`).
+
+    The registry is copied on write: a change publishes a new dictionary, a tuple of the targets, and a routing table
+    (the targets accepting each level), under the lock. The readers take neither a copy nor the lock.
+    """
+    def __init__(self):
+        self.__instances : dict[str, Target] = {}
+        self.__snapshot : tuple[Target, ...] = ()
+        self.__routes : tuple[tuple[Target, ...], ...] = ((),) * len(Levels) # level value -> the targets accepting it
+        self.__lock = threading.Lock() # serializes the changes; the readers do not take it
+
+    @staticmethod
+    def current() -> 'TargetRegistry':
+        """
+        Get the active registry: the one of the default logger, unless a named logger made its own active.
+        """
+        return _ACTIVE_TARGETS.get()
+
+    @contextmanager
+    def active(self) -> Iterator['TargetRegistry']:
+        """
+        Make this registry the active one within the block, in this thread or asyncio task:
+        the targets created in the block are registered in it.
+        """
+        token = _ACTIVE_TARGETS.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_TARGETS.reset(token)
+
+    def get(self, name : str | TerminalTarget) -> Target:
+        """
+        Get a target by its name.
+        """
+        target = self.__instances.get(str(name))
+        if target is None:
             raise ValueError(f"Target {name} does not exist")
+        return target
+
+    def exist(self, name : str | TerminalTarget) -> bool:
+        """
+        Check if a target exists by its name.
+        """
+        return str(name) in self.__instances
+
+    def list(self) -> list[Target]:
+        """
+        Get the list of the targets.
+        """
+        return list(self.__snapshot)
+
+    def snapshot(self) -> tuple[Target, ...]:
+        """
+        Get the targets, as an immutable tuple: a change publishes a new tuple, so the tuple returned here is never modified,
+        and iterating it needs neither a copy nor a lock.
+        """
+        return self.__snapshot
+
+    def routes(self, level : Levels) -> tuple[Target, ...]:
+        """
+        Get the targets whose level accepts a record of the given level, as an immutable tuple.
+        The table is rebuilt when a target is registered or unregistered, or when the level of a target changes;
+        a target without a level is not routed.
+        """
+        return self.__routes[level]
+
+    def setdefault(self, name : str, create : Callable[[], Target]) -> Target:
+        """
+        Get a target by its name, or register the one returned by `create` if there is none; atomically.
+        """
+        with self.__lock:
+            target = self.__instances.get(name)
+            if target is None:
+                target = create()
+                self.__publish({**self.__instances, name: target})
+            return target
+
+    def register(self, target : Target):
+        """
+        Register a target.
+        """
+        with self.__lock:
+            self.__publish({**self.__instances, target.name: target})
+
+    def unregister(self, target : Target|str):
+        """
+        Unregister a target, or the target of the given name.
+        """
+        name = target if isinstance(target, str) else target.name
+        with self.__lock:
+            if name not in self.__instances:
+                raise ValueError(f"Target {name} does not exist")
+            instances = dict(self.__instances)
+            del instances[name]
+            self.__publish(instances)
+
+    def rename(self, old_name : str, target : Target):
+        """
+        Register a renamed target under its new name.
+        """
+        with self.__lock:
+            instances = dict(self.__instances)
+            del instances[old_name]
+            instances[target.name] = target
+            self.__publish(instances)
+
+    def clear(self):
+        """
+        Unregister all the targets.
+        """
+        with self.__lock:
+            self.__publish({})
+
+    def republish(self):
+        """
+        Rebuild the routing table, e.g. after the level of a target changed.
+        """
+        with self.__lock:
+            self.__publish(self.__instances)
+
+    def __contains__(self, target : Target) -> bool:
+        return self.__instances.get(target.name) is target
+
+    def __publish(self, instances : dict[str, Target]):
+        """
+        Replace the dictionary, the snapshot and the routing table; must be called with the lock held, with a new dictionary.
+        The targets keep a reference to the registry they are published in, to republish it when their level changes.
+        """
+        snapshot = tuple(instances.values())
+        published = set(map(id, snapshot))
+        for target in self.__snapshot:
+            if target._registry is self and id(target) not in published: #pylint: disable=W0212
+                target._registry = None #pylint: disable=W0212
+        for target in snapshot:
+            target._registry = self #pylint: disable=W0212
+        self.__routes = tuple(
+            tuple(target for target in snapshot if level >= getattr(target, "properties", {}).get("level", Levels.NONE + 1)) # not initialized yet, or without a level
+            for level in Levels
+        )
+        self.__instances = instances
+        self.__snapshot = snapshot
+
+    @staticmethod
+    def owner(target : Target) -> 'TargetRegistry|None':
+        """
+        Get the registry a target is registered in, if any.
+        """
+        return target._registry #pylint: disable=W0212
+
+
+_ACTIVE_TARGETS : ContextVar[TargetRegistry] = ContextVar("gamuLogger_targets", default=TargetRegistry())
@@ -0,0 +1,135 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# ###############################################################################################
+
+"""
+GamuLogger - A simple and powerful logging library for Python
+
+Antoine Buirey 2025
+
+Exception rendering, deduplicated by fingerprint: the full traceback of an exception is rendered the first time
+it is logged, then, within a time window, only a compact reference with the number of repetitions.
+"""
+
+import sys
+import threading
+import time
+import traceback
+from hashlib import blake2b
+from types import TracebackType
+from typing import Any
+
+type ExcInfo = bool | BaseException | tuple[type[BaseException], BaseException, TracebackType] | tuple[None, None, None] | None
+
+MAX_FINGERPRINTS = 1024
+
+
+def get_exception(exc_info : ExcInfo) -> BaseException | None:
+    """
+    Return the exception described by `exc_info`: True for the exception being handled,
+    an exception, or a `sys.exc_info()` tuple. Return None if there is no exception.
+    """
+    if exc_info is True:
+        exc_info = sys.exc_info()
+    if isinstance(exc_info, BaseException):
+        return exc_info
+    if isinstance(exc_info, tuple):
+        return exc_info[1]
+    return None
+
+
+def fingerprint(exception : BaseException) -> str:
+    """
+    Identify an exception by its type and the code locations of its traceback (file, line and function of each frame),
+    and of the exceptions it was raised from; the message is ignored, so a failure repeated with other values has
+    the same fingerprint. Only the code objects of the frames are read: the source files are not.
+    """
+    parts : list[str] = []
+    seen : set[int] = set()
+    current : BaseException | None = exception
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        parts.append(f"{type(current).__module__}.{type(current).__qualname__}")
+        for frame, lineno in traceback.walk_tb(current.__traceback__):
+            parts.append(f"{frame.f_code.co_filename}:{lineno}:{frame.f_code.co_name}")
+        current = current.__cause__ or (None if current.__suppress_context__ else current.__context__)
+    return blake2b("\n".join(parts).encode("utf-8"), digest_size=6).hexdigest()
+
+
+class TracebackCache:
+    """
+    Keep the time each fingerprint was last rendered in full, and the number of times it was repeated since.
+    The oldest fingerprints are forgotten when more than `max_size` are kept.
+    """
+    def __init__(self, max_size : int = MAX_FINGERPRINTS):
+        self.max_size = max_size
+        self.__seen : dict[str, list[float]] = {} # fingerprint -> [time of the full rendering, repetitions since]
+        self.__lock = threading.Lock()
+
+    def report(self, exception : BaseException, window : float) -> dict[str, Any]:
+        """
+        Describe an exception as a dictionary with its `type`, `message` and `fingerprint`, and:
+        - its full `traceback`, if the fingerprint was not rendered in full in the last `window` seconds
+        - otherwise, the number of times it was `repeated` since
+        """
+        key = fingerprint(exception)
+        result : dict[str, Any] = {"type": type(exception).__qualname__, "message": str(exception), "fingerprint": key}
+        now = time.monotonic()
+        with self.__lock:
+            entry = self.__seen.get(key)
+            if entry is None or now - entry[0] >= window:
+                self.__seen.pop(key, None) # moved to the end, the most recent
+                self.__seen[key] = [now, 0]
+                if len(self.__seen) > self.max_size:
+                    del self.__seen[next(iter(self.__seen))]
+                full = True
+            else:
+                entry[1] += 1
+                result["repeated"] = int(entry[1])
+                full = False
+        if full:
+            result["traceback"] = "".join(traceback.format_exception(exception))
+        return result
+
+    def clear(self):
+        """
+        Forget all the fingerprints.
+        """
+        with self.__lock:
+            self.__seen.clear()
+
+
+class LoggedException:
+    """
+    An exception attached to a record. It is described (and counted in the cache) the first time a target needs it,
+    once for all the targets.
+    """
+    __slots__ = ("exception", "__cache", "__window", "__report")
+
+    def __init__(self, exception : BaseException, cache : TracebackCache, window : float):
+        self.exception = exception
+        self.__cache = cache
+        self.__window = window
+        self.__report : dict[str, Any] | None = None
+
+    def report(self) -> dict[str, Any]:
+        """
+        The description of the exception (see `TracebackCache.report`).
+        """
+        if self.__report is None:
+            self.__report = self.__cache.report(self.exception, self.__window)
+        return self.__report
+
+    def text(self) -> str:
+        """
+        The full traceback followed by the fingerprint, or for a repetition, a single line:
+        `ValueError: invalid amount [traceback 3f2a9c81d0e4, repeated 12 times]`.
+        """
+        report = self.report()
+        if "traceback" in report:
+            return f"{report['traceback']}[traceback {report['fingerprint']}]"
+        return f"{report['type']}: {report['message']} [traceback {report['fingerprint']}, repeated {report['repeated']} times]"
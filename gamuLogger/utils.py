@@ -18,11 +18,11 @@ import re
 import sys
 from datetime import datetime
 from json import JSONEncoder
-from typing import Any
+from json.encoder import encode_basestring  # type: ignore[attr-defined]
+from typing import Any, Callable
 
 from .custom_types import COLORS, Callerinfo, Stack
-from .regex import (RE_DATE, RE_DATETIME, RE_DAY, RE_HOUR, RE_MINUTE, RE_MONTH,
-                    RE_PID, RE_SECOND, RE_TIME, RE_YEAR)
+from .schema import FileSchema
 
 
 def get_caller_file_path(stack : Stack|None = None) -> str:
@@ -46,16 +46,23 @@ def get_caller_function_name(stack  : Stack|None = None) -> str:
     if len(stack) < 3:
         return "<module>"
     caller = stack[2]
-    caller_name = caller.function
-    if caller_name == "<module>":
+    return get_function_name(caller.filename, caller.lineno, caller.function)
+
+
+def get_function_name(filepath : str, lineno : int, function : str) -> str:
+    """
+    Returns the name of the function executing the given line,
+    including the class name if the function is a method
+    """
+    if function == "<module>":
         return "<module>"
 
-    parents = get_all_parents(caller.filename, caller.lineno)[::-1]
+    parents = get_all_parents(filepath, lineno)[::-1]
     if len(parents) <= 0:
-        return caller_name
-    if caller_name == parents[-1]:
+        return function
+    if function == parents[-1]:
         return '.'.join(parents)
-    return '.'.join(parents) + '.' + caller_name
+    return '.'.join(parents) + '.' + function
 
 
 def get_caller_info(context : int = 1) -> Callerinfo:
@@ -66,11 +73,13 @@ def get_caller_info(context : int = 1) -> Callerinfo:
     return get_caller_file_path(stack), get_caller_function_name(stack)
 
 
-def get_time():
+def get_time(timestamp : float|None = None) -> str:
     """
-    Returns the current time in the format YYYY-MM-DD HH:MM:SS
+    Returns the current time (or the given timestamp) in the format YYYY-MM-DD HH:MM:SS
     """
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if timestamp is None:
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
 
 def replace_newline(string : str, indent : int = 33):
@@ -126,6 +135,60 @@ class CustomEncoder(JSONEncoder):
         return super().default(o)
 
 
+MAX_FIELD_NAMES = 4096 # bound of the caches of rendered field names, in case the names are generated
+FIELD_VALUE_UNSAFE = re.compile(r'[\s"=\\]')
+FIELD_ENCODER = CustomEncoder(ensure_ascii=False, separators=(",", ":")) # created once, JSONEncoder instances are reusable
+_JSON_CONSTANTS = {None: "null", True: "true", False: "false"}
+_TEXT_FIELD_KEYS : dict[str, str] = {}
+
+
+def encode_field_value(value : Any) -> str:
+    """
+    Encode a field value as compact JSON; the strings, integers and constants do not go through the encoder.
+    """
+    kind = type(value)
+    if kind is str:
+        return encode_basestring(value)
+    if kind is int:
+        return int.__repr__(value)
+    if value is None or kind is bool:
+        return _JSON_CONSTANTS[value]
+    return FIELD_ENCODER.encode(value)
+
+
+def field_key_fragment(cache : dict[str, str], key : str, render : Callable[[str], str]) -> str:
+    """
+    Return the rendered form of a field name, rendering it the first time the name is seen.
+    The names are interned, so a name repeated on each call is stored (and rendered) once.
+    """
+    fragment = cache.get(key)
+    if fragment is None:
+        key = sys.intern(key)
+        fragment = render(key)
+        if len(cache) < MAX_FIELD_NAMES:
+            cache[key] = fragment
+    return fragment
+
+
+def format_fields(fields : dict[str, Any]) -> str:
+    """
+    Render structured fields as ` key=value` pairs, in their order.
+    Numbers, booleans, None, lists and dictionaries are written as compact JSON; the other values are converted to strings.
+    A string is written as is, unless it is empty or contains a space, a quote, an equal sign or a backslash:
+    then it is quoted as a JSON string.
+    """
+    result = ""
+    for key, value in fields.items():
+        if value is None or isinstance(value, (int, float, list, tuple, dict)):
+            rendered = encode_field_value(value)
+        else:
+            rendered = str(value)
+            if not rendered or FIELD_VALUE_UNSAFE.search(rendered):
+                rendered = encode_basestring(rendered)
+        result += field_key_fragment(_TEXT_FIELD_KEYS, key, " {}=".format) + rendered
+    return result
+
+
 def get_all_parents(filepath : str, lineno : int) -> list[str]:
     """
     Get all parent classes of a class or method, based on indentation in the file
@@ -162,6 +225,25 @@ def colorize(color : COLORS, string : str):
     return f"{color}{string}{COLORS.RESET}"
 
 
+def supports_color(stream : Any) -> bool:
+    """
+    Check if ANSI colors should be written to a terminal stream:
+    - never if the `NO_COLOR` environment variable is set (and not empty)
+    - always if the `FORCE_COLOR` environment variable is set (and not empty)
+    - otherwise, only if the stream is a terminal (and `TERM` is not `dumb`)
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    if os.environ.get("TERM") == "dumb":
+        return False
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError): # no isatty method, or closed stream
+        return False
+
+
 def get_executable_formatted():
     """
     Returns the formatted string of the current executable and its arguments.
@@ -261,39 +343,10 @@ def string2bytes(string : str) -> int:
 
 def schema2regex(schema : str) -> re.Pattern[str]:
     """
-    Convert a schema string to a regex pattern.
-
-    The schema can contain the following placeholders:
-        - `${date}`: the current date in YYYY-MM-DD format
-        - `${time}`: the current time in HH-MM-SS format
-        - `${datetime}`: the current date and time in YYYY-MM-DD_HH-MM-SS format
-
-        - `${year}`: the current year in YYYY format
-        - `${month}`: the current month in MM format
-        - `${day}`: the current day in DD format
-
-        - `${hour}`: the current hour in HH format
-        - `${minute}`: the current minute in MM format
-        - `${second}`: the current second in SS format
-
-        - `${pid}`: the current process id
-    """
-    # Define the regex patterns for each placeholder
-    patterns = {
-        "${date}": RE_DATE,
-        "${time}": RE_TIME,
-        "${datetime}": RE_DATETIME,
-        "${year}": RE_YEAR,
-        "${month}": RE_MONTH,
-        "${day}": RE_DAY,
-        "${hour}": RE_HOUR,
-        "${minute}": RE_MINUTE,
-        "${second}": RE_SECOND,
-        "${pid}": RE_PID,
-    }
-
-    # Replace the placeholders with their regex patterns
-    for placeholder, pattern in patterns.items():
-        schema = schema.replace(placeholder, pattern)
+    Convert a schema string to an anchored regex pattern, with a named group per field.
+    See FileSchema for the list of supported placeholders.
 
-    return re.compile(schema)
+    Raises:
+        ValueError: if the schema contains an unknown placeholder.
+    """
+    return FileSchema(schema).regex
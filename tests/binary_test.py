@@ -0,0 +1,204 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import io
+import os
+
+import pytest
+
+from gamuLogger.binary import (MAGIC, MAX_STRINGS, BinaryEncoder, BinaryWriter,
+                               decode_varint, encode_varint, iter_records,
+                               read_binary_file)
+from gamuLogger.custom_types import Levels
+from gamuLogger.gamu_logger import Logger, Module
+from gamuLogger.targets import Target
+
+CALLER_INFO = (__file__, "<module>")
+
+
+def row(i, message=None, timestamp=None):
+    return (1735732800.0 + i * 0.001 if timestamp is None else timestamp, Levels.INFO, "app.db", 42, "MainProcess", "MainThread", f"message {i}" if message is None else message, {})
+
+
+class TestVarint:
+    @pytest.mark.parametrize(
+        "value, size",
+        [(0, 1), (127, 1), (128, 2), (16383, 2), (16384, 3), (2 ** 63, 10)]
+    )
+    def test_roundtrip(self, value, size):
+        # Arrange
+        buffer = bytearray(b"x")
+
+        # Act
+        encode_varint(value, buffer)
+        decoded, offset = decode_varint(buffer, 1)
+
+        # Assert
+        assert len(buffer) == 1 + size
+        assert decoded == value
+        assert offset == len(buffer)
+
+    def test_truncated(self):
+        with pytest.raises(IndexError):
+            decode_varint(b"\x80\x80", 0)
+
+
+class TestBinaryFormat:
+    def test_roundtrip(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.bin")
+        rows = [row(i) for i in range(100)]
+        rows.append((1735732700.5, Levels.ERROR, "", 7, "Process-1", "Worker", {"key": [1, "é"]}, {})) # earlier timestamp
+        rows.append(row(0)) # repeated message
+
+        # Act
+        writer = BinaryWriter(path)
+        writer.write_many(rows[:50])
+        for r in rows[50:]:
+            writer(r)
+        writer.close()
+
+        # Assert
+        assert read_binary_file(path) == rows
+
+    def test_fields_roundtrip(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.bin")
+        rows = [
+            (1735732800.0 + i, Levels.INFO, "app", 1, "MainProcess", "MainThread", "order placed",
+             {"order_id": i, "amount": 9.5, "customer": "alice", "tags": ["a"], "none": None})
+            for i in range(3)
+        ]
+        rows.append(row(3))
+
+        # Act
+        writer = BinaryWriter(path)
+        writer.write_many(rows)
+        writer.close()
+
+        # Assert
+        assert read_binary_file(path) == rows
+
+    def test_field_names_are_written_once(self):
+        # Arrange
+        encoder = BinaryEncoder()
+
+        # Act
+        first = encoder.encode((0.0, Levels.INFO, "", 1, "p", "t", "m", {"order_identifier": 1}))
+        second = encoder.encode((0.0, Levels.INFO, "", 1, "p", "t", "m", {"order_identifier": 2}))
+
+        # Assert
+        assert b"order_identifier" in first
+        assert b"order_identifier" not in second
+
+    def test_strings_are_written_once(self):
+        # Arrange
+        encoder = BinaryEncoder()
+
+        # Act
+        first = encoder.encode(row(0, "same message"))
+        second = encoder.encode(row(1, "same message"))
+
+        # Assert
+        assert b"app.db" in first and b"same message" in first
+        assert b"app.db" not in second and b"same message" not in second
+        assert len(second) < 12
+
+    def test_long_messages_are_inline(self):
+        # Arrange
+        encoder = BinaryEncoder()
+        message = "x" * 1000
+
+        # Act
+        first = encoder.encode(row(0, message))
+        second = encoder.encode(row(1, message))
+
+        # Assert
+        assert message.encode() in first
+        assert message.encode() in second
+
+    def test_dictionary_is_bounded(self):
+        # Arrange
+        encoder = BinaryEncoder()
+        stream = io.BytesIO()
+        stream.write(MAGIC)
+
+        # Act
+        for i in range(MAX_STRINGS + 10):
+            stream.write(encoder.encode(row(i)))
+        stream.seek(0)
+        rows = list(iter_records(stream))
+
+        # Assert
+        assert len(encoder._BinaryEncoder__strings) == MAX_STRINGS
+        assert rows[-1] == row(MAX_STRINGS + 9)
+
+    def test_streaming_small_chunks(self):
+        # Arrange
+        encoder = BinaryEncoder()
+        rows = [row(i) for i in range(20)]
+        stream = io.BytesIO(MAGIC + b"".join(encoder.encode(r) for r in rows))
+
+        # Act
+        decoded = list(iter_records(stream, chunk_size=3))
+
+        # Assert
+        assert decoded == rows
+
+    def test_truncated_last_entry_is_ignored(self):
+        # Arrange
+        encoder = BinaryEncoder()
+        data = MAGIC + encoder.encode(row(0)) + encoder.encode(row(1))
+
+        # Act
+        decoded = list(iter_records(io.BytesIO(data[:-2])))
+
+        # Assert
+        assert decoded == [row(0)]
+
+    def test_not_a_binary_log(self):
+        with pytest.raises(ValueError):
+            list(iter_records(io.BytesIO(b"[2025-01-01 00:00:00] [  INFO   ] text")))
+
+
+class TestFromBinaryFile:
+    def test_logger_writes_records(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.bin")
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        target = Target.from_binary_file(path)
+        Logger.add_target(target, Levels.INFO)
+        Module.new("app", *CALLER_INFO)
+
+        # Act
+        Logger.info("written", CALLER_INFO)
+        Logger.debug("filtered", CALLER_INFO)
+        Logger.warning({"key": "value"}, CALLER_INFO)
+        Logger.message("not a record")
+        target.target.close()
+
+        # Assert
+        rows = read_binary_file(path)
+        assert target.type == Target.Type.BINARY
+        assert [(r[1], r[2], r[3], r[6]) for r in rows] == [
+            (Levels.INFO, "app", os.getpid(), "written"),
+            (Levels.WARNING, "app", os.getpid(), {"key": "value"}),
+        ]
+        Module.clear()
+        Logger.reset()
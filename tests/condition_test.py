@@ -1,5 +1,5 @@
 import pytest
-from gamuLogger.condition import AgeCondition, SizeCondition, NbFilesCondition, condition_factory
+from gamuLogger.condition import AgeCondition, SizeCondition, NbFilesCondition, TotalSizeCondition, condition_factory
 from gamuLogger.utils import string2seconds
 from unittest.mock import Mock
 
@@ -345,6 +345,71 @@ class TestNbFilesCondition:
         assert condition._NbFilesCondition__nb_files == value
 
 
+class TestTotalSizeCondition:
+    @pytest.mark.parametrize(
+        "operator, value, unit, total_size, expected",
+        [
+            (">", 10, "GB", 10 * 1024**3 + 1, True),
+            (">", 10, "GB", 10 * 1024**3, False),
+            (">=", 1, "MB", 1024**2, True),
+            (">=", 1, "MB", 1024**2 - 1, False),
+            ("==", 2, "KBs", 2048, True),
+            ("!=", 2, "KBs", 2048, False),
+        ],
+        ids=[
+            "greater_true", "greater_false",
+            "greater_equal_true", "greater_equal_false",
+            "equal_true", "not_equal_false"
+        ]
+    )
+    def test_call(self, operator, value, unit, total_size, expected):
+        condition = TotalSizeCondition(operator, value, unit)
+        assert condition(total_size) == expected
+
+    @pytest.mark.parametrize(
+        "operator",
+        ["<", "<=", "invalid"],
+        ids=["less", "less_equal", "invalid_operator"]
+    )
+    def test_invalid_operator(self, operator):
+        with pytest.raises(ValueError, match=f"Invalid operator: {operator}"):
+            TotalSizeCondition(operator, 10, "GB")
+
+    @pytest.mark.parametrize(
+        "string, expected_operator, expected_value",
+        [
+            ("total_size > 10 GB", ">", 10 * 1024**3),
+            ("total_size>=5MB", ">=", 5 * 1024**2),
+        ],
+        ids=["valid_greater", "valid_greater_equal_no_spaces"]
+    )
+    def test_from_string_valid(self, string, expected_operator, expected_value):
+        condition = TotalSizeCondition.from_string(string)
+        assert condition._TotalSizeCondition__operator == expected_operator
+        assert condition._TotalSizeCondition__size_in_bytes == expected_value
+
+    @pytest.mark.parametrize(
+        "string",
+        [
+            "invalid string",
+            "> 10 GB",
+            "size > 10 GB",
+        ],
+        ids=["invalid_format", "missing_prefix", "size_prefix"]
+    )
+    def test_from_string_invalid(self, string):
+        with pytest.raises(ValueError):
+            TotalSizeCondition.from_string(string)
+
+    def test_str(self):
+        condition = TotalSizeCondition(">", 1, "KB")
+        assert str(condition) == "> 1024 bytes in total"
+
+    def test_repr(self):
+        condition = TotalSizeCondition(">", 1, "KB")
+        assert repr(condition) == "TotalSizeCondition(operator='>', value='1024', unit='bytes')"
+
+
 class TestConditionFactory:
     @pytest.mark.parametrize(
         "string, expected_type",
@@ -369,11 +434,13 @@ class TestConditionFactory:
             ("age > 10 seconds", AgeCondition),
             ("size < 5 KB", SizeCondition),
             ("nb_files > 10", NbFilesCondition),
+            ("total_size > 10 GB", TotalSizeCondition),
         ],
         ids=[
             "valid_age_condition",
             "valid_size_condition",
             "valid_nb_files_condition",
+            "valid_total_size_condition",
         ]
     )
     def test_valid_conditions(self, string, expected_type):
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gamuLogger.context import (RenderedContext, get_context, log_context,
+                                propagate)
+
+
+class TestRenderedContext:
+    @pytest.mark.parametrize(
+        "fields, text, members",
+        [
+            ({"request_id": "abc", "tenant": "acme"}, "request_id=abc tenant=acme ", {"request_id": "abc", "tenant": "acme"}),
+            ({"user": "Jane Doe", "retry": 2}, 'user="Jane Doe" retry=2 ', {"user": "Jane Doe", "retry": 2}),
+            ({}, "", {}),
+        ],
+        ids=["strings", "quoted_and_number", "empty"]
+    )
+    def test_rendering(self, fields, text, members):
+        # Act
+        context = RenderedContext(fields)
+
+        # Assert
+        assert context.text == text
+        assert json.loads("{" + context.json + "}") == members
+
+    def test_fields_are_copied(self):
+        # Arrange
+        fields = {"request_id": "abc"}
+
+        # Act
+        context = RenderedContext(fields)
+        fields["request_id"] = "changed"
+
+        # Assert
+        assert context.fields == {"request_id": "abc"}
+        assert context.text == "request_id=abc "
+
+    def test_merge(self):
+        # Arrange
+        context = RenderedContext({"request_id": "abc", "tenant": "acme"})
+
+        # Act
+        merged = context.merge({"tenant": "other", "user": 7})
+
+        # Assert
+        assert merged.fields == {"request_id": "abc", "tenant": "other", "user": 7}
+        assert merged.text == "request_id=abc tenant=other user=7 "
+        assert context.fields == {"request_id": "abc", "tenant": "acme"}
+
+    def test_under(self):
+        # Arrange
+        outer = RenderedContext({"request_id": "abc", "tenant": "acme"})
+        inner = RenderedContext({"tenant": "other"})
+
+        # Act
+        combined = inner.under(outer)
+
+        # Assert
+        assert combined.fields == {"request_id": "abc", "tenant": "other"}
+        assert inner.under(outer) is combined # cached
+        assert inner.under(RenderedContext({"request_id": "def"})).fields == {"request_id": "def", "tenant": "other"}
+
+    def test_slots(self):
+        with pytest.raises(AttributeError):
+            RenderedContext({}).other = 1 # type: ignore[attr-defined]
+
+
+class TestLogContext:
+    def test_nesting(self):
+        # Act & Assert
+        assert get_context() == {}
+        with log_context(request_id="abc", tenant="acme") as outer:
+            assert get_context() == {"request_id": "abc", "tenant": "acme"}
+            with log_context(tenant="other") as inner:
+                assert get_context() == {"request_id": "abc", "tenant": "other"}
+                assert inner.text == "request_id=abc tenant=other "
+            assert get_context() == outer.fields
+        assert get_context() == {}
+
+    def test_reset_on_error(self):
+        # Act
+        with pytest.raises(RuntimeError):
+            with log_context(request_id="abc"):
+                raise RuntimeError("failure")
+
+        # Assert
+        assert get_context() == {}
+
+    def test_decorator(self):
+        # Arrange
+        @log_context(job="cleanup")
+        def job():
+            return get_context()
+
+        # Act & Assert
+        assert job() == {"job": "cleanup"}
+        assert job() == {"job": "cleanup"}
+        assert get_context() == {}
+
+    def test_asyncio_tasks(self):
+        # Arrange
+        async def handle(request_id):
+            with log_context(request_id=request_id):
+                await asyncio.sleep(0.01)
+                return get_context()
+
+        async def serve():
+            with log_context(server="api"):
+                return await asyncio.gather(handle(1), handle(2))
+
+        # Act
+        results = asyncio.run(serve())
+
+        # Assert
+        assert results == [{"server": "api", "request_id": 1}, {"server": "api", "request_id": 2}]
+
+    def test_propagate(self):
+        # Arrange
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with log_context(request_id="abc"):
+                propagated = executor.submit(propagate(get_context)).result()
+                not_propagated = executor.submit(get_context).result()
+
+        # Assert
+        assert propagated == {"request_id": "abc"}
+        assert not_propagated == {}
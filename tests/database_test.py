@@ -0,0 +1,215 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import json
+import sqlite3
+import time
+
+import pytest
+
+from gamuLogger.custom_types import Levels
+from gamuLogger.database import SqliteWriter
+from gamuLogger.gamu_logger import Logger, Module
+from gamuLogger.targets import Target
+
+CALLER_INFO = (__file__, "<module>")
+
+
+def count_rows(path):
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+
+
+def row(i, level=Levels.INFO):
+    return (1000.0 + i, level, "app", 42, "MainProcess", "MainThread", f"message {i}", {})
+
+
+class TestSqliteWriter:
+    def test_creates_schema_in_wal_mode(self, tmp_path):
+        # Act
+        writer = SqliteWriter(str(tmp_path / "logs" / "logs.db"))
+
+        # Assert
+        with sqlite3.connect(tmp_path / "logs" / "logs.db") as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            indexes = {name for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"logs_timestamp", "logs_level", "logs_module"} <= indexes
+        writer.close()
+
+    def test_inserts_full_batches(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.db")
+        writer = SqliteWriter(path, batch_size=10, flush_interval=60)
+
+        # Act
+        for i in range(25):
+            writer(row(i))
+
+        # Assert
+        assert count_rows(path) == 20
+        writer.flush()
+        assert count_rows(path) == 25
+        writer.close()
+
+    def test_inserts_pending_rows_periodically(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.db")
+        writer = SqliteWriter(path, batch_size=1000, flush_interval=0.05)
+
+        # Act
+        writer.write_many([row(i) for i in range(3)])
+        before = count_rows(path)
+        time.sleep(0.3)
+
+        # Assert
+        assert before == 0
+        assert count_rows(path) == 3
+        writer.close()
+
+    def test_close_inserts_pending_rows(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.db")
+        writer = SqliteWriter(path, flush_interval=60)
+        writer(row(0))
+
+        # Act
+        writer.close()
+        writer(row(1)) # ignored
+
+        # Assert
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("SELECT timestamp, level, module, pid, process, thread, message FROM logs").fetchall() == [
+                (1000.0, 2, "app", 42, "MainProcess", "MainThread", "message 0")
+            ]
+
+    def test_appends_to_existing_database(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.db")
+        writer = SqliteWriter(path)
+        writer(row(0))
+        writer.close()
+
+        # Act
+        writer = SqliteWriter(path)
+        writer(row(1))
+        writer.close()
+
+        # Assert
+        assert count_rows(path) == 2
+
+    @pytest.mark.parametrize(
+        "batch_size, flush_interval",
+        [(0, 1.0), (10, 0)],
+        ids=["batch_size", "flush_interval"]
+    )
+    def test_invalid_arguments(self, tmp_path, batch_size, flush_interval):
+        with pytest.raises(ValueError):
+            SqliteWriter(str(tmp_path / "logs.db"), batch_size, flush_interval)
+
+
+class TestFromSqlite:
+    def test_logger_stores_records(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.db")
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        target = Target.from_sqlite(path)
+        Logger.add_target(target, Levels.DEBUG)
+        Module.new("app.db", *CALLER_INFO)
+
+        # Act
+        Logger.info("stored", CALLER_INFO)
+        Logger.trace("filtered", CALLER_INFO)
+        Logger.error({"key": "value"}, CALLER_INFO)
+        Logger.message("not a record")
+        target.target.flush()
+
+        # Assert
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute("SELECT level, module, message FROM logs ORDER BY id").fetchall()
+        assert rows == [(2, "app.db", "stored"), (4, "app.db", '{"key": "value"}')]
+        assert target.type == Target.Type.DATABASE
+        assert target.name == path
+        target.target.close()
+        Module.clear()
+        Logger.reset()
+
+    def test_logger_stores_fields(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.db")
+        Logger.reset()
+        Module.clear()
+        Logger.remove_target("stdout")
+        target = Target.from_sqlite(path)
+        Logger.add_target(target, Levels.INFO)
+
+        # Act
+        Logger.info("order placed", CALLER_INFO, order_id=42, customer="é")
+        Logger.info("no fields", CALLER_INFO)
+        Logger.bind(request_id="r1").info("bound", CALLER_INFO, order_id=1)
+        target.target.flush()
+
+        # Assert
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute("SELECT message, fields FROM logs ORDER BY id").fetchall()
+        assert rows == [("order placed", '{"order_id": 42, "customer": "é"}'), ("no fields", None), ("bound", '{"request_id": "r1", "order_id": 1}')]
+        target.target.close()
+        Logger.reset()
+
+    def test_logger_stores_exception(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.db")
+        Logger.reset()
+        Module.clear()
+        Logger.remove_target("stdout")
+        target = Target.from_sqlite(path)
+        Logger.add_target(target, Levels.INFO)
+
+        # Act
+        Logger.error("failed", CALLER_INFO, exc_info=KeyError("k"), order_id=1)
+        target.target.flush()
+
+        # Assert
+        with sqlite3.connect(path) as connection:
+            fields = json.loads(connection.execute("SELECT fields FROM logs").fetchone()[0])
+        assert fields["order_id"] == 1
+        assert fields["exception"]["type"] == "KeyError"
+        assert "KeyError: 'k'" in fields["exception"]["traceback"]
+        target.target.close()
+        Logger.reset()
+
+    def test_flight_recorder_dumps_rows(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "crash.db")
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        recorder = Target.from_flight_recorder(Target.from_sqlite(path))
+        Logger.add_target(recorder, Levels.TRACE)
+
+        # Act
+        Logger.debug("context", CALLER_INFO)
+        Logger.error("failure", CALLER_INFO)
+        recorder.target.downstream.target.flush()
+
+        # Assert
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("SELECT message FROM logs ORDER BY id").fetchall() == [("context",), ("failure",)]
+        recorder.target.downstream.target.close()
+        Logger.reset()
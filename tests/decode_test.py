@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from gamuLogger.binary import BinaryWriter
+from gamuLogger.custom_types import Levels
+from gamuLogger.decode import format_text, main
+from gamuLogger.utils import get_time
+
+TIMESTAMP = 1735732800.0
+ROWS = [
+    (TIMESTAMP, Levels.INFO, "app.db", 42, "MainProcess", "MainThread", "connected", {}),
+    (TIMESTAMP + 1, Levels.ERROR, "", 42, "MainProcess", "Worker-1", "line 1\nline 2", {}),
+    (TIMESTAMP + 2, Levels.DEBUG, "", 42, "MainProcess", "MainThread", {"key": 1}, {}),
+]
+
+
+@pytest.fixture
+def binary_log(tmp_path):
+    path = str(tmp_path / "logs.bin")
+    writer = BinaryWriter(path)
+    writer.write_many(ROWS)
+    writer.close()
+    return path
+
+
+class TestFormatText:
+    def test_standard_format(self):
+        assert format_text(ROWS[0]) == f"[{get_time(TIMESTAMP)}] [  INFO   ] [       app       ] [        db       ] connected\n"
+
+    def test_multiline(self):
+        assert format_text(ROWS[1]) == f"[{get_time(TIMESTAMP + 1)}] [  ERROR  ] line 1\n{' ' * 32}| line 2\n"
+
+    def test_columns(self):
+        # Act
+        result = format_text(ROWS[0], show_process_name=True, show_pid=True, show_threads_name=True)
+
+        # Assert
+        assert result.startswith(f"[{get_time(TIMESTAMP)}] [ {'MainProcess':^20} ] [ {42:^8d} ] [ {'MainThread':^20} ] [  INFO   ]")
+
+    def test_fields(self):
+        # Arrange
+        row = (TIMESTAMP, Levels.INFO, "", 42, "MainProcess", "MainThread", "order placed", {"order_id": 42, "customer": "Jane Doe"})
+
+        # Act & Assert
+        assert format_text(row) == f'[{get_time(TIMESTAMP)}] [  INFO   ] order placed order_id=42 customer="Jane Doe"\n'
+
+    def test_json_message(self):
+        assert format_text(ROWS[2]).endswith('] {\n' + ' ' * 32 + '|     "key": 1\n' + ' ' * 32 + '| }\n')
+
+
+class TestMain:
+    def test_text(self, binary_log, capsys):
+        # Act
+        main([binary_log])
+
+        # Assert
+        assert capsys.readouterr().out == "".join(format_text(row) for row in ROWS)
+
+    def test_jsonl(self, binary_log, capsys):
+        # Act
+        main([binary_log, "--format", "jsonl"])
+
+        # Assert
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [record["message"] for record in records] == ["connected", "line 1\nline 2", {"key": 1}]
+        assert records[0]["module"] == "app.db"
+        assert records[1]["ts"] == TIMESTAMP + 1
+
+    def test_not_a_binary_log(self, tmp_path, capsys):
+        # Arrange
+        path = tmp_path / "logs.txt"
+        path.write_text("[2025-01-01 00:00:00] [  INFO   ] text\n")
+
+        # Act
+        with pytest.raises(SystemExit) as exc_info:
+            main([str(path)])
+
+        # Assert
+        assert exc_info.value.code == 1
+        assert "Not a gamuLogger binary log" in capsys.readouterr().err
+
+    def test_module_from_stdin(self, binary_log):
+        # Act
+        with open(binary_log, "rb") as f:
+            result = subprocess.run([sys.executable, "-m", "gamuLogger.decode", "--format", "jsonl"], stdin=f, capture_output=True, check=True, text=True)
+
+        # Assert
+        assert len(result.stdout.splitlines()) == 3
@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from gamuLogger.custom_types import Levels
+from gamuLogger.filters import FilterRule, compile_filters, module_matcher
+from gamuLogger.module import Module
+from gamuLogger.record import LogRecord
+
+
+@pytest.fixture
+def modules():
+    Module.clear()
+    yield {
+        "db": Module.new("db", "db.py", "<module>"),
+        "db.pool": Module.new("db.pool", "pool.py", "<module>"),
+        "dbx": Module.new("dbx", "dbx.py", "<module>"),
+    }
+    Module.clear()
+
+
+class TestFilterRule:
+    @pytest.mark.parametrize(
+        "rule, module, msg, expected",
+        [
+            (FilterRule(), None, "anything", True),
+            (FilterRule(modules=("db",)), "db", "query", True),
+            (FilterRule(modules=("db.*",)), "db.pool", "query", True),
+            (FilterRule(modules=("db",)), "dbx", "query", False),
+            (FilterRule(modules=("db",)), None, "query", False),
+            (FilterRule(exclude_modules=("db.pool",)), "db.pool", "query", False),
+            (FilterRule(exclude_modules=("db.pool",)), "db", "query", True),
+            (FilterRule(message=r"^slow "), None, "slow query", True),
+            (FilterRule(message=r"^slow "), None, "a slow query", False),
+            (FilterRule(modules=("db",), message="slow"), "db", "fast query", False),
+            (FilterRule(predicate=lambda level, msg, module, fields: module == "db.pool" and fields["n"] > 1), "db.pool", "query", True),
+        ],
+        ids=["empty", "module", "module_wildcard", "module_not_prefix", "no_module", "exclude", "not_excluded",
+             "message", "message_not_found", "all_criteria", "predicate"]
+    )
+    def test_compile(self, modules, rule, module, msg, expected):
+        # Arrange
+        matches = rule.compile()
+
+        # Act
+        result = matches(LogRecord(Levels.INFO, msg, ("file.py", "<module>"), modules.get(module), {"n": 2}))
+
+        # Assert
+        assert result is expected
+
+    def test_threads(self):
+        # Arrange
+        matches = FilterRule(threads=("worker",)).compile()
+        results = []
+        thread = threading.Thread(target=lambda: results.append(matches(LogRecord(Levels.INFO, "", ("file.py", "<module>"), None, {}))), name="worker")
+
+        # Act
+        thread.start()
+        thread.join()
+
+        # Assert
+        assert results == [True]
+        assert not matches(LogRecord(Levels.INFO, "", ("file.py", "<module>"), None, {}))
+
+    def test_empty_prefix(self):
+        with pytest.raises(ValueError):
+            FilterRule(modules=("",))
+
+
+def test_module_matcher_cache(modules):
+    # Arrange
+    matches = module_matcher((("db",),), ())
+
+    # Act
+    with patch.object(modules["dbx"], "get_complete_path", wraps=modules["dbx"].get_complete_path) as path:
+        results = [matches(LogRecord(Levels.INFO, "", ("dbx.py", "<module>"), modules["dbx"], {})) for _ in range(3)]
+
+    # Assert
+    assert results == [False, False, False]
+    assert path.call_count == 1 # computed once per module
+
+
+@pytest.mark.parametrize(
+    "level, module, expected",
+    [
+        (Levels.DEBUG, "db", True),
+        (Levels.DEBUG, "db.pool", True),
+        (Levels.DEBUG, "dbx", False),
+        (Levels.INFO, "dbx", True),
+        (Levels.ERROR, None, True),
+    ],
+    ids=["db_debug", "submodule_debug", "other_debug", "other_info", "no_module"]
+)
+def test_compile_filters(modules, level, module, expected):
+    # Arrange
+    accept = compile_filters([FilterRule(Levels.DEBUG, modules=("db",)), FilterRule(Levels.INFO)])
+
+    # Act
+    result = accept(LogRecord(level, "message", ("file.py", "<module>"), modules.get(module), {}))
+
+    # Assert
+    assert result is expected
+
+
+def test_compile_filters_no_match():
+    # Arrange
+    accept = compile_filters([FilterRule(message="kept")])
+
+    # Act & Assert
+    assert accept(LogRecord(Levels.INFO, "kept", ("file.py", "<module>"), None, {}))
+    assert not accept(LogRecord(Levels.INFO, "dropped", ("file.py", "<module>"), None, {}))
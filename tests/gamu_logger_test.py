@@ -16,17 +16,21 @@
 # pylint: disable=protected-access
 # ###############################################################################################
 
+import json
 import re
 import tempfile
 from time import sleep
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from gamuLogger.context import log_context
 from gamuLogger.function import (chrono, debug, debug_func, error, info,
                                  message, trace_func, warning)
 from gamuLogger.gamu_logger import Levels, Logger, Module
+from gamuLogger.limits import RateLimiter, Sampler
 from gamuLogger.targets import Target, TerminalTarget
+from gamuLogger.utils import get_caller_info
 
 
 class Test_Logger:
@@ -511,6 +515,660 @@ class Test_Logger:
         assert re.match(r".*\[.*\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}.*\] \[.*  INFO   .*\] This is a message using a custom Target object", result)
 
 
+    @pytest.mark.parametrize(
+        "environ, color, colored",
+        [
+            ({}, None, False),
+            ({"FORCE_COLOR": "1"}, None, True),
+            ({"FORCE_COLOR": "1"}, False, False),
+            ({"NO_COLOR": "1"}, True, True),
+        ],
+        ids=["not_a_tty", "force_color", "override_off", "override_on"]
+    )
+    def test_terminal_colors(self, environ, color, colored, monkeypatch, capsys):
+        # Arrange
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.delenv("FORCE_COLOR", raising=False)
+        for name, value in environ.items():
+            monkeypatch.setenv(name, value)
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.add_target(Target(TerminalTarget.STDOUT), Levels.INFO, color=color)
+
+        # Act
+        info("This is a message")
+        message("This is a raw message")
+
+        # Assert
+        result = capsys.readouterr().out
+        assert ("\033[" in result) == colored
+        if not colored:
+            assert re.match(r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] \[  INFO   \] This is a message\nThis is a raw message\n$", result)
+
+    def test_file_target_color_override(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        lines = []
+
+        def colored_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(colored_target, Levels.INFO, color=True)
+
+        # Act
+        info("This is a message")
+
+        # Assert
+        assert "\033[92m  INFO   \033[0m" in lines[0]
+
+    def test_fields(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        text_lines = []
+        jsonl_lines = []
+
+        def text_target(msg: str):
+            text_lines.append(msg)
+
+        def jsonl_target(msg: str):
+            jsonl_lines.append(msg)
+
+        Logger.add_target(text_target, Levels.INFO)
+        Logger.add_target(jsonl_target, Levels.INFO, format="jsonl")
+
+        # Act
+        info("order placed", order_id=42, amount=9.5, customer="Jane Doe")
+
+        # Assert
+        assert text_lines[0].endswith('] order placed order_id=42 amount=9.5 customer="Jane Doe"\n')
+        assert json.loads(jsonl_lines[0])["fields"] == {"order_id": 42, "amount": 9.5, "customer": "Jane Doe"}
+
+    def test_fields_are_serialized_lazily(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        lines = []
+        rendered = []
+
+        class Expensive:
+            def __str__(self):
+                rendered.append(self)
+                return "expensive"
+
+        def custom_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(custom_target, Levels.INFO)
+
+        # Act
+        Logger.debug("filtered", value=Expensive())
+        Logger.info("printed", value=Expensive())
+
+        # Assert
+        assert len(lines) == 1
+        assert lines[0].endswith(" printed value=expensive\n")
+        assert len(rendered) == 1
+
+    def test_bind(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        text_lines = []
+        jsonl_lines = []
+
+        def text_target(msg: str):
+            text_lines.append(msg)
+
+        def jsonl_target(msg: str):
+            jsonl_lines.append(msg)
+
+        Logger.add_target(text_target, Levels.INFO)
+        Logger.add_target(jsonl_target, Levels.INFO, format="jsonl")
+
+        # Act
+        log = Logger.bind(request_id="abc", tenant="acme")
+        log.info("order placed", order_id=42)
+        log.debug("filtered")
+        log.bind(tenant="other").warning("multi\nline")
+
+        # Assert
+        assert len(text_lines) == 2
+        assert text_lines[0].endswith("] request_id=abc tenant=acme order placed order_id=42\n")
+        assert "] request_id=abc tenant=other multi\n" in text_lines[1]
+        records = [json.loads(line) for line in jsonl_lines]
+        assert records[0]["message"] == "order placed"
+        assert records[0]["context"] == {"request_id": "abc", "tenant": "acme"}
+        assert records[0]["fields"] == {"order_id": 42}
+        assert records[1]["context"] == {"request_id": "abc", "tenant": "other"}
+        assert log.context == {"request_id": "abc", "tenant": "acme"}
+
+    def test_log_context(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        text_lines = []
+        jsonl_lines = []
+
+        def text_target(msg: str):
+            text_lines.append(msg)
+
+        def jsonl_target(msg: str):
+            jsonl_lines.append(msg)
+
+        Logger.add_target(text_target, Levels.INFO)
+        Logger.add_target(jsonl_target, Levels.INFO, format="jsonl")
+
+        # Act
+        with log_context(request_id="abc", tenant="acme"):
+            info("in context")
+            Logger.bind(tenant="other", user=7).info("bound in context")
+        info("out of context")
+
+        # Assert
+        assert text_lines[0].endswith("] request_id=abc tenant=acme in context\n")
+        assert text_lines[1].endswith("] request_id=abc tenant=other user=7 bound in context\n")
+        assert text_lines[2].endswith("] out of context\n")
+        records = [json.loads(line) for line in jsonl_lines]
+        assert records[0]["context"] == {"request_id": "abc", "tenant": "acme"}
+        assert records[1]["context"] == {"request_id": "abc", "tenant": "other", "user": 7}
+        assert "context" not in records[2]
+
+    def test_bound_logger_module(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        lines = []
+
+        def custom_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(custom_target, Levels.TRACE)
+        Logger.set_module("test.bound")
+        log = Logger.bind(request_id="abc")
+
+        # Act
+        for method in (log.trace, log.debug, log.info, log.warning, log.error, log.fatal):
+            method("message")
+
+        # Assert
+        assert len(lines) == 6
+        assert all("[       test      ] [      bound      ] request_id=abc message" in line for line in lines)
+        with pytest.raises(AttributeError):
+            log.other = 1 # slots only
+        Module.clear()
+
+    def test_exception(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        text_lines = []
+        jsonl_lines = []
+
+        def text_target(msg: str):
+            text_lines.append(msg)
+
+        def jsonl_target(msg: str):
+            jsonl_lines.append(msg)
+
+        Logger.add_target(text_target, Levels.INFO)
+        Logger.add_target(jsonl_target, Levels.INFO, format="jsonl")
+
+        # Act
+        for i in range(3):
+            try:
+                raise ValueError(f"invalid amount {i}")
+            except ValueError:
+                Logger.exception("payment failed", order_id=i)
+
+        # Assert
+        assert len(text_lines) == 3
+        first_line, *traceback_lines = text_lines[0].splitlines()
+        assert first_line.endswith("] payment failed order_id=0")
+        assert traceback_lines[0] == " " * 32 + "| Traceback (most recent call last):"
+        assert traceback_lines[-2] == " " * 32 + "| ValueError: invalid amount 0"
+        fingerprint = json.loads(jsonl_lines[0])["exception"]["fingerprint"]
+        assert traceback_lines[-1] == " " * 32 + f"| [traceback {fingerprint}]"
+        assert text_lines[2] == text_lines[2].split("\n")[0] + "\n" + " " * 32 + f"| ValueError: invalid amount 2 [traceback {fingerprint}, repeated 2 times]\n"
+        records = [json.loads(line) for line in jsonl_lines]
+        assert records[0]["level"] == "ERROR"
+        assert records[0]["exception"]["type"] == "ValueError"
+        assert "Traceback" in records[0]["exception"]["traceback"]
+        assert records[2]["exception"] == {"type": "ValueError", "message": "invalid amount 2", "fingerprint": fingerprint, "repeated": 2}
+
+    def test_exc_info(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        lines = []
+
+        def custom_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(custom_target, Levels.INFO)
+        error = KeyError("missing")
+
+        # Act
+        Logger.debug("filtered", exc_info=error)
+        Logger.warning("printed", exc_info=error)
+        Logger.info("no exception", exc_info=True)
+
+        # Assert
+        assert len(lines) == 2
+        assert "KeyError: 'missing'" in lines[0] # the filtered record did not count as an occurrence
+        assert "repeated" not in lines[0]
+        assert lines[1].endswith("] no exception\n")
+
+    def test_set_traceback_window(self):
+        # Arrange
+        Logger.reset()
+        Logger.remove_target("stdout")
+        lines = []
+
+        def custom_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(custom_target, Levels.INFO)
+        error = KeyError("missing")
+
+        # Act
+        Logger.set_traceback_window(0)
+        Logger.error("first", exc_info=error)
+        Logger.error("second", exc_info=error)
+
+        # Assert
+        assert all("repeated" not in line for line in lines)
+        with pytest.raises(ValueError):
+            Logger.set_traceback_window(-1)
+        Logger.reset()
+
+    def test_target_limiter(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        limited = []
+        unlimited = []
+
+        def limited_target(msg: str):
+            limited.append(msg)
+
+        def unlimited_target(msg: str):
+            unlimited.append(msg)
+
+        Logger.add_target(limited_target, Levels.INFO)
+        Logger.add_target(unlimited_target, Levels.INFO)
+        Logger.set_limiter("limited_target", RateLimiter(1, burst=2, summary_interval=0.5)) # the summary is due during the sleep
+
+        # Act
+        for i in range(5):
+            info(f"message {i}")
+        Logger.debug("filtered, not counted")
+        sleep(1.05)
+        info("after")
+
+        # Assert
+        assert len(unlimited) == 6
+        assert len(limited) == 4
+        assert limited[0].endswith("] message 0\n") and limited[1].endswith("] message 1\n")
+        assert limited[2].endswith("] suppressed 3 similar messages suppressed=3\n")
+        assert limited[3].endswith("] after\n")
+        Logger.set_limiter("limited_target", None)
+        assert "limiter" not in Target.get("limited_target")
+
+    def test_limiter_flood_ends(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Logger.remove_target("stdout")
+        lines = []
+
+        def custom_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(custom_target, Levels.INFO)
+        Logger.set_limiter("custom_target", Sampler(0, summary_interval=0.2))
+
+        # Act
+        for i in range(5):
+            info(f"message {i}")
+        sleep(0.5) # the flood stops: no record is admitted to report it
+
+        # Assert
+        assert [line.split("] ")[-1] for line in lines] == ["suppressed 5 similar messages suppressed=5\n"]
+        Logger.reset()
+
+    def test_limiter_summary_at_exit(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Logger.remove_target("stdout")
+        lines = []
+
+        def custom_target(msg: str):
+            lines.append(msg)
+
+        def noisy():
+            Logger.set_module("noisy")
+            for i in range(3):
+                Logger.warning(f"module {i}")
+
+        def callsite():
+            for i in range(4):
+                Logger.info(f"callsite {i}")
+
+        Logger.add_target(custom_target, Levels.INFO)
+        Logger.set_module_limiter("noisy", Sampler(0))
+
+        # Act
+        noisy()
+        Logger.set_callsite_limiter(RateLimiter(0.001, burst=1))
+        callsite()
+        Logger.flush_repeats() # called at exit
+        Logger.flush_repeats()
+
+        # Assert
+        assert [line.split("] ")[-1] for line in lines] == [
+            "callsite 0\n",
+            "suppressed 3 similar messages suppressed=3\n",
+            "suppressed 3 similar messages suppressed=3\n",
+        ]
+        assert "WARNING" in lines[1] and "noisy" in lines[1]
+        assert "INFO" in lines[2]
+        Logger.reset()
+        Module.clear()
+
+    def test_module_limiter(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        lines = []
+
+        def custom_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(custom_target, Levels.INFO)
+        Logger.set_module("test.noisy")
+        Logger.set_module_limiter("test.noisy", Sampler(0))
+
+        # Act
+        info("dropped")
+        Logger.set_module_limiter("test.noisy", None)
+        info("kept")
+
+        # Assert
+        assert len(lines) == 1
+        assert lines[0].endswith("] kept\n")
+        Module.clear()
+
+    def test_callsite_limiter(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Logger.remove_target("stdout")
+        lines = []
+
+        def custom_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(custom_target, Levels.INFO)
+        Logger.set_callsite_limiter(RateLimiter(0.001, burst=2))
+        log = Logger.bind(request_id="abc")
+
+        # Act
+        with patch("gamuLogger.gamu_logger.get_caller_info", wraps=get_caller_info) as caller_info:
+            for i in range(10):
+                Logger.info(f"first callsite {i}")
+                Logger.info(f"second callsite {i}")
+                log.warning(f"bound callsite {i}")
+
+        # Assert
+        assert [line.split("] ")[-1] for line in lines] == [
+            "first callsite 0\n", "second callsite 0\n", "request_id=abc bound callsite 0\n",
+            "first callsite 1\n", "second callsite 1\n", "request_id=abc bound callsite 1\n",
+        ]
+        assert caller_info.call_count == 6 # not resolved for the suppressed records
+        Logger.reset()
+
+    def test_callsite_limiter_after_levels(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Logger.remove_target("stdout")
+        lines = []
+
+        def custom_target(msg: str):
+            lines.append(msg)
+
+        def quiet():
+            Logger.set_module("quiet")
+            for i in range(100):
+                Logger.info(f"filtered by the module {i}")
+            Logger.debug("filtered by the target")
+
+        Logger.add_target(custom_target, Levels.INFO)
+        Logger.set_module_level("quiet", Levels.WARNING)
+        Logger.set_callsite_limiter(RateLimiter(1, 1, summary_interval=0))
+
+        # Act
+        quiet()
+        Logger.flush_repeats()
+
+        # Assert
+        assert not lines # neither the records, nor a summary of them
+        assert not Logger.get_instance()._Logger__callsite_limiters # no tokens spent on them
+        Logger.reset()
+        Module.clear()
+
+    def test_filters(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        lines = []
+
+        def db_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(db_target, Levels.DEBUG)
+        Logger.add_filter("db_target", Levels.DEBUG, modules=("db",))
+        Logger.add_filter("db_target", Levels.NONE, message="^heartbeat")
+        Logger.add_filter("db_target", Levels.INFO)
+
+        def query():
+            Logger.set_module("db.pool")
+            Logger.debug("query")
+
+        # Act
+        query()
+        Logger.debug("dropped")
+        Logger.info("heartbeat")
+        Logger.info("kept")
+        Logger.clear_filters("db_target")
+        Logger.debug("unfiltered")
+
+        # Assert
+        assert [line.split("] ")[-1] for line in lines] == ["query\n", "kept\n", "unfiltered\n"]
+        assert "filter" not in Target.get("db_target")
+        Module.clear()
+
+    def test_no_accepting_target(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        lines = []
+
+        def warning_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(warning_target, Levels.WARNING)
+
+        # Act
+        with patch("gamuLogger.gamu_logger.LogRecord.acquire") as acquire, patch("gamuLogger.gamu_logger.get_exception") as exception:
+            Logger.debug("no target accepts it", exc_info=True)
+
+        # Assert
+        acquire.assert_not_called() # no record is built for a level no target accepts
+        exception.assert_not_called()
+        assert not lines
+        Logger.reset()
+
+    def test_named_logger(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Logger.remove_target("stdout")
+        default_lines = []
+        ingest_lines = []
+
+        def default_target(msg: str):
+            default_lines.append(msg)
+
+        def ingest_target(msg: str):
+            ingest_lines.append(msg)
+
+        ingest = Logger.named("ingest")
+        ingest.reset()
+        ingest.remove_target("stdout")
+        Logger.add_target(default_target, Levels.INFO)
+        ingest.add_target(ingest_target, Levels.DEBUG)
+        ingest.show_pid()
+
+        def parse():
+            ingest.set_module("parser")
+            ingest.debug("parsed")
+            Logger.info("from the default logger")
+
+        # Act
+        parse()
+        ingest.info("loaded", rows=3)
+        Logger.debug("filtered by the default target")
+
+        # Assert
+        assert Logger.named("ingest") is ingest
+        assert isinstance(ingest, Logger) and ingest.name == "ingest" and Logger.name == ""
+        assert Logger.get_instance() is not ingest and ingest.get_instance() is ingest
+        assert not Target.exist("ingest_target") and not Logger.get_instance().config['show_pid']
+        assert len(default_lines) == 1 and default_lines[0].endswith("] from the default logger\n") # the module is set for ingest only
+        assert len(ingest_lines) == 2
+        assert "parser" in ingest_lines[0] and ingest_lines[0].endswith("] parsed\n")
+        assert ingest_lines[1].endswith("] loaded rows=3\n")
+        with pytest.raises(ValueError):
+            Logger.named("")
+        ingest.reset()
+
+    def test_collapse(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Logger.remove_target("stdout")
+        collapsed = []
+        unchanged = []
+
+        def collapsed_target(msg: str):
+            collapsed.append(msg)
+
+        def unchanged_target(msg: str):
+            unchanged.append(msg)
+
+        Logger.add_target(collapsed_target, Levels.INFO)
+        Logger.add_target(unchanged_target, Levels.INFO)
+        Logger.set_collapse("collapsed_target")
+
+        # Act
+        for _ in range(4):
+            info("disk full", free=0)
+        info("disk full", free=1)
+        for _ in range(3):
+            info("retrying")
+        Logger.flush_repeats()
+        Logger.flush_repeats()
+
+        # Assert
+        assert len(unchanged) == 8
+        assert [line.split("] ")[-1] for line in collapsed] == [
+            "disk full free=0\n", "last message repeated 3 times repeated=3\n",
+            "disk full free=1\n",
+            "retrying\n", "last message repeated 2 times repeated=2\n",
+        ]
+        Logger.set_collapse("collapsed_target", None)
+        assert "collapser" not in Target.get("collapsed_target")
+        Logger.reset()
+
+    def test_collapse_max_delay(self):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Logger.remove_target("stdout")
+        lines = []
+
+        def collapsed_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(collapsed_target, Levels.INFO)
+        Logger.set_collapse("collapsed_target", max_delay=0.2)
+
+        # Act
+        for _ in range(3):
+            info("disk full")
+        sleep(0.5) # the repetitions stop, and no other record arrives
+
+        # Assert
+        assert [line.split("] ")[-1] for line in lines] == ["disk full\n", "last message repeated 2 times repeated=2\n"]
+        Logger.reset()
+
+    def test_jsonl_target(self, capsys):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.remove_target("stdout")
+        lines = []
+
+        def jsonl_target(msg: str):
+            lines.append(msg)
+
+        Logger.add_target(jsonl_target, Levels.INFO, format="jsonl")
+        Logger.set_module("test.sub")
+
+        # Act
+        info("multi\nline [message]")
+        Logger.error({"code": 3})
+        message("not a record")
+
+        # Assert
+        records = [json.loads(line) for line in lines]
+        assert [record["message"] for record in records] == ["multi\nline [message]", {"code": 3}]
+        assert [record["level"] for record in records] == ["INFO", "ERROR"]
+        assert records[0]["module"] == "test.sub"
+        assert set(records[0]) == {"ts", "level", "module", "pid", "process", "thread", "message"}
+        assert capsys.readouterr().out == ""
+        Module.clear()
+
     def test_remove_target(self, capsys):
         Logger.reset()
         Module.clear()
@@ -534,3 +1192,44 @@ class Test_Logger:
         # Log another message to ensure the target is no longer active
         info("This is a message after removing the target")
         assert len(out) == 1  # The target should not receive the second message
+
+    def test_flight_recorder(self, capsys):
+        Logger.reset()
+        Module.clear()
+        Module.set_default_level(Levels.TRACE)
+        Logger.set_level("stdout", Levels.INFO)
+        dumps = []
+        class CrashLog:
+            def __call__(self, msg: str):
+                dumps.append(msg)
+            def write_many(self, msgs: list[str]):
+                dumps.append("".join(msgs))
+
+        recorder = Target.from_flight_recorder(Target(CrashLog(), "crash_log"), size=3, trigger=Levels.ERROR)
+        Logger.add_target(recorder, Levels.TRACE)
+
+        Logger.trace("dropped, the recorder is full")
+        Logger.debug("debug context")
+        info("info context")
+        warning("warning context")
+        assert not dumps
+
+        error("the error")
+
+        assert len(dumps) == 1
+        lines = dumps[0].splitlines()
+        assert len(lines) == 3
+        assert re.match(r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] \[  INFO   \] info context", lines[0])
+        assert re.match(r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] \[ WARNING \] warning context", lines[1])
+        assert re.match(r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] \[  ERROR  \] the error", lines[2])
+        assert not Target.exist("crash_log")
+
+        # the other targets are not affected
+        result = capsys.readouterr().out
+        assert "debug context" not in result
+        assert "the error" in result
+
+        # the recorder is empty after a dump
+        error("second error")
+        assert len(dumps) == 2
+        assert "the error" not in dumps[1]
@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import json
+from enum import Enum
+
+import pytest
+
+from gamuLogger.custom_types import Levels
+from gamuLogger.jsonl import format_record
+
+
+class Color(Enum):
+    RED = 1
+
+
+class TestFormatRecord:
+    def test_fields(self):
+        # Act
+        result = format_record(Levels.WARNING, "disk [almost] full", "app.db", 1735732800.25, 42, "MainProcess", "Worker-1")
+
+        # Assert
+        assert result.endswith("\n")
+        assert result.count("\n") == 1
+        assert json.loads(result) == {
+            "ts": 1735732800.25,
+            "level": "WARNING",
+            "module": "app.db",
+            "pid": 42,
+            "process": "MainProcess",
+            "thread": "Worker-1",
+            "message": "disk [almost] full",
+        }
+
+    @pytest.mark.parametrize(
+        "msg",
+        [
+            "line 1\nline 2",
+            'quote " and backslash \\',
+            "unicode é ✓",
+            "control \x00 \t",
+        ],
+        ids=["newline", "escapes", "unicode", "control"]
+    )
+    def test_strings_are_escaped(self, msg):
+        # Act
+        result = format_record(Levels.INFO, msg, "", 0.0, 1, "p", "t")
+
+        # Assert
+        assert result.count("\n") == 1
+        assert json.loads(result)["message"] == msg
+
+    @pytest.mark.parametrize(
+        "msg, expected",
+        [
+            ({"key": [1, 2]}, {"key": [1, 2]}),
+            ([1, "a"], [1, "a"]),
+            (12, 12),
+            ({"color": Color.RED}, {"color": "RED"}),
+        ],
+        ids=["dict", "list", "int", "enum"]
+    )
+    def test_structured_messages(self, msg, expected):
+        # Act
+        result = format_record(Levels.INFO, msg, "", 0.0, 1, "p", "t")
+
+        # Assert
+        assert json.loads(result)["message"] == expected
+
+    @pytest.mark.parametrize(
+        "level",
+        [Levels.TRACE, Levels.DEBUG, Levels.INFO, Levels.WARNING, Levels.ERROR, Levels.FATAL]
+    )
+    def test_levels(self, level):
+        assert json.loads(format_record(level, "", "", 0.0, 1, "p", "t"))["level"] == level.name
+
+    def test_structured_fields(self):
+        # Act
+        result = format_record(Levels.INFO, "order placed", "", 0.0, 1, "p", "t",
+                               {"order_id": 42, "amount": 9.5, "tags": ["a"], "color": Color.RED, "note": 'say "hi"'})
+
+        # Assert
+        assert result.count("\n") == 1
+        assert json.loads(result)["fields"] == {"order_id": 42, "amount": 9.5, "tags": ["a"], "color": "RED", "note": 'say "hi"'}
+
+    @pytest.mark.parametrize("fields", [None, {}], ids=["none", "empty"])
+    def test_no_fields(self, fields):
+        assert "fields" not in json.loads(format_record(Levels.INFO, "", "", 0.0, 1, "p", "t", fields))
+
+    def test_context(self):
+        # Act
+        result = format_record(Levels.INFO, "m", "", 0.0, 1, "p", "t", {"order_id": 42}, '"request_id":"abc"')
+
+        # Assert
+        record = json.loads(result)
+        assert record["context"] == {"request_id": "abc"}
+        assert record["fields"] == {"order_id": 42}
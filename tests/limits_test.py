@@ -0,0 +1,267 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from gamuLogger.limits import (MIN_FLUSH_PERIOD, Collapser, Flusher,
+                               RateLimiter, Sampler)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with patch("gamuLogger.limits.time.monotonic", clock):
+        yield clock
+
+
+class TestRateLimiter:
+    def test_burst_then_rate(self, clock):
+        # Arrange
+        limiter = RateLimiter(2, burst=3)
+
+        # Act
+        burst = [limiter.admit() for _ in range(5)]
+        clock.now += 1.0
+        refilled = [limiter.admit() for _ in range(3)]
+
+        # Assert
+        assert burst == [0, 0, 0, None, None]
+        assert refilled == [0, 0, None]
+        assert limiter.suppressed == 3
+
+    @pytest.mark.parametrize(
+        "rate, expected",
+        [(0.5, 1), (2, 2), (2.5, 3)],
+        ids=["slow", "integer", "fraction"]
+    )
+    def test_default_burst(self, rate, expected):
+        assert RateLimiter(rate).burst == expected
+
+    def test_summary(self, clock):
+        # Arrange
+        limiter = RateLimiter(1, summary_interval=10.0)
+        limiter.admit()
+        for _ in range(5):
+            limiter.admit()
+
+        # Act
+        clock.now += 1.0
+        too_early = limiter.admit()
+        limiter.admit() # suppressed
+        clock.now += 10.0
+        summary = limiter.admit()
+        clock.now += 1.0
+        after = limiter.admit()
+
+        # Assert
+        assert too_early == 0
+        assert summary == 6
+        assert after == 0
+        assert limiter.suppressed == 0
+
+    def test_flush(self, clock):
+        # Arrange
+        limiter = RateLimiter(1, summary_interval=10.0)
+        limiter.admit("first")
+        limiter.admit("second") # suppressed
+        limiter.admit("third") # suppressed
+
+        # Act
+        too_early = limiter.flush(expired=True)
+        clock.now += 10.0
+        expired = limiter.flush(expired=True)
+        after = limiter.flush()
+
+        # Assert
+        assert too_early == (0, "third")
+        assert expired == (2, "third") # the flood stopped: no admitted record reports it
+        assert after == (0, "third")
+        assert limiter.suppressed == 0
+
+    def test_copy(self, clock): # pylint: disable=unused-argument
+        # Arrange
+        limiter = RateLimiter(1, burst=1, summary_interval=5.0)
+        limiter.admit()
+
+        # Act
+        copy = limiter.copy()
+
+        # Assert
+        assert copy.admit() == 0
+        assert (copy.rate, copy.burst, copy.summary_interval) == (1, 1, 5.0)
+
+    @pytest.mark.parametrize(
+        "rate, burst, summary_interval",
+        [(0, None, 1.0), (1, 0, 1.0), (1, None, -1.0)],
+        ids=["rate", "burst", "summary_interval"]
+    )
+    def test_invalid_arguments(self, rate, burst, summary_interval):
+        with pytest.raises(ValueError):
+            RateLimiter(rate, burst, summary_interval)
+
+
+class TestSampler:
+    @pytest.mark.parametrize(
+        "probability, expected",
+        [(0.0, 0), (1.0, 1000)],
+        ids=["never", "always"]
+    )
+    def test_bounds(self, probability, expected):
+        # Arrange
+        sampler = Sampler(probability)
+
+        # Act
+        kept = sum(sampler.admit() is not None for _ in range(1000))
+
+        # Assert
+        assert kept == expected
+        assert sampler.suppressed == 1000 - expected
+
+    def test_probability(self):
+        # Arrange
+        sampler = Sampler(0.1)
+
+        # Act
+        with patch("gamuLogger.limits.random.random", side_effect=[0.05, 0.5, 0.09, 0.1]):
+            kept = [sampler.admit() is not None for _ in range(4)]
+
+        # Assert
+        assert kept == [True, False, True, False]
+
+    @pytest.mark.parametrize("probability", [-0.1, 1.1], ids=["negative", "above_one"])
+    def test_invalid_probability(self, probability):
+        with pytest.raises(ValueError):
+            Sampler(probability)
+
+
+class TestCollapser:
+    def test_repetitions(self, clock): # pylint: disable=unused-argument
+        # Arrange
+        collapser = Collapser()
+
+        # Act
+        results = [collapser.push(key, key) for key in ("a", "a", "a", "b", "a", "a")]
+
+        # Assert
+        assert results == [(0, None), None, None, (2, "a"), (0, "b"), None]
+        assert collapser.flush() == (1, "a")
+        assert collapser.flush() == (0, "a")
+
+    def test_max_delay(self, clock):
+        # Arrange
+        collapser = Collapser(max_delay=5)
+        collapser.push("a", 1)
+        collapser.push("a", 2)
+
+        # Act
+        clock.now += 5.0
+        result = collapser.push("a", 3)
+
+        # Assert
+        assert result == (1, 1)
+        assert collapser.push("a", 4) is None
+
+    def test_flush_expired(self, clock):
+        # Arrange
+        collapser = Collapser(max_delay=5)
+        collapser.push("a", 1)
+        collapser.push("a", 2)
+
+        # Act
+        early = collapser.flush(expired=True)
+        clock.now += 5.0
+        expired = collapser.flush(expired=True)
+
+        # Assert
+        assert early == (0, 1)
+        assert expired == (1, 1)
+        assert collapser.push("a", 3) == (0, 1) # written again, its repetitions are already reported
+
+    @pytest.mark.parametrize(
+        "key",
+        [None, ("unhashable", [])],
+        ids=["none", "unhashable"]
+    )
+    def test_never_matches(self, key):
+        # Arrange
+        collapser = Collapser()
+        collapser.push(key, 1)
+
+        # Act
+        result = collapser.push(key, 2)
+
+        # Assert
+        assert result == (0, 1)
+
+    @pytest.mark.parametrize(
+        "max_delay",
+        [0, -1],
+        ids=["zero", "negative"]
+    )
+    def test_invalid_max_delay(self, max_delay):
+        with pytest.raises(ValueError):
+            Collapser(max_delay)
+
+
+class TestFlusher:
+    def test_schedule(self):
+        # Arrange
+        flushed = threading.Event()
+        flusher = Flusher(flushed.set)
+
+        # Act
+        flusher.schedule(10)
+        flusher.schedule(0.1)
+        flusher.schedule(1)
+
+        # Assert
+        assert flusher.period == MIN_FLUSH_PERIOD
+        assert flushed.wait(2)
+        flusher.stop()
+        assert flusher.period is None
+
+    def test_failing_flush(self):
+        # Arrange
+        calls = []
+
+        def flush():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("target unavailable")
+
+        flusher = Flusher(flush)
+
+        # Act
+        flusher.schedule(0)
+        for _ in range(100):
+            if len(calls) >= 2:
+                break
+            threading.Event().wait(0.05)
+
+        # Assert
+        assert len(calls) >= 2 # the thread survives the error
+        flusher.stop()
@@ -18,7 +18,8 @@
 
 import pytest
 
-from gamuLogger.module import Module
+from gamuLogger.custom_types import Levels
+from gamuLogger.module import Module, ModuleRegistry
 
 class TestModule:
     @pytest.mark.parametrize(
@@ -315,3 +316,23 @@ class TestModule:
 
         # Assert
         assert ("file1.py", "func1") in all_modules
+
+
+class TestModuleRegistry:
+    def test_separate_registries(self):
+        # Arrange
+        Module.clear()
+        registry = ModuleRegistry()
+
+        # Act
+        module = registry.new("a.b", "file.py", "func")
+        registry.set_level("a.b", Levels.ERROR)
+        with registry.active():
+            active_level = Module.get_level("a.b")
+
+        # Assert
+        assert registry.get("file.py", "func") is module
+        assert module.get_complete_name() == "a.b"
+        assert not Module.exist("file.py", "func")
+        assert active_level == Levels.ERROR
+        assert Module.get_level("a.b") == Module.get_default_level()
@@ -0,0 +1,520 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import gzip
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gamuLogger.custom_types import Levels
+from gamuLogger.gamu_logger import Logger
+from gamuLogger.network import HttpWriter, SocketWriter
+from gamuLogger.targets import Target
+
+
+class Collector:
+    """
+    A local listener standing in for the log collector; it keeps what it receives.
+    """
+    def __init__(self, family, kind, address):
+        self.sock = socket.socket(family, kind)
+        self.sock.bind(address)
+        self.kind = kind
+        if kind == socket.SOCK_STREAM:
+            self.sock.listen()
+        self.address = self.sock.getsockname()
+        self.data = bytearray()
+        self.packets = []
+        self.connections = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        try:
+            if self.kind == socket.SOCK_DGRAM:
+                while True:
+                    packet = self.sock.recv(65536)
+                    self.packets.append(packet)
+                    self.data += packet
+            while True:
+                conn, _ = self.sock.accept()
+                self.connections += 1
+                with conn:
+                    while chunk := conn.recv(65536):
+                        self.data += chunk
+        except OSError: # closed
+            pass
+
+    def lines(self):
+        return self.data.decode("utf-8").splitlines()
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+class Endpoint:
+    """
+    A local HTTP server standing in for the log ingestion endpoint.
+    It answers the `statuses` in order (then 200, or 503 while `down`), and keeps the decoded bodies it accepted.
+    """
+    def __init__(self, statuses=()):
+        self.statuses = list(statuses)
+        self.down = False
+        self.bodies = []
+        self.requests = []
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1" # keep-alive
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                endpoint.requests.append((self.client_address, dict(self.headers)))
+                status = endpoint.statuses.pop(0) if endpoint.statuses else 503 if endpoint.down else 200
+                if status == 200:
+                    endpoint.bodies.append(body)
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args): # pylint: disable=redefined-builtin
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/ingest"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def lines(self):
+        return b"".join(self.bodies).decode("utf-8").splitlines()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def unix_address(tmp_path):
+    return str(tmp_path / "collector.sock")
+
+
+class TestSocketWriter:
+    @pytest.mark.parametrize(
+        "family, kind",
+        [
+            (socket.AF_INET, socket.SOCK_STREAM),
+            (socket.AF_INET, socket.SOCK_DGRAM),
+            (socket.AF_UNIX, socket.SOCK_STREAM),
+            (socket.AF_UNIX, socket.SOCK_DGRAM),
+        ],
+        ids=["tcp", "udp", "unix_stream", "unix_datagram"]
+    )
+    def test_sends_lines(self, family, kind, unix_address):
+        # Arrange
+        collector = Collector(family, kind, ("127.0.0.1", 0) if family == socket.AF_INET else unix_address)
+        writer = SocketWriter(collector.address, kind, flush_interval=0.05)
+
+        # Act
+        for i in range(100):
+            writer(f"line {i}\n")
+        sent = writer.flush(timeout=5)
+
+        # Assert
+        assert sent
+        assert wait_until(lambda: len(collector.lines()) == 100)
+        assert collector.lines() == [f"line {i}" for i in range(100)]
+        writer.close()
+        collector.close()
+
+    def test_keeps_the_connection(self):
+        # Arrange
+        collector = Collector(socket.AF_INET, socket.SOCK_STREAM, ("127.0.0.1", 0))
+        writer = SocketWriter(collector.address, flush_interval=0.01)
+
+        # Act
+        for i in range(5):
+            writer(f"line {i}\n")
+            writer.flush(timeout=5)
+
+        # Assert
+        assert wait_until(lambda: len(collector.lines()) == 5)
+        assert collector.connections == 1
+        writer.close()
+        collector.close()
+
+    def test_batches_by_size(self):
+        # Arrange
+        collector = Collector(socket.AF_INET, socket.SOCK_DGRAM, ("127.0.0.1", 0))
+        writer = SocketWriter(collector.address, socket.SOCK_DGRAM, batch_size=100, flush_interval=60)
+
+        # Act
+        for i in range(20):
+            writer(f"line {i:04d}\n") # 10 bytes each
+
+        # Assert
+        assert wait_until(lambda: len(collector.lines()) == 20) # sent before the flush interval
+        assert all(len(packet) <= 100 for packet in collector.packets)
+        writer.close()
+        collector.close()
+
+    def test_datagrams_are_bounded(self):
+        # Arrange
+        collector = Collector(socket.AF_INET, socket.SOCK_DGRAM, ("127.0.0.1", 0))
+        writer = SocketWriter(collector.address, socket.SOCK_DGRAM, flush_interval=0.01, datagram_size=64)
+
+        # Act
+        writer.write_many([f"line {i:04d}\n" for i in range(20)] + ["x" * 100 + "\n"])
+        writer.flush(timeout=5)
+
+        # Assert
+        assert wait_until(lambda: len(collector.packets) >= 5)
+        assert all(len(packet) <= 64 for packet in collector.packets)
+        assert collector.lines()[:20] == [f"line {i:04d}" for i in range(20)]
+        assert collector.lines()[20] == "x" * 64
+        writer.close()
+        collector.close()
+
+    def test_spools_and_reconnects(self, unix_address):
+        # Arrange
+        writer = SocketWriter(unix_address, flush_interval=0.01, max_backoff=0.05)
+        writer("before\n")
+        time.sleep(0.1) # a few failed attempts
+
+        # Act
+        collector = Collector(socket.AF_UNIX, socket.SOCK_STREAM, unix_address)
+        writer("after\n")
+        sent = writer.flush(timeout=5)
+
+        # Assert
+        assert sent
+        assert wait_until(lambda: len(collector.lines()) == 2)
+        assert collector.lines() == ["before", "after"]
+        assert writer.dropped == 0
+        writer.close()
+        collector.close()
+
+    def test_spool_is_bounded(self, unix_address):
+        # Arrange
+        writer = SocketWriter(unix_address, flush_interval=0.01, spool_size=100, max_backoff=0.05)
+
+        # Act
+        for i in range(50):
+            writer(f"line {i:04d}\n") # 10 bytes each
+
+        # Assert
+        assert writer.pending <= 10
+        assert writer.dropped >= 40
+        collector = Collector(socket.AF_UNIX, socket.SOCK_STREAM, unix_address)
+        assert writer.flush(timeout=5)
+        assert wait_until(lambda: collector.lines()[-1:] == ["line 0049"])
+        writer.close()
+        collector.close()
+
+    def test_flush_timeout_when_unreachable(self, unix_address):
+        # Arrange
+        writer = SocketWriter(unix_address, flush_interval=0.01, max_backoff=0.05)
+        writer("lost\n")
+
+        # Act
+        sent = writer.flush(timeout=0.2)
+        writer.close(timeout=0.2)
+
+        # Assert
+        assert not sent
+        assert writer.dropped == 1
+
+    def test_write_after_close_is_dropped(self, unix_address):
+        # Arrange
+        writer = SocketWriter(unix_address)
+        writer.close()
+
+        # Act
+        writer("late\n")
+
+        # Assert
+        assert writer.pending == 0
+        assert writer.dropped == 1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"kind": socket.SOCK_RAW},
+            {"batch_size": 0},
+            {"spool_size": 0},
+            {"flush_interval": 0},
+            {"max_backoff": 0},
+        ],
+        ids=["kind", "batch_size", "spool_size", "flush_interval", "max_backoff"]
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            SocketWriter(("127.0.0.1", 1), **kwargs)
+
+
+class TestHttpWriter:
+    def test_posts_gzipped_ndjson(self):
+        # Arrange
+        endpoint = Endpoint()
+        writer = HttpWriter(endpoint.url, flush_interval=0.01, headers={"Authorization": "Bearer token"})
+
+        # Act
+        for i in range(100):
+            writer(f"line {i}\n")
+        sent = writer.flush(timeout=5)
+
+        # Assert
+        assert sent
+        assert endpoint.lines() == [f"line {i}" for i in range(100)]
+        headers = endpoint.requests[0][1]
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Content-Type"] == "application/x-ndjson"
+        assert headers["Authorization"] == "Bearer token"
+        writer.close()
+        endpoint.close()
+
+    def test_posts_json_array(self):
+        # Arrange
+        endpoint = Endpoint()
+        writer = HttpWriter(endpoint.url, payload="json", compress=False, flush_interval=0.01)
+
+        # Act
+        writer.write_many(['{"message": "first"}\n', '{"message": "second"}\n'])
+        writer.flush(timeout=5)
+
+        # Assert
+        assert json.loads(endpoint.bodies[0]) == [{"message": "first"}, {"message": "second"}]
+        assert "Content-Encoding" not in endpoint.requests[0][1]
+        writer.close()
+        endpoint.close()
+
+    def test_keeps_the_connection_alive(self):
+        # Arrange
+        endpoint = Endpoint()
+        writer = HttpWriter(endpoint.url, flush_interval=0.01)
+
+        # Act
+        for i in range(5):
+            writer(f"line {i}\n")
+            writer.flush(timeout=5)
+
+        # Assert
+        assert len(endpoint.requests) == 5
+        assert len({address for address, _ in endpoint.requests}) == 1
+        writer.close()
+        endpoint.close()
+
+    def test_batches_by_size(self):
+        # Arrange
+        endpoint = Endpoint()
+        writer = HttpWriter(endpoint.url, batch_size=100, flush_interval=60)
+
+        # Act
+        for i in range(20):
+            writer(f"line {i:04d}\n") # 10 bytes each
+
+        # Assert
+        assert wait_until(lambda: len(endpoint.lines()) == 20) # sent before the flush interval
+        assert all(len(body) <= 100 for body in endpoint.bodies)
+        writer.close()
+        endpoint.close()
+
+    def test_retries_server_errors(self):
+        # Arrange
+        endpoint = Endpoint([503, 500])
+        writer = HttpWriter(endpoint.url, flush_interval=0.01, max_backoff=0.05)
+
+        # Act
+        writer("retried\n")
+        sent = writer.flush(timeout=5)
+
+        # Assert
+        assert sent
+        assert len(endpoint.requests) == 3
+        assert endpoint.lines() == ["retried"]
+        assert writer.dropped == 0
+        writer.close()
+        endpoint.close()
+
+    def test_drops_after_max_retries(self):
+        # Arrange
+        endpoint = Endpoint([503] * 3)
+        writer = HttpWriter(endpoint.url, flush_interval=0.01, max_backoff=0.05, max_retries=2)
+
+        # Act
+        writer("dropped\n")
+        sent = writer.flush(timeout=5)
+        writer("kept\n")
+        writer.flush(timeout=5)
+
+        # Assert
+        assert sent
+        assert writer.dropped == 1
+        assert endpoint.lines() == ["kept"]
+        writer.close()
+        endpoint.close()
+
+    def test_rejected_batch_is_not_retried(self):
+        # Arrange
+        endpoint = Endpoint([400])
+        writer = HttpWriter(endpoint.url, flush_interval=0.01)
+
+        # Act
+        writer("invalid\n")
+        writer.flush(timeout=5)
+
+        # Assert
+        assert len(endpoint.requests) == 1
+        assert writer.rejected == 1
+        writer.close()
+        endpoint.close()
+
+    @pytest.mark.parametrize(
+        "drop, first, last",
+        [("oldest", 40, 49), ("newest", 0, 9)],
+        ids=["oldest", "newest"]
+    )
+    def test_drop_policy_when_down(self, drop, first, last):
+        # Arrange
+        endpoint = Endpoint()
+        endpoint.down = True
+        writer = HttpWriter(endpoint.url, flush_interval=0.01, spool_size=100, max_backoff=0.05, max_retries=None, drop=drop)
+        writer("line 0000\n") # 10 bytes each
+        assert wait_until(lambda: len(endpoint.requests) >= 1) # the first line is in flight, not in the spool
+
+        # Act
+        for i in range(1, 50):
+            writer(f"line {i:04d}\n")
+        endpoint.down = False
+        writer.flush(timeout=5)
+
+        # Assert
+        lines = endpoint.lines()
+        assert writer.dropped == 50 - len(lines)
+        assert len(lines) in (10, 11) # the spool, and maybe the line that was in flight
+        assert f"line {last:04d}" in lines
+        assert f"line {first:04d}" in lines
+        writer.close()
+        endpoint.close()
+
+    @pytest.mark.parametrize(
+        "url, kwargs",
+        [
+            ("ftp://localhost/", {}),
+            ("http:///path", {}),
+            ("http://localhost/", {"payload": "xml"}),
+            ("http://localhost/", {"drop": "random"}),
+            ("http://localhost/", {"max_retries": -1}),
+        ],
+        ids=["scheme", "host", "payload", "drop", "max_retries"]
+    )
+    def test_invalid_arguments(self, url, kwargs):
+        with pytest.raises(ValueError):
+            HttpWriter(url, **kwargs)
+
+
+class TestFromHttp:
+    def test_logger_to_endpoint(self):
+        # Arrange
+        endpoint = Endpoint()
+        Logger.reset()
+        Logger.remove_target("stdout")
+        target = Target.from_http(endpoint.url, flush_interval=0.01)
+
+        # Act
+        Logger.add_target(target, Levels.INFO)
+        Logger.info("shipped")
+        target.target.flush(timeout=5)
+
+        # Assert
+        assert target.name == endpoint.url
+        assert len(endpoint.lines()) == 1
+        assert endpoint.lines()[0].endswith("] shipped")
+        target.target.close()
+        endpoint.close()
+        Logger.reset()
+
+    def test_json_payload(self):
+        # Arrange
+        endpoint = Endpoint()
+        Logger.reset()
+        Logger.remove_target("stdout")
+        target = Target.from_http(endpoint.url, payload="json", compress=False, flush_interval=0.01)
+
+        # Act
+        Logger.add_target(target, Levels.INFO)
+        Logger.info("shipped", order_id=3)
+        Logger.info("again")
+        target.target.flush(timeout=5)
+
+        # Assert
+        assert target.format == "jsonl"
+        records = [record for body in endpoint.bodies for record in json.loads(body)]
+        assert all(isinstance(record, dict) for record in records) # decoded once
+        assert [record["message"] for record in records] == ["shipped", "again"]
+        assert records[0]["fields"] == {"order_id": 3}
+        target.target.close()
+        endpoint.close()
+        Logger.reset()
+
+
+class TestFromSocket:
+    def test_logger_to_tcp_collector(self):
+        # Arrange
+        collector = Collector(socket.AF_INET, socket.SOCK_STREAM, ("127.0.0.1", 0))
+        Logger.reset()
+        Logger.remove_target("stdout")
+        target = Target.from_socket(collector.address, flush_interval=0.01)
+
+        # Act
+        Logger.add_target(target, Levels.INFO)
+        Logger.info("shipped")
+        Logger.debug("filtered")
+        target.target.flush(timeout=5)
+
+        # Assert
+        assert target.name == f"127.0.0.1:{collector.address[1]}"
+        assert wait_until(lambda: len(collector.lines()) == 1)
+        assert collector.lines()[0].endswith("] shipped")
+        target.target.close()
+        collector.close()
+        Logger.reset()
+
+    def test_unix_name(self, unix_address):
+        # Act
+        target = Target.from_socket(unix_address, socket.SOCK_DGRAM)
+
+        # Assert
+        assert target.name == unix_address
+        target.target.close()
+        Target.unregister(target)
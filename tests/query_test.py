@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import sqlite3
+import types
+
+import pytest
+
+from gamuLogger import query
+from gamuLogger.custom_types import Levels
+from gamuLogger.database import SqliteWriter
+
+ROWS = [
+    (1000.0, Levels.DEBUG,   "app",         1, "MainProcess", "MainThread", "starting", {}),
+    (1001.0, Levels.INFO,    "app.db",      1, "MainProcess", "MainThread", "connected", {}),
+    (1002.0, Levels.WARNING, "application", 1, "MainProcess", "Worker-1",   "slow", {}),
+    (1003.0, Levels.ERROR,   "app.db.pool", 1, "MainProcess", "Worker-2",   "exhausted", {}),
+    (1004.0, Levels.FATAL,   "",            1, "MainProcess", "MainThread", "crashed", {}),
+]
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = str(tmp_path / "logs.db")
+    writer = SqliteWriter(path)
+    writer.write_many(ROWS)
+    writer.close()
+    return path
+
+
+def messages(rows):
+    return [row[6] for row in rows]
+
+
+class TestQuery:
+    def test_select_all(self, database):
+        # Act
+        rows = query.select(database)
+
+        # Assert
+        assert isinstance(rows, types.GeneratorType)
+        assert list(rows) == ROWS
+        assert isinstance(ROWS[0][1], Levels)
+
+    @pytest.mark.parametrize(
+        "start, end, expected",
+        [
+            (1001.0, 1003.0, ["connected", "slow"]),
+            (0.0, 1000.5, ["starting"]),
+            (2000.0, 3000.0, []),
+        ],
+        ids=["middle", "start", "none"]
+    )
+    def test_time_range(self, database, start, end, expected):
+        assert messages(query.time_range(database, start, end)) == expected
+
+    @pytest.mark.parametrize(
+        "level, expected",
+        [
+            (Levels.TRACE, ["starting", "connected", "slow", "exhausted", "crashed"]),
+            (Levels.WARNING, ["slow", "exhausted", "crashed"]),
+            (Levels.FATAL, ["crashed"]),
+        ],
+        ids=["trace", "warning", "fatal"]
+    )
+    def test_min_level(self, database, level, expected):
+        assert messages(query.min_level(database, level)) == expected
+
+    @pytest.mark.parametrize(
+        "module, expected",
+        [
+            ("app", ["starting", "connected", "exhausted"]),
+            ("app.db", ["connected", "exhausted"]),
+            ("application", ["slow"]),
+            ("ap", []),
+        ],
+        ids=["root", "submodule", "similar_name", "partial_name"]
+    )
+    def test_module_prefix(self, database, module, expected):
+        assert messages(query.module_prefix(database, module)) == expected
+
+    def test_combined_criteria_and_limit(self, database):
+        # Act
+        rows = query.select(database, start=1001.0, level=Levels.INFO, module="app", limit=1)
+
+        # Assert
+        assert messages(rows) == ["connected"]
+
+    def test_fields_are_decoded(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs.db")
+        writer = SqliteWriter(path)
+        writer((1000.0, Levels.INFO, "app", 1, "MainProcess", "MainThread", "order placed", {"order_id": 42, "tags": ["a"]}))
+        writer.close()
+
+        # Act
+        rows = list(query.select(path))
+
+        # Assert
+        assert rows[0][7] == {"order_id": 42, "tags": ["a"]}
+
+    def test_does_not_create_database(self, tmp_path):
+        # Arrange
+        path = tmp_path / "missing.db"
+
+        # Act & Assert
+        with pytest.raises(sqlite3.OperationalError):
+            list(query.select(str(path)))
+        assert not path.exists()
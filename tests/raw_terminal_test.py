@@ -0,0 +1,284 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from gamuLogger.gamu_logger import Levels, Logger, Module
+from gamuLogger.raw_terminal import FdWriter, FlushPolicy
+from gamuLogger.targets import Target, TerminalTarget
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def read_available(fd : int) -> bytes:
+    os.set_blocking(fd, False)
+    try:
+        return os.read(fd, 1 << 20)
+    except BlockingIOError:
+        return b""
+
+
+class TestFlushPolicy:
+    @pytest.mark.parametrize(
+        "policy, expected",
+        [
+            ("line", FlushPolicy.LINE),
+            ("SIZE", FlushPolicy.SIZE),
+            ("Time", FlushPolicy.TIME),
+        ]
+    )
+    def test_from_string(self, policy, expected):
+        assert FlushPolicy.from_string(policy) == expected
+
+    def test_from_string_invalid(self):
+        with pytest.raises(ValueError, match="Invalid flush policy: never"):
+            FlushPolicy.from_string("never")
+
+    def test_str(self):
+        assert str(FlushPolicy.LINE) == "line"
+
+
+class TestFdWriter:
+    @pytest.mark.parametrize(
+        "buffer_size, flush_interval",
+        [(0, 1.0), (1024, 0)],
+        ids=["buffer_size", "flush_interval"]
+    )
+    def test_invalid_arguments(self, pipe, buffer_size, flush_interval):
+        with pytest.raises(ValueError):
+            FdWriter(pipe[1], FlushPolicy.SIZE, buffer_size, flush_interval)
+
+    def test_line_policy_writes_each_log(self, pipe):
+        # Arrange
+        writer = FdWriter(pipe[1], FlushPolicy.LINE)
+
+        # Act
+        writer("héllo\n")
+
+        # Assert
+        assert read_available(pipe[0]) == "héllo\n".encode("utf-8")
+        writer.close()
+
+    def test_size_policy_buffers_until_full(self, pipe):
+        # Arrange
+        writer = FdWriter(pipe[1], FlushPolicy.SIZE, buffer_size=16)
+
+        # Act
+        writer("12345\n")
+        first = read_available(pipe[0])
+        writer("67890\n")
+        writer("abcde\n")
+
+        # Assert
+        assert first == b""
+        assert read_available(pipe[0]) == b"12345\n67890\nabcde\n"
+        writer.close()
+
+    def test_flush_and_close_write_the_buffer(self, pipe):
+        # Arrange
+        writer = FdWriter(pipe[1], FlushPolicy.SIZE)
+        writer("first\n")
+
+        # Act
+        writer.flush()
+        flushed = read_available(pipe[0])
+        writer("second\n")
+        writer.close()
+
+        # Assert
+        assert flushed == b"first\n"
+        assert read_available(pipe[0]) == b"second\n"
+
+    def test_time_policy_writes_in_background(self, pipe):
+        # Arrange
+        writer = FdWriter(pipe[1], FlushPolicy.TIME, flush_interval=0.05)
+
+        # Act
+        writer("tick\n")
+        before = read_available(pipe[0])
+        time.sleep(0.3)
+
+        # Assert
+        assert before == b""
+        assert read_available(pipe[0]) == b"tick\n"
+        writer.close()
+
+    def test_write_many(self, pipe):
+        # Arrange
+        writer = FdWriter(pipe[1], FlushPolicy.LINE)
+
+        # Act
+        with patch("gamuLogger.raw_terminal.os.write", wraps=os.write) as mock_write:
+            writer.write_many(["a\n", "b\n", "c\n"])
+
+        # Assert
+        assert mock_write.call_count == 1
+        assert read_available(pipe[0]) == b"a\nb\nc\n"
+        writer.close()
+
+    def test_resumes_partial_writes(self, pipe):
+        # Arrange
+        writer = FdWriter(pipe[1], FlushPolicy.SIZE)
+        writer("0123456789\n")
+        real_write = os.write
+
+        def partial_write(fd, data):
+            return real_write(fd, bytes(data[:3]))
+
+        # Act
+        with patch("gamuLogger.raw_terminal.os.write", side_effect=partial_write) as mock_write:
+            writer.flush()
+
+        # Assert
+        assert mock_write.call_count == 4
+        assert read_available(pipe[0]) == b"0123456789\n"
+
+    def test_waits_when_would_block(self, pipe):
+        # Arrange
+        read_fd, write_fd = pipe
+        os.set_blocking(write_fd, False)
+        writer = FdWriter(write_fd, FlushPolicy.SIZE, buffer_size=1 << 22)
+        data = "x" * 1023 + "\n"
+        for _ in range(1024): # 1 MiB, much more than the pipe capacity
+            writer(data)
+        received = bytearray()
+
+        def slow_reader():
+            while len(received) < 1 << 20:
+                chunk = os.read(read_fd, 4096)
+                received.extend(chunk)
+                time.sleep(0.0001)
+
+        reader = threading.Thread(target=slow_reader)
+
+        # Act
+        reader.start()
+        writer.flush()
+        reader.join(timeout=30)
+
+        # Assert
+        assert bytes(received) == data.encode("utf-8") * 1024
+
+    def test_broken_pipe_drops_the_buffer(self):
+        # Arrange
+        read_fd, write_fd = os.pipe()
+        os.close(read_fd)
+        writer = FdWriter(write_fd, FlushPolicy.SIZE)
+        writer("lost\n")
+
+        # Act
+        with pytest.raises(BrokenPipeError):
+            writer.flush()
+        writer.flush() # nothing left to write
+
+        # Assert
+        os.close(write_fd)
+        writer.close()
+
+
+class TestFromRawTerminal:
+    def test_replaces_terminal_target(self, capfd):
+        # Arrange
+        Target.clear()
+
+        # Act
+        target = Target.from_raw_terminal(TerminalTarget.STDOUT)
+        target("raw log\n")
+
+        # Assert
+        assert target.name == "stdout"
+        assert target.type == Target.Type.TERMINAL
+        assert isinstance(target.target, FdWriter)
+        assert target["level"] == Levels.INFO
+        assert Target.routes(Levels.INFO) == (target,)
+        assert capfd.readouterr().out == "raw log\n"
+        target.target.close()
+        Target.clear()
+
+    def test_swaps_raw_writer(self, capfd):
+        # Arrange
+        Target.clear()
+        target = Target.from_raw_terminal(TerminalTarget.STDOUT, FlushPolicy.TIME, flush_interval=60)
+        previous = target.target
+        target("buffered log\n")
+
+        # Act
+        Target.from_raw_terminal(TerminalTarget.STDOUT)
+        target("raw log\n")
+
+        # Assert
+        assert target.target is not previous
+        assert capfd.readouterr().out == "buffered log\nraw log\n"
+        assert previous._FdWriter__closed.is_set()
+        target.target.close()
+        Target.clear()
+
+    def test_keeps_configuration(self, capfd):
+        # Arrange
+        Logger.reset()
+        Module.clear()
+        stdout = Target.get("stdout")
+        Logger.set_level("stdout", Levels.WARNING)
+        Logger.add_filter("stdout", Levels.NONE, message="^heartbeat")
+        Logger.add_filter("stdout")
+        lock = stdout._Target__lock
+        capfd.readouterr()
+
+        # Act
+        target = Target.from_raw_terminal(TerminalTarget.STDOUT)
+        Logger.warning("heartbeat")
+        Logger.info("below the level")
+        Logger.warning("raw warning")
+
+        # Assert
+        assert target is stdout
+        assert isinstance(target.target, FdWriter)
+        assert target["level"] == Levels.WARNING
+        assert len(target.filters) == 2 and "filter" in target
+        assert target._Target__lock is lock # the lock other threads may hold is kept
+        assert Target.routes(Levels.WARNING) == (target,)
+        lines = capfd.readouterr().out.splitlines()
+        assert len(lines) == 1 and lines[0].endswith("raw warning")
+        target.target.close()
+        Logger.reset()
+
+    def test_stderr_write_many(self, capfd):
+        # Arrange
+        Target.clear()
+        target = Target.from_raw_terminal(TerminalTarget.STDERR, FlushPolicy.SIZE)
+
+        # Act
+        target.write_many(["a\n", "b\n"])
+        before = capfd.readouterr().err
+        target.target.flush()
+
+        # Assert
+        assert target.name == "stderr"
+        assert before == ""
+        assert capfd.readouterr().err == "a\nb\n"
+        target.target.close()
+        Target.clear()
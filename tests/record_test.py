@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import os
+import threading
+
+from gamuLogger.custom_types import Levels
+from gamuLogger.record import LogRecord
+
+
+def acquire(msg = "message", **fields):
+    return LogRecord.acquire(Levels.INFO, msg, ("file.py", "<module>"), None, fields)
+
+
+class TestLogRecord:
+    def test_acquire(self):
+        # Act
+        record = acquire("hello", user="alice")
+
+        # Assert
+        assert record.level == Levels.INFO
+        assert record.msg == "hello"
+        assert record.caller_info == ("file.py", "<module>")
+        assert record.fields == {"user": "alice"}
+        assert record.context is None
+        assert record.exception is None
+        assert record.pid == os.getpid()
+        assert record.thread_id == threading.get_ident()
+        assert record.thread_name == threading.current_thread().name
+        assert not record.retained
+        record.release()
+
+    def test_sequence(self):
+        # Act
+        first = acquire()
+        second = acquire()
+
+        # Assert
+        assert second.sequence > first.sequence
+        assert second.monotonic >= first.monotonic
+        first.release()
+        second.release()
+
+    def test_reuse(self):
+        # Arrange
+        record = acquire("first", user="alice")
+        sequence = record.sequence
+
+        # Act
+        record.release()
+
+        # Assert
+        assert record.msg is None and record.fields is None # the references are dropped
+        reused = acquire("second")
+        assert reused is record
+        assert reused.msg == "second"
+        assert reused.sequence > sequence
+        reused.release()
+
+    def test_retained(self):
+        # Arrange
+        record = acquire("kept")
+        record.retain()
+
+        # Act
+        record.release()
+
+        # Assert
+        assert record.msg == "kept"
+        other = acquire()
+        assert other is not record
+        other.release()
+
+    def test_free_list_bound(self):
+        # Arrange
+        records = [acquire() for _ in range(200)]
+
+        # Act
+        for record in records:
+            record.release()
+
+        # Assert
+        assert len(LogRecord._LogRecord__free) <= 64
@@ -0,0 +1,161 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import os
+
+import pytest
+
+from gamuLogger.ring_file import HEADER, RingFile, read_ring_file
+from gamuLogger.targets import Target
+
+
+class TestRingFile:
+    def test_preallocates_file(self, tmp_path):
+        # Act
+        RingFile(str(tmp_path / "ring.log"), 4096)
+
+        # Assert
+        assert os.path.getsize(tmp_path / "ring.log") == 4096
+        assert not read_ring_file(str(tmp_path / "ring.log"))
+
+    def test_records_in_order(self, tmp_path):
+        # Arrange
+        ring = RingFile(str(tmp_path / "ring.log"), 4096)
+
+        # Act
+        for i in range(10):
+            ring(f"record {i}\n")
+
+        # Assert
+        assert ring.records() == [f"record {i}\n" for i in range(10)]
+        assert read_ring_file(str(tmp_path / "ring.log")) == [f"record {i}\n" for i in range(10)]
+
+    @pytest.mark.parametrize(
+        "nb_records",
+        [50, 51, 97, 500],
+        ids=["fill", "wrap_once", "wrap_split_record", "wrap_many_times"]
+    )
+    def test_wrap_keeps_newest_records(self, tmp_path, nb_records):
+        # Arrange
+        ring = RingFile(str(tmp_path / "ring.log"), HEADER.size + 50 * 11) # 50 records of 11 bytes (10 + record start)
+        records = [f"rec {i:04d}\n" for i in range(nb_records)]
+
+        # Act
+        for record in records:
+            ring(record)
+
+        # Assert
+        result = read_ring_file(str(tmp_path / "ring.log"))
+        assert result == records[len(records) - len(result):]
+        assert len(result) >= 49
+        assert os.path.getsize(tmp_path / "ring.log") == HEADER.size + 50 * 11
+
+    def test_multiline_and_unicode_records(self, tmp_path):
+        # Arrange
+        ring = RingFile(str(tmp_path / "ring.log"), 200)
+        records = [f"line {i} é\n   | continuation ✓\n" for i in range(20)]
+
+        # Act
+        for record in records:
+            ring(record)
+
+        # Assert
+        result = ring.records()
+        assert result
+        assert result == records[len(records) - len(result):]
+
+    def test_write_many(self, tmp_path):
+        # Arrange
+        ring = RingFile(str(tmp_path / "ring.log"), HEADER.size + 50 * 11)
+        records = [f"rec {i:04d}\n" for i in range(120)]
+
+        # Act
+        ring.write_many(records[:60])
+        ring.write_many(records[60:])
+
+        # Assert
+        result = read_ring_file(str(tmp_path / "ring.log"))
+        assert result == records[len(records) - len(result):]
+        assert len(result) >= 49
+
+    def test_record_larger_than_file(self, tmp_path):
+        # Arrange
+        ring = RingFile(str(tmp_path / "ring.log"), HEADER.size + 16)
+
+        # Act
+        ring("x" * 100)
+
+        # Assert
+        assert ring.records() == ["x" * 15]
+
+    def test_reopen_continues(self, tmp_path):
+        # Arrange
+        ring = RingFile(str(tmp_path / "ring.log"), 4096)
+        ring("first\n")
+        ring.close()
+
+        # Act
+        ring = RingFile(str(tmp_path / "ring.log"), 4096)
+        ring("second\n")
+
+        # Assert
+        assert ring.records() == ["first\n", "second\n"]
+
+    def test_reopen_other_size_resets(self, tmp_path):
+        # Arrange
+        ring = RingFile(str(tmp_path / "ring.log"), 4096)
+        ring("first\n")
+        ring.close()
+
+        # Act
+        ring = RingFile(str(tmp_path / "ring.log"), 2048)
+
+        # Assert
+        assert not ring.records()
+        assert os.path.getsize(tmp_path / "ring.log") == 2048
+
+    def test_invalid_size(self, tmp_path):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            RingFile(str(tmp_path / "ring.log"), HEADER.size)
+
+    def test_read_not_ring_file(self, tmp_path):
+        # Arrange
+        (tmp_path / "file.log").write_bytes(b"\0" * 64)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            read_ring_file(str(tmp_path / "file.log"))
+
+
+class TestFromRingFile:
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        Target.clear()
+        yield
+
+    def test_from_ring_file(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "logs" / "ring.log")
+
+        # Act
+        target = Target.from_ring_file(path, 1024)
+        target("Test log entry\n")
+
+        # Assert
+        assert target.name == path
+        assert target.type == Target.Type.FILE
+        assert read_ring_file(path) == ["Test log entry\n"]
@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import os
+import time
+
+import pytest
+
+from gamuLogger.schema import FileSchema
+
+CURRENT_TIME = time.struct_time((2024, 3, 7, 9, 5, 2, 0, 0, -1))
+
+
+class TestFileSchema:
+    @pytest.mark.parametrize(
+        "schema, expected_name",
+        [
+            ("${date}_${hour}-${minute}.log", "2024-03-07_09-05.log"),
+            ("${time}.log", "09-05-02.log"),
+            ("${datetime}.log", "2024-03-07_09-05-02.log"),
+            ("${year}${month}${day}", "20240307"),
+            ("${second}", "02"),
+            ("app_${pid}.log", "app_12345.log"),
+            ("{braces}_${year}.log", "{braces}_2024.log"),
+            ("static.log", "static.log"),
+        ],
+        ids=["default", "time", "datetime", "compact_date", "second", "pid", "braces", "no_placeholders"]
+    )
+    def test_render(self, monkeypatch, schema, expected_name):
+        # Arrange
+        monkeypatch.setattr(os, "getpid", lambda: 12345)
+
+        # Act
+        result = FileSchema(schema).render(CURRENT_TIME)
+
+        # Assert
+        assert result == expected_name
+
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            "${date}_${hour}-${minute}.log",
+            "${datetime}_${pid}.log",
+            "${year}/${month}-${day}.log",
+            "log-${date}-${year}.txt",
+        ],
+        ids=["default", "datetime_pid", "slash", "repeated_field"]
+    )
+    def test_regex_matches_rendered_name(self, schema):
+        # Arrange
+        file_schema = FileSchema(schema)
+
+        # Act
+        match = file_schema.match(file_schema.render(CURRENT_TIME))
+
+        # Assert
+        assert match is not None
+        assert match.group("year") == "2024"
+
+    def test_regex_repeated_field_must_be_equal(self):
+        # Arrange
+        file_schema = FileSchema("${date}-${year}.log")
+
+        # Act & Assert
+        assert file_schema.match("2024-03-07-2024.log")
+        assert not file_schema.match("2024-03-07-2023.log")
+
+    def test_regex_is_anchored(self):
+        # Arrange
+        file_schema = FileSchema("${date}.log")
+
+        # Act & Assert
+        assert not file_schema.match("2024-03-07.log.old")
+        assert not file_schema.match("old_2024-03-07.log")
+
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            "${unknown}.log",
+            "${date}_${Hour}.log",
+            "${}.log",
+        ],
+        ids=["unknown", "wrong_case", "empty"]
+    )
+    def test_unknown_placeholder(self, schema):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            FileSchema(schema)
+
+    def test_components(self):
+        # Arrange
+        file_schema = FileSchema("logs_${year}/${month}/${day}_${hour}.log")
+
+        # Act
+        components = file_schema.components
+
+        # Assert
+        assert [bool(regex.match(part)) for regex, part in zip(components, ["logs_2024", "03", "07_09.log"])] == [True, True, True]
+        assert not components[0].match("2024")
+        assert not components[2].match("07_09.txt")
+        assert file_schema.render(CURRENT_TIME) == "logs_2024/03/07_09.log"
+        assert file_schema.timestamp("logs_2024/03/07_09.log") == time.mktime((2024, 3, 7, 9, 0, 0, 0, 0, -1))
+
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            "/${date}.log",
+            "${year}//${date}.log",
+            "${year}/../${date}.log",
+            "${year}/",
+            "",
+        ],
+        ids=["absolute", "empty_component", "parent_component", "trailing_slash", "empty"]
+    )
+    def test_invalid_components(self, schema):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            FileSchema(schema)
+
+    def test_tokens(self):
+        # Act
+        tokens = FileSchema("app_${date}.log").tokens
+
+        # Assert
+        assert tokens == [
+            (False, "app_"),
+            (True, "year"), (False, "-"), (True, "month"), (False, "-"), (True, "day"),
+            (False, ".log")
+        ]
+
+    @pytest.mark.parametrize(
+        "schema, name, expected",
+        [
+            ("${date}_${hour}-${minute}.log", "2024-03-07_09-05.log", time.mktime((2024, 3, 7, 9, 5, 0, 0, 0, -1))),
+            ("${datetime}.log", "2024-03-07_09-05-02.log", time.mktime((2024, 3, 7, 9, 5, 2, 0, 0, -1))),
+            ("${date}.log", "2024-03-07.log", time.mktime((2024, 3, 7, 0, 0, 0, 0, 0, -1))),
+            ("${date}.log", "other.log", None),
+            ("${hour}-${minute}.log", "09-05.log", None),
+        ],
+        ids=["date_hour_minute", "datetime", "date_only", "no_match", "not_dated"]
+    )
+    def test_timestamp(self, schema, name, expected):
+        # Act
+        result = FileSchema(schema).timestamp(name)
+
+        # Assert
+        assert result == expected
+
+    def test_str_repr(self):
+        # Arrange
+        file_schema = FileSchema("${date}.log")
+
+        # Act & Assert
+        assert str(file_schema) == "${date}.log"
+        assert repr(file_schema) == "FileSchema('${date}.log')"
@@ -17,12 +17,47 @@
 # ###############################################################################################
 
 
+import multiprocessing as mp
 import os
+import re
+import sys
 import time
 from unittest.mock import patch, mock_open
 import pytest
 
-from gamuLogger.targets import WriteToFile, TerminalTarget, Target
+from gamuLogger.schema import FileSchema
+from gamuLogger.custom_types import Levels
+from gamuLogger.targets import FlightRecorder, FolderLock, RetentionIndex, WriteToFile, TerminalTarget, Target, TargetRegistry
+
+
+def shared_writer(folder, schema, switch_condition, delete_condition, worker, nb_lines, delay):
+    writer = WriteToFile(folder, schema, switch_condition, delete_condition, shared=True)
+    for i in range(nb_lines):
+        writer(f"worker-{worker:02d} line-{i:04d} {'x' * 64}\n")
+        time.sleep(delay)
+
+
+def run_shared_writers(folder, schema, switch_condition, delete_condition, nb_lines, delay, nb_workers=8):
+    ctx = mp.get_context("fork")
+    processes = [
+        ctx.Process(target=shared_writer, args=(folder, schema, switch_condition, delete_condition, worker, nb_lines, delay))
+        for worker in range(nb_workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return [process.exitcode for process in processes]
+
+
+def read_log_lines(folder):
+    lines = []
+    for file in sorted(os.listdir(folder)):
+        if file == FolderLock.FILE_NAME:
+            continue
+        with open(os.path.join(folder, file), "r", encoding="utf-8") as f:
+            lines.extend(f.read().splitlines())
+    return lines
 
 class TestTerminalTarget:
     @pytest.mark.parametrize(
@@ -82,8 +117,9 @@ class TestTargetType:
         [
             (Target.Type.FILE, "file"),
             (Target.Type.TERMINAL, "terminal"),
+            (Target.Type.RECORDER, "recorder"),
         ],
-        ids=["file", "terminal"]
+        ids=["file", "terminal", "recorder"]
     )
     def test_str(self, target_type, expected_str):
 
@@ -118,6 +154,42 @@ class TestTarget:
         assert Target.exist(name or str(target))
 
 
+    def test_format(self):
+        # Arrange
+        target = Target(lambda x: None, "formatted")
+
+        # Act
+        default = target.format
+        target.format = "jsonl"
+
+        # Assert
+        assert default == "text"
+        assert target.format == "jsonl"
+        with pytest.raises(ValueError):
+            target.format = "xml"
+
+    @pytest.mark.parametrize(
+        "target, isatty, expected",
+        [
+            (TerminalTarget.STDOUT, True, True),
+            (TerminalTarget.STDOUT, False, False),
+            (lambda x: None, True, False),
+        ],
+        ids=["terminal_tty", "terminal_redirected", "function"]
+    )
+    def test_color_detection(self, monkeypatch, target, isatty, expected):
+        # Arrange
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.delenv("FORCE_COLOR", raising=False)
+        monkeypatch.delenv("TERM", raising=False)
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: isatty)
+
+        # Act
+        result = Target(target, "colored")
+
+        # Assert
+        assert result.color == expected
+
     @pytest.mark.parametrize(
         "target, name",
         [
@@ -180,6 +252,58 @@ class TestTarget:
         with open(file_path, "r", encoding="utf-8") as f:
             assert f.read() == string
 
+    def test_write_many_fallback(self):
+        # Arrange
+        out = []
+        target = Target(out.append, "test_target")
+
+        # Act
+        target.write_many(["a\n", "b\n"])
+        target.write_many([])
+
+        # Assert
+        assert out == ["a\n", "b\n"]
+
+    def test_write_many_native(self):
+        # Arrange
+        class Batched:
+            def __init__(self):
+                self.calls = []
+            def __call__(self, string):
+                self.calls.append([string])
+            def write_many(self, strings):
+                self.calls.append(list(strings))
+        batched = Batched()
+        target = Target(batched, "test_target")
+
+        # Act
+        target.write_many(["a\n", "b\n"])
+
+        # Assert
+        assert batched.calls == [["a\n", "b\n"]]
+
+    def test_write_many_terminal(self, capsys):
+        # Arrange
+        target = Target(TerminalTarget.STDOUT)
+
+        # Act
+        target.write_many(["a\n", "b\n"])
+
+        # Assert
+        assert capsys.readouterr().out == "a\nb\n"
+
+    def test_write_many_file(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / "test.log"
+        target = Target.from_file(str(file_path))
+
+        # Act
+        target.write_many(["a\n", "b\n"])
+        target("c\n")
+
+        # Assert
+        assert file_path.read_text(encoding="utf-8") == "a\nb\nc\n"
+
     @pytest.mark.parametrize(
         "target, name, expected_str",
         [
@@ -347,6 +471,42 @@ class TestTarget:
         assert target1 in target_list
         assert target2 in target_list
 
+    def test_snapshot(self):
+        # Arrange
+        target1 = Target(lambda x: None, "test_target1")
+        target2 = Target(lambda x: None, "test_target2")
+        before = Target.snapshot()
+
+        # Act
+        target1.name = "test_target1_renamed"
+        Target.unregister(target2)
+
+        # Assert
+        assert isinstance(before, tuple)
+        assert target1 in before and target2 in before # a published snapshot is never modified
+        assert Target.snapshot() is Target.snapshot() # not copied when nothing changed
+        assert target1 in Target.snapshot() and target2 not in Target.snapshot()
+        assert Target.get("test_target1_renamed") is target1
+
+    def test_routes(self):
+        # Arrange
+        debug = Target(lambda x: None, "test_debug")
+        warning = Target(lambda x: None, "test_warning")
+        Target(lambda x: None, "test_no_level")
+        debug["level"] = Levels.DEBUG
+        warning["level"] = Levels.WARNING
+
+        # Act
+        routes = [Target.routes(level) for level in Levels]
+        warning["level"] = Levels.TRACE
+        lowered = Target.routes(Levels.TRACE)
+        Target.unregister(debug)
+
+        # Assert
+        assert routes == [(), (debug,), (debug,), (debug, warning), (debug, warning), (debug, warning), (debug, warning)]
+        assert lowered == (warning,)
+        assert Target.routes(Levels.ERROR) == (warning,)
+
     def test_clear(self):
         # Arrange
         Target(lambda x: None, "test_target")
@@ -391,6 +551,142 @@ class TestTarget:
             Target.unregister(target_name)
 
 
+class TestTargetRegistry:
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        Target.clear()
+        yield
+        Target.clear()
+
+    def test_active(self):
+        # Arrange
+        registry = TargetRegistry()
+        default = Target(lambda x: None, "test_target")
+
+        # Act
+        with registry.active():
+            other = Target(lambda x: None, "test_target")
+            other["level"] = Levels.INFO
+            active_exists = Target.exist("test_target")
+
+        # Assert
+        assert other is not default and active_exists
+        assert Target.get("test_target") is default
+        assert registry.get("test_target") is other
+        assert registry.routes(Levels.INFO) == (other,) and Target.routes(Levels.INFO) == ()
+        assert TargetRegistry.owner(other) is registry and TargetRegistry.owner(default) is TargetRegistry.current()
+
+    def test_rename_and_delete(self):
+        # Arrange
+        registry = TargetRegistry()
+        with registry.active():
+            target = Target(lambda x: None, "test_target")
+
+        # Act
+        target.name = "test_renamed"
+        renamed = registry.exist("test_renamed") and not registry.exist("test_target")
+        target.delete()
+
+        # Assert
+        assert renamed
+        assert registry.list() == []
+        assert TargetRegistry.owner(target) is None
+
+    def test_republish_owner_only(self):
+        # Arrange
+        registry = TargetRegistry()
+        with registry.active():
+            other = Target(lambda x: None, "other_target")
+            other["level"] = Levels.INFO
+        default = Target(lambda x: None, "test_target")
+        routes = registry.routes(Levels.INFO)
+
+        # Act
+        with patch.object(registry, "republish", wraps=registry.republish) as republish:
+            default["level"] = Levels.DEBUG
+            del default["level"]
+            other["level"] = Levels.WARNING
+
+        # Assert
+        assert republish.call_count == 1 # only for the level of its own target
+        assert routes == (other,) and registry.routes(Levels.INFO) == ()
+        assert Target.routes(Levels.DEBUG) == ()
+
+
+class TestFlightRecorder:
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        Target.clear()
+        yield
+
+    def test_record_and_drain(self):
+        # Arrange
+        recorder = FlightRecorder(Target(lambda x: None, "downstream"), size=2)
+
+        # Act
+        for i in range(3):
+            recorder.record((Levels.DEBUG, f"message {i}", ("file", "<module>"), 0.0, "MainProcess", "MainThread"))
+        records = recorder.drain()
+
+        # Assert
+        assert [record[1] for record in records] == ["message 1", "message 2"]
+        assert len(recorder) == 0
+
+    def test_invalid_size(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            FlightRecorder(Target(lambda x: None, "downstream"), size=0)
+
+    def test_from_flight_recorder(self):
+        # Arrange
+        downstream = Target(lambda x: None, "downstream")
+
+        # Act
+        target = Target.from_flight_recorder(downstream, size=10, trigger=Levels.FATAL)
+
+        # Assert
+        assert target.type == Target.Type.RECORDER
+        assert target.name == "recorder:downstream"
+        assert target.target.trigger == Levels.FATAL
+        assert target.target.downstream is downstream
+        assert not Target.exist("downstream")
+
+
+class TestRetentionIndex:
+    @pytest.fixture
+    def index(self, tmp_path):
+        (tmp_path / "2024-01-02.log").write_text("x" * 20)
+        (tmp_path / "2024-01-01.log").write_text("x" * 10)
+        (tmp_path / "other.txt").write_text("x" * 100)
+        return RetentionIndex(str(tmp_path), FileSchema("${date}.log"))
+
+    def test_refresh(self, index):
+        # Assert
+        assert index.files() == ["2024-01-01.log", "2024-01-02.log"]
+        assert index.total_size == 30
+        assert index.size("2024-01-02.log") == 20
+        assert len(index) == 2
+
+    def test_add_grow_remove(self, index):
+        # Act
+        index.add("2024-01-03.log", time.mktime((2024, 1, 3, 0, 0, 0, 0, 0, -1)))
+        index.grow("2024-01-03.log", 5)
+        index.remove("2024-01-01.log")
+
+        # Assert
+        assert index.files() == ["2024-01-02.log", "2024-01-03.log"]
+        assert index.total_size == 25
+        assert "2024-01-01.log" not in index
+
+    def test_add_keeps_order(self, index):
+        # Act
+        index.add("2023-12-31.log", time.mktime((2023, 12, 31, 0, 0, 0, 0, 0, -1)), 7)
+
+        # Assert
+        assert index.files() == ["2023-12-31.log", "2024-01-01.log", "2024-01-02.log"]
+        assert index.total_size == 37
+
+
 class TestWriteToFile:
     @pytest.fixture
     def setup_folder(self, tmp_path):
@@ -444,12 +740,12 @@ class TestWriteToFile:
         )
         assert writer.current_file == expected_file
 
-    @patch("os.listdir")
-    @patch("os.path.getctime")
-    def test_get_log_files_by_age(self, mock_getctime, mock_listdir, setup_folder):
+    def test_get_log_files_by_age(self, setup_folder):
         folder, schema, switch_condition, delete_condition = setup_folder
-        mock_listdir.return_value = ["12-00-00.log", "12-01-00.log", "app.log"]
-        mock_getctime.side_effect = [100, 200]
+        os.makedirs(folder)
+        for file in ["12-01-00.log", "app.log", "12-00-00.log"]:
+            (folder / file).write_text("")
+            time.sleep(0.01) # make sure the creation times are different
 
         # Arrange
         writer = WriteToFile(str(folder), schema, switch_condition, delete_condition)
@@ -458,7 +754,27 @@ class TestWriteToFile:
         result = writer._WriteToFile__get_log_files_by_age()
 
         # Assert
-        assert result == ["12-00-00.log", "12-01-00.log"]
+        assert result == ["12-01-00.log", "12-00-00.log"]
+
+    @patch("os.path.getctime")
+    def test_get_log_files_by_age_dated_schema(self, mock_getctime, tmp_path):
+        for file in ["2024-01-02_00-00.log", "2023-12-31_23-59.log", "2024-01-01_12-30.log", "app.log"]:
+            (tmp_path / file).write_text("")
+
+        # Arrange
+        writer = WriteToFile(str(tmp_path), "${date}_${hour}-${minute}.log", ("age > 1 hour",), ("nb_files >= 5",))
+
+        # Act
+        result = writer._WriteToFile__get_log_files_by_age()
+
+        # Assert
+        assert result == ["2023-12-31_23-59.log", "2024-01-01_12-30.log", "2024-01-02_00-00.log"]
+        mock_getctime.assert_not_called()
+
+    def test_invalid_schema(self, tmp_path):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            WriteToFile(str(tmp_path), "${unknown}.log", ("age > 1 hour",), ("nb_files >= 5",))
 
     @patch("os.path.getctime")
     @patch("os.path.getsize")
@@ -488,7 +804,7 @@ class TestWriteToFile:
         folder, schema, _, _ = setup_folder
         mock_exists.return_value = file_exists
         mock_getsize.return_value = file_size
-        mock_getctime.return_value = file_age
+        mock_getctime.return_value = time.time() - file_age
 
         # Arrange
         writer = WriteToFile(str(folder), schema, switch_condition, delete_condition)
@@ -528,8 +844,6 @@ class TestWriteToFile:
             
 
     @patch("os.remove")
-    @patch("os.listdir")
-    @patch("os.path.getctime")
     @patch("time.time")
     @pytest.mark.parametrize(
         "files, file_ages, delete_condition, expected_files_to_delete",
@@ -552,14 +866,14 @@ class TestWriteToFile:
             "age_condition_no_files_to_delete",
         ],
     )
-    def test_delete_excess_files(self, mock_time, mock_getctime, mock_listdir, mock_remove, files, file_ages, delete_condition, expected_files_to_delete, setup_folder):
+    def test_delete_excess_files(self, mock_time, mock_remove, files, file_ages, delete_condition, expected_files_to_delete, setup_folder):
         folder, schema, switch_condition, _ = setup_folder
-        mock_listdir.return_value = files
-        mock_getctime.side_effect = [5000 - age for age in file_ages for _ in range(2)]
         mock_time.return_value = 5000  # Mocked current time
 
         # Arrange
         writer = WriteToFile(str(folder), schema, switch_condition, delete_condition)
+        for file, age in zip(files, file_ages): # the files and creation times found when the folder is scanned
+            writer.index.add(file, 5000 - age)
 
         # Act
         writer._WriteToFile__delete_excess_files()
@@ -570,6 +884,75 @@ class TestWriteToFile:
         if not expected_files_to_delete:
             mock_remove.assert_not_called()
 
+    @patch("time.time")
+    @pytest.mark.parametrize(
+        "files, delete_condition, expected_files_to_delete",
+        [
+            ({"11-00-00": 600, "12-54-47": 600, "13-52-28": 600}, ("total_size > 1 KB",), ["11-00-00", "12-54-47"]),  # two files should be deleted
+            ({"12-54-47": 400, "13-52-28": 400}, ("total_size > 1 KB",), []),  # No files should be deleted
+            ({"11-00-00": 2048, "12-54-47": 2048}, ("total_size > 1 KB", "nb_files > 1"), ["11-00-00", "12-54-47"]),  # conditions combined
+        ],
+        ids=[
+            "total_size_condition_files",
+            "total_size_condition_no_files",
+            "total_size_and_nb_files_conditions",
+        ],
+    )
+    def test_delete_excess_files_total_size(self, mock_time, files, delete_condition, expected_files_to_delete, tmp_path):
+        mock_time.return_value = time.mktime((2024, 1, 1, 14, 0, 0, 0, 0, -1))  # Mocked current time
+        for name, size in files.items():
+            (tmp_path / f"2024-01-01_{name}.log").write_text("x" * size)
+
+        # Arrange
+        writer = WriteToFile(str(tmp_path), "${date}_${time}.log", ("age > 1 hour",), delete_condition)
+
+        # Act
+        writer._WriteToFile__delete_excess_files()
+
+        # Assert
+        remaining = {name for name in files if name not in expected_files_to_delete}
+        assert set(os.listdir(tmp_path)) == {f"2024-01-01_{name}.log" for name in remaining}
+        assert writer.index.files() == [f"2024-01-01_{name}.log" for name in files if name in remaining]
+        assert writer.index.total_size == sum(files[name] for name in remaining)
+
+    @patch("gamuLogger.targets.time.localtime")
+    def test_total_size_never_deletes_current_file(self, mock_localtime, tmp_path):
+        mock_localtime.return_value = time.struct_time((2024, 1, 1, 12, 0, 0, 0, 0, -1))
+        (tmp_path / "2024-01-01_11-00-00.log").write_text("x" * 600)
+
+        # Arrange
+        writer = WriteToFile(str(tmp_path), "${date}_${time}.log", ("size > 1 MB",), ("total_size > 1 KB",))
+
+        # Act
+        writer("y" * 2000)
+
+        # Assert
+        assert os.listdir(tmp_path) == ["2024-01-01_12-00-00.log"]
+        assert writer.index.total_size == 2000
+
+    def test_write_many(self, tmp_path):
+        # Arrange
+        writer = WriteToFile(str(tmp_path), "${date}.log", ("size > 1 MB",), ("total_size > 1 GB",))
+
+        # Act
+        writer.write_many(["a\n", "b\n"])
+
+        # Assert
+        with open(writer.current_file, "r", encoding="utf-8") as f:
+            assert f.read() == "a\nb\n"
+        assert writer.index.total_size == 4
+
+    def test_call_accounts_written_bytes(self, tmp_path):
+        # Arrange
+        writer = WriteToFile(str(tmp_path), "${date}.log", ("size > 1 MB",), ("total_size > 1 GB",))
+
+        # Act
+        writer("ascii line\n")
+        writer("ligne accentuée\n")
+
+        # Assert
+        assert writer.index.total_size == os.path.getsize(writer.current_file)
+
 
     @patch("builtins.open", new_callable=mock_open)
     @patch("gamuLogger.targets.WriteToFile._WriteToFile__is_outdated", return_value=True)
@@ -590,6 +973,115 @@ class TestWriteToFile:
         mock_delete_excess_files.assert_called_once()
 
 
+class TestPartitionedWriteToFile:
+    SCHEMA = "${year}/${month}/${day}/${hour}.log"
+
+    @patch("gamuLogger.targets.time.localtime")
+    def test_directories_created_lazily(self, mock_localtime, tmp_path):
+        mock_localtime.return_value = time.struct_time((2024, 3, 7, 9, 0, 0, 0, 0, -1))
+
+        # Arrange
+        writer = WriteToFile(str(tmp_path), self.SCHEMA, ("age > 1 hour",), ("nb_files > 5",))
+        assert not os.listdir(tmp_path)
+
+        # Act
+        writer("Test log entry\n")
+
+        # Assert
+        assert writer.current_name == "2024/03/07/09.log"
+        with open(tmp_path / "2024" / "03" / "07" / "09.log", "r", encoding="utf-8") as f:
+            assert f.read() == "Test log entry\n"
+
+    def test_index_walks_partitions(self, tmp_path):
+        for path in ["2024/03/07/09.log", "2024/03/06/23.log", "2023/12/31/10.log", "2024/03/07/notes.txt", "other/03/07/09.log", "2024/03/07.log"]:
+            os.makedirs(os.path.dirname(tmp_path / path), exist_ok=True)
+            (tmp_path / path).write_text("x")
+
+        # Act
+        index = RetentionIndex(str(tmp_path), FileSchema(self.SCHEMA))
+
+        # Assert
+        assert index.files() == ["2023/12/31/10.log", "2024/03/06/23.log", "2024/03/07/09.log"]
+
+    @patch("time.time")
+    def test_delete_prunes_empty_directories(self, mock_time, tmp_path):
+        mock_time.return_value = time.mktime((2024, 3, 8, 0, 0, 0, 0, 0, -1))
+        for path in ["2023/12/31/10.log", "2024/03/06/22.log", "2024/03/06/23.log", "2024/03/07/09.log"]:
+            os.makedirs(os.path.dirname(tmp_path / path), exist_ok=True)
+            (tmp_path / path).write_text("x")
+
+        # Arrange
+        writer = WriteToFile(str(tmp_path), self.SCHEMA, ("age > 1 hour",), ("age > 1 day",))
+
+        # Act
+        writer._WriteToFile__delete_excess_files()
+
+        # Assert
+        assert not os.path.exists(tmp_path / "2023")
+        assert not os.path.exists(tmp_path / "2024" / "03" / "06")
+        assert writer.index.files() == ["2024/03/07/09.log"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl is not available on Windows")
+class TestSharedWriteToFile:
+    def test_lock_file_records_current_file(self, tmp_path):
+        # Arrange
+        writer = WriteToFile(str(tmp_path), "${date}.log", ("age > 1 hour",), ("nb_files > 5",), shared=True)
+
+        # Act
+        writer("Test log entry\n")
+
+        # Assert
+        assert writer.lock.read() == os.path.basename(writer.current_file)
+        assert sorted(os.listdir(tmp_path)) == sorted([FolderLock.FILE_NAME, os.path.basename(writer.current_file)])
+
+    def test_reuses_file_switched_by_other_process(self, tmp_path):
+        # Arrange
+        writer = WriteToFile(str(tmp_path), "${datetime}.log", ("size > 1 KB",), ("nb_files > 5",), shared=True)
+        other = WriteToFile(str(tmp_path), "${datetime}.log", ("size > 1 KB",), ("nb_files > 5",), shared=True)
+        writer("x" * 2048 + "\n")
+        other.lock.acquire(exclusive=True)
+        other.lock.write("2000-01-01_00-00-00.log") # simulate a switch made by another process
+        other.lock.release()
+
+        # Act
+        writer("Test log entry\n")
+
+        # Assert
+        assert writer.current_file == os.path.join(str(tmp_path), "2000-01-01_00-00-00.log")
+        with open(writer.current_file, "r", encoding="utf-8") as f:
+            assert f.read() == "Test log entry\n"
+
+    def test_stress_no_lost_lines(self, tmp_path):
+        # Act
+        # the schema renders a new name each second: the writes span about 3 seconds, so the file is really switched,
+        # several times, while the other processes write
+        exit_codes = run_shared_writers(str(tmp_path), "${datetime}.log", ("size > 4 KB",), ("nb_files > 1000",), nb_lines=300, delay=0.01)
+
+        # Assert
+        assert exit_codes == [0] * 8
+        log_files = [file for file in os.listdir(tmp_path) if file != FolderLock.FILE_NAME]
+        assert len(log_files) > 1
+        lines = read_log_lines(tmp_path) # from all the files, oldest first
+        assert len(lines) == 8 * 300
+        assert all(re.fullmatch(r"worker-\d{2} line-\d{4} x{64}", line) for line in lines)
+        for worker in range(8):
+            worker_lines = [line for line in lines if line.startswith(f"worker-{worker:02d} ")]
+            assert worker_lines == [f"worker-{worker:02d} line-{i:04d} {'x' * 64}" for i in range(300)]
+
+    def test_stress_with_deletion(self, tmp_path):
+        # Act
+        exit_codes = run_shared_writers(str(tmp_path), "${datetime}.log", ("age > 1 second",), ("nb_files > 2",), nb_lines=150, delay=0.02)
+
+        # Assert
+        assert exit_codes == [0] * 8
+        log_files = [file for file in os.listdir(tmp_path) if file != FolderLock.FILE_NAME]
+        assert 1 <= len(log_files) <= 3
+        lines = read_log_lines(tmp_path)
+        assert lines
+        assert all(re.fullmatch(r"worker-\d{2} line-\d{4} x{64}", line) for line in lines)
+
+
 class TestFromFileSchema:
     @pytest.fixture
     def setup_folder(self, tmp_path):
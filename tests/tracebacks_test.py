@@ -0,0 +1,177 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# ###############################################################################################
+#                                   PYLINT
+# pylint: disable=line-too-long
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=invalid-name
+# pylint: disable=too-few-public-methods
+# pylint: disable=no-name-in-module
+# pylint: disable=import-error
+# pylint: disable=protected-access
+# ###############################################################################################
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from gamuLogger.tracebacks import (LoggedException, TracebackCache,
+                                   fingerprint, get_exception)
+
+
+def fail(value):
+    raise ValueError(f"invalid amount {value}")
+
+
+def fail_elsewhere(value):
+    raise ValueError(f"invalid amount {value}")
+
+
+def catch(function, *args):
+    try:
+        function(*args)
+    except Exception as e: # pylint: disable=broad-except
+        return e
+    raise AssertionError("no exception")
+
+
+def chained():
+    try:
+        fail(1)
+    except ValueError as e:
+        raise RuntimeError("wrapped") from e
+
+
+class TestGetException:
+    def test_current_exception(self):
+        # Arrange
+        error = catch(fail, 1)
+
+        # Act & Assert
+        try:
+            raise error
+        except ValueError:
+            assert get_exception(True) is error
+            assert get_exception(sys.exc_info()) is error
+
+    @pytest.mark.parametrize(
+        "exc_info",
+        [None, False, (None, None, None)],
+        ids=["none", "false", "empty_tuple"]
+    )
+    def test_no_exception(self, exc_info):
+        assert get_exception(exc_info) is None
+
+    def test_exception_instance(self):
+        error = ValueError("x")
+        assert get_exception(error) is error
+
+
+class TestFingerprint:
+    def test_same_location_different_message(self):
+        assert fingerprint(catch(fail, 1)) == fingerprint(catch(fail, 2))
+
+    def test_different_location(self):
+        assert fingerprint(catch(fail, 1)) != fingerprint(catch(fail_elsewhere, 1))
+
+    def test_different_type(self):
+        assert fingerprint(ValueError("x")) != fingerprint(TypeError("x"))
+
+    def test_chained(self):
+        assert fingerprint(catch(chained)) != fingerprint(RuntimeError("wrapped"))
+
+    def test_format(self):
+        assert len(fingerprint(ValueError())) == 12
+
+
+class TestTracebackCache:
+    def test_repetitions(self):
+        # Arrange
+        cache = TracebackCache()
+
+        # Act
+        reports = [cache.report(catch(fail, i), 60.0) for i in range(3)]
+
+        # Assert
+        assert "Traceback (most recent call last)" in reports[0]["traceback"]
+        assert "ValueError: invalid amount 0" in reports[0]["traceback"]
+        assert "repeated" not in reports[0]
+        assert [report.get("repeated") for report in reports[1:]] == [1, 2]
+        assert all("traceback" not in report for report in reports[1:])
+        assert {report["fingerprint"] for report in reports} == {reports[0]["fingerprint"]}
+        assert reports[2]["message"] == "invalid amount 2"
+        assert reports[2]["type"] == "ValueError"
+
+    def test_window(self):
+        # Arrange
+        cache = TracebackCache()
+        error = catch(fail, 1)
+
+        # Act
+        with patch("gamuLogger.tracebacks.time.monotonic", side_effect=[100.0, 110.0, 161.0, 162.0]):
+            reports = [cache.report(error, 60.0) for _ in range(4)]
+
+        # Assert
+        assert ["traceback" in report for report in reports] == [True, False, True, False]
+        assert reports[3]["repeated"] == 1
+
+    def test_zero_window(self):
+        # Arrange
+        cache = TracebackCache()
+        error = catch(fail, 1)
+
+        # Act & Assert
+        assert all("traceback" in cache.report(error, 0) for _ in range(3))
+
+    def test_bounded(self):
+        # Arrange
+        cache = TracebackCache(max_size=1)
+
+        # Act
+        cache.report(catch(fail, 1), 60.0)
+        cache.report(catch(fail_elsewhere, 1), 60.0) # forgets the first one
+
+        # Assert
+        assert "traceback" in cache.report(catch(fail, 1), 60.0)
+
+    def test_clear(self):
+        # Arrange
+        cache = TracebackCache()
+        cache.report(catch(fail, 1), 60.0)
+
+        # Act
+        cache.clear()
+
+        # Assert
+        assert "traceback" in cache.report(catch(fail, 1), 60.0)
+
+
+class TestLoggedException:
+    def test_reported_once(self):
+        # Arrange
+        cache = TracebackCache()
+        logged = LoggedException(catch(fail, 1), cache, 60.0)
+
+        # Act
+        first = logged.text()
+        second = logged.text()
+
+        # Assert
+        assert first == second
+        assert first.startswith("Traceback (most recent call last)")
+        assert first.endswith(f"ValueError: invalid amount 1\n[traceback {logged.report()['fingerprint']}]")
+
+    def test_repetition_text(self):
+        # Arrange
+        cache = TracebackCache()
+        LoggedException(catch(fail, 1), cache, 60.0).text()
+
+        # Act
+        logged = LoggedException(catch(fail, 2), cache, 60.0)
+
+        # Assert
+        assert logged.text() == f"ValueError: invalid amount 2 [traceback {logged.report()['fingerprint']}, repeated 1 times]"
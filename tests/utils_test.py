@@ -24,9 +24,10 @@ from enum import Enum
 import pytest
 
 from gamuLogger.utils import (COLORS, CustomEncoder, colorize,
+                              field_key_fragment, format_fields,
                               get_executable_formatted, get_time,
                               replace_newline, schema2regex, split_long_string,
-                              string2bytes, string2seconds)
+                              string2bytes, string2seconds, supports_color)
 
 FILEPATH = os.path.abspath(__file__)
 
@@ -170,6 +171,42 @@ class TestCustomEncoder:
         assert actual_output == expected_output
 
 
+class TestFormatFields:
+    @pytest.mark.parametrize(
+        "fields, expected_output",
+        [
+            ({"user": "alice"}, " user=alice"),
+            ({"order_id": 42, "amount": 9.5}, " order_id=42 amount=9.5"),
+            ({"note": "two words"}, ' note="two words"'),
+            ({"note": 'a "b" c=d'}, ' note="a \\"b\\" c=d"'),
+            ({"note": ""}, ' note=""'),
+            ({"ok": True, "missing": None}, " ok=true missing=null"),
+            ({"tags": ["a", "b"], "color": MockEnum.VALUE1}, ' tags=["a","b"] color=MockEnum.VALUE1'),
+            ({}, ""),
+        ],
+        ids=["plain_string", "numbers", "quoted_string", "escaped_string", "empty_string", "constants", "json_values", "no_fields"]
+    )
+    def test_format_fields(self, fields, expected_output):
+        assert format_fields(fields) == expected_output
+
+    def test_names_are_rendered_once(self):
+        # Arrange
+        cache = {}
+        calls = []
+        def render(key):
+            calls.append(key)
+            return f"<{key}>"
+
+        # Act
+        first = field_key_fragment(cache, "".join(["order", "_id"]), render)
+        second = field_key_fragment(cache, "order_id", render)
+
+        # Assert
+        assert first == second == "<order_id>"
+        assert calls == ["order_id"]
+        assert sys.intern("order_id") in cache
+
+
 class TestColorize:
     @pytest.mark.parametrize(
         "color, string, expected_output",
@@ -210,6 +247,47 @@ class TestColorize:
         assert actual_output == expected_output
 
 
+class FakeStream:
+    def __init__(self, tty):
+        self.tty = tty
+
+    def isatty(self):
+        return self.tty
+
+
+class TestSupportsColor:
+    @pytest.mark.parametrize(
+        "environ, tty, expected",
+        [
+            ({}, True, True),
+            ({}, False, False),
+            ({"NO_COLOR": "1"}, True, False),
+            ({"NO_COLOR": ""}, True, True),
+            ({"FORCE_COLOR": "1"}, False, True),
+            ({"FORCE_COLOR": "1", "NO_COLOR": "1"}, True, False),
+            ({"TERM": "dumb"}, True, False),
+        ],
+        ids=["tty", "not_tty", "no_color", "empty_no_color", "force_color", "no_color_wins", "dumb_terminal"]
+    )
+    def test_supports_color(self, monkeypatch, environ, tty, expected):
+        # Arrange
+        for name in ("NO_COLOR", "FORCE_COLOR", "TERM"):
+            monkeypatch.delenv(name, raising=False)
+        for name, value in environ.items():
+            monkeypatch.setenv(name, value)
+
+        # Act & Assert
+        assert supports_color(FakeStream(tty)) == expected
+
+    def test_stream_without_isatty(self, monkeypatch):
+        # Arrange
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.delenv("FORCE_COLOR", raising=False)
+
+        # Act & Assert
+        assert not supports_color(object())
+
+
 class TestGetExecutableFormatted:
     @pytest.mark.parametrize(
         "sys_executable, sys_argv, expected_output",
@@ -386,8 +464,8 @@ class TestSchema2Regex:
         "schema, test_string, expected_match",
         [
             ("${date}", "2024-01-01", True),  # Date
-            ("${time}", "10:30:00", True),  # Time
-            ("${datetime}", "2024-01-01_10:30:00", True),  # Datetime
+            ("${time}", "10-30-00", True),  # Time
+            ("${datetime}", "2024-01-01_10-30-00", True),  # Datetime
             ("${year}", "2024", True),  # Year
             ("${month}", "01", True),  # Month
             ("${day}", "01", True),  # Day
@@ -395,17 +473,18 @@ class TestSchema2Regex:
             ("${minute}", "30", True),  # Minute
             ("${second}", "00", True),  # Second
             ("${pid}", "12345", True), # PID (mocked)
-            ("test_${date}_${time}", "test_2024-01-01_10:30:00", True), # Combined
+            ("test_${date}_${time}", "test_2024-01-01_10-30-00", True), # Combined
             ("test", "test", True), # No placeholders
             ("${date}", "invalid_date", False),  # Invalid date
             ("${time}", "invalid_time", False),  # Invalid time
             ("${datetime}", "invalid_datetime", False),  # Invalid datetime
-            ("test_${date}_${time}", "test_invalid_date_10:30:00", False), # Combined with invalid date
+            ("test_${date}_${time}", "test_invalid_date_10-30-00", False), # Combined with invalid date
             ("test_${date}_${time}", "test_2024-01-01_invalid_time", False), # Combined with invalid time
-            ("${unknown}", "anything", False), # Unknown placeholder, treated literally
+            ("${time}", "10:30:00", False),  # Time with colons
+            ("${date}.log", "2024-01-01xlog", False),  # Literal dot is escaped
         ],
 
-        ids=["date", "time", "datetime", "year", "month", "day", "hour", "minute", "second", "pid", "combined", "no_placeholders", "invalid_date", "invalid_time", "invalid_datetime", "combined_invalid_date", "combined_invalid_time", "unknown_placeholder"]
+        ids=["date", "time", "datetime", "year", "month", "day", "hour", "minute", "second", "pid", "combined", "no_placeholders", "invalid_date", "invalid_time", "invalid_datetime", "combined_invalid_date", "combined_invalid_time", "time_with_colons", "escaped_literal"]
     )
     def test_schema2regex(self, monkeypatch, schema, test_string, expected_match):
         # Arrange
@@ -417,3 +496,8 @@ class TestSchema2Regex:
 
         # Assert
         assert bool(match) == expected_match
+
+    def test_schema2regex_unknown_placeholder(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            schema2regex("${unknown}.log")